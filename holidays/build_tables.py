@@ -0,0 +1,238 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""
+Build the precomputed holiday tables (see :mod:`holidays.tables`) from the
+countries and financial markets rules::
+
+    python -m holidays.build_tables [--first-year 1950] [--last-year 2100]
+        [--directory DIR] [CODE ...]
+
+The tables must be built again whenever the rules or the package version
+change, so this is meant to run as a release build step.
+"""
+
+__all__ = ("build_table", "write_tables")
+
+import argparse
+import json
+import sys
+import warnings
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from holidays import __version__, countries, financial, tables
+from holidays.holiday_base import HolidayBase
+from holidays.tables import _LENGTH, _MAGIC, _reference_class
+from holidays.utils import list_supported_countries, list_supported_financial
+
+_Holidays = Tuple[Tuple[date, str], ...]
+
+
+def _variants(cls: type) -> List[Tuple[Optional[str], bool]]:
+    """Return the subdivision and observed setting combinations of a class,
+    using the subdivision the objects actually end up with."""
+    variants = []
+    subdivisions = cls.subdivisions  # type: ignore[attr-defined]
+    for subdiv in [None] + list(subdivisions):
+        for observed in (True, False):
+            variant = (cls(subdiv=subdiv, observed=observed).subdiv, observed)
+            if variant not in variants:
+                variants.append(variant)
+    return variants
+
+
+def _year_holidays(obj: HolidayBase, year: int) -> Optional[_Holidays]:
+    """Calculate the holidays of a year, or return None if that fails or
+    warns (e.g. the year is out of a supported range). Deprecation warnings
+    of the dependencies are ignored."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            holidays = obj._year_holidays(year, obj.observed)
+        except (
+            ArithmeticError,
+            LookupError,
+            NotImplementedError,
+            ValueError,
+        ):
+            return None
+    if any(not issubclass(w.category, DeprecationWarning) for w in caught):
+        return None
+    return holidays
+
+
+def build_table(
+    cls: type, first_year: int, last_year: int
+) -> Tuple[bytes, int, int]:
+    """Calculate the holidays of a class for a range of years and return
+    them as a table (see :mod:`holidays.tables` for the layout).
+
+    Only the longest run of years all the variants can be calculated for
+    without errors or warnings is kept: the other years are left to be
+    calculated at runtime.
+
+    :param cls:
+        A :class:`HolidayBase` subclass of :mod:`holidays.countries` or
+        :mod:`holidays.financial`.
+
+    :param first_year:
+        The first year to calculate.
+
+    :param last_year:
+        The last year to calculate.
+
+    :return:
+        The table and the first and last years it actually covers.
+    """
+    reference = _reference_class(cls)
+    if reference is None:
+        raise ValueError(f"Cannot build a holidays table for {cls!r}.")
+
+    years = range(first_year, last_year + 1)
+    variants = []
+    valid = [True] * len(years)
+    for subdiv, observed in _variants(cls):
+        obj = cls(subdiv=subdiv, observed=observed)
+        variant = [_year_holidays(obj, year) for year in years]
+        valid = [v and h is not None for v, h in zip(valid, variant)]
+        variants.append((obj.subdiv, observed, variant))
+
+    # The longest run of valid years.
+    start = end = run_start = 0
+    for idx, is_valid in enumerate(valid + [False]):
+        if not is_valid:
+            if idx - run_start > end - start:
+                start, end = run_start, idx
+            run_start = idx + 1
+    if start == end:
+        raise ValueError(f"No year can be tabulated for {cls!r}.")
+
+    names: Dict[str, int] = {}
+    blocks: Dict[_Holidays, Tuple[int, int]] = {}
+    index = array("I")
+    ordinals = array("i")
+    name_ids = array("H")
+    for _, _, variant in variants:
+        for holidays in variant[start:end]:
+            holidays = holidays or ()
+            block = blocks.get(holidays)
+            if block is None:
+                block = blocks[holidays] = (
+                    len(ordinals),
+                    len(ordinals) + len(holidays),
+                )
+                for dt, name in holidays:
+                    ordinals.append(dt.toordinal())
+                    name_ids.append(names.setdefault(name, len(names)))
+            index.extend(block)
+    if len(names) > 0xFFFF:
+        raise ValueError(f"Too many holiday names for {cls!r}.")
+
+    header = json.dumps(
+        {
+            "code": reference[1],
+            "version": __version__,
+            "sources": tables._sources_hash(),
+            "byteorder": sys.byteorder,
+            "first_year": years[start],
+            "last_year": years[end - 1],
+            "names": list(names),
+            "variants": [
+                [subdiv, observed] for subdiv, observed, _ in variants
+            ],
+            "entries": len(ordinals),
+        },
+        ensure_ascii=False,
+    ).encode()
+    header += b" " * (-len(header) % 4)
+    data = _MAGIC + _LENGTH.pack(len(header)) + header
+    data += index.tobytes() + ordinals.tobytes() + name_ids.tobytes()
+    return bytes(data), years[start], years[end - 1]
+
+
+def write_tables(
+    codes: Optional[Iterable[str]] = None,
+    first_year: int = 1950,
+    last_year: int = 2100,
+    directory: Optional[Path] = None,
+) -> List[Tuple[Path, int, int]]:
+    """Build and write the tables of some countries and financial markets.
+
+    :param codes:
+        The country codes (e.g. ``US``) and financial market codes (e.g.
+        ``NYSE``) to build tables for. Defaults to all of them, except the
+        ones whose rules depend on other settings than the subdivision and
+        the observed setting.
+
+    :param first_year:
+        The first year to calculate.
+
+    :param last_year:
+        The last year to calculate.
+
+    :param directory:
+        The directory to write the tables to, defaults to the one of the
+        package.
+
+    :return:
+        The path of each table written and the first and last years it
+        covers.
+    """
+    directory = directory or tables.TABLES_DIR
+    markets = list_supported_financial(unique=True)
+    if codes is None:
+        codes = [
+            code
+            for code in sorted(list_supported_countries(unique=True))
+            + sorted(markets)
+            if _reference_class(
+                getattr(financial if code in markets else countries, code)
+            )
+        ]
+
+    written = []
+    use_tables, year_cache = HolidayBase.use_tables, HolidayBase.year_cache
+    HolidayBase.use_tables, HolidayBase.year_cache = False, None
+    try:
+        for code in codes:
+            category = "financial" if code in markets else "countries"
+            cls = getattr(financial if code in markets else countries, code)
+            table, first, last = build_table(cls, first_year, last_year)
+            path = directory / category / f"{code}.tbl"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(table)
+            written.append((path, first, last))
+    finally:
+        HolidayBase.use_tables, HolidayBase.year_cache = use_tables, year_cache
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m holidays.build_tables",
+        description="Build the precomputed holiday tables.",
+    )
+    parser.add_argument("codes", nargs="*", metavar="CODE")
+    parser.add_argument("--first-year", type=int, default=1950)
+    parser.add_argument("--last-year", type=int, default=2100)
+    parser.add_argument("--directory", type=Path)
+    args = parser.parse_args(argv)
+    for path, first, last in write_tables(
+        args.codes or None, args.first_year, args.last_year, args.directory
+    ):
+        sys.stdout.write(f"{path}: {first}-{last}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+from datetime import date, datetime, timezone
+
+from pymeeus.Epoch import Epoch
+from pymeeus.Sun import Sun
+
+# The UTC instants of the March equinox, June solstice, September equinox
+# and December solstice of each year from 1900 to 2200, in seconds since
+# 1970-01-01 00:00. They are the instants calculated by package `PyMeeus
+# <https://pypi.org/project/PyMeeus/>`__ with the seconds truncated, as
+# returned by :func:`_pymeeus_equinox_solstice`.
+_EQUINOX_SOLSTICE_TIMES = (
+    (-2202157255, -2194136409, -2186048385, -2178292702),  # 1900
+    (-2170600581, -2162579527, -2154491459, -2146735398),
+    (-2139043400, -2131022686, -2122934674, -2115177862),
+    (-2107485907, -2099465697, -2091377771, -2083621167),
+    (-2075929279, -2067908910, -2059820379, -2052063954),
+    (-2044371739, -2036351308, -2028263393, -2020506968),
+    (-2012814422, -2004794281, -1996706690, -1988949991),
+    (-1981258009, -1973237808, -1965149454, -1957392495),
+    (-1949700753, -1941680444, -1933592491, -1925835981),
+    (-1918144009, -1910123653, -1902035715, -1894279197),
+    (-1886587012, -1878567062, -1870478940, -1862722080),  # 1910
+    (-1855029922, -1847010251, -1838922132, -1831165592),
+    (-1823473822, -1815453769, -1807365102, -1799608501),
+    (-1791916904, -1783896612, -1775808417, -1768051488),
+    (-1760359738, -1752339878, -1744251953, -1736494635),
+    (-1728803303, -1720783817, -1712694952, -1704937433),
+    (-1697245966, -1689226514, -1681137893, -1673380865),
+    (-1665688944, -1657669519, -1649581169, -1641824037),
+    (-1634132039, -1626112800, -1618024438, -1610266687),
+    (-1602574829, -1594555562, -1586467455, -1578709952),
+    (-1571018419, -1562998787, -1554910289, -1547152957),  # 1920
+    (-1539461314, -1531441436, -1523353191, -1515595930),
+    (-1507903860, -1499884374, -1491796202, -1484038960),
+    (-1476347450, -1468328210, -1460238961, -1452481579),
+    (-1444790368, -1436770813, -1428681679, -1420924447),
+    (-1413233245, -1405213777, -1397124972, -1389367377),
+    (-1381676305, -1373657373, -1365568378, -1357809974),
+    (-1350118829, -1342100244, -1334011359, -1326253266),
+    (-1318562120, -1310543589, -1302454445, -1294696555),
+    (-1287005085, -1278986338, -1270897637, -1263139610),
+    (-1255447789, -1247429205, -1239341019, -1231582802),  # 1930
+    (-1223891598, -1215873091, -1207784177, -1200025801),
+    (-1192334760, -1184315817, -1176227022, -1168469120),
+    (-1160777789, -1152758866, -1144670307, -1136912525),
+    (-1129221101, -1121202700, -1113113664, -1105355410),
+    (-1097664110, -1089645700, -1081556486, -1073798548),
+    (-1066107705, -1058089078, -1049999618, -1042241574),
+    (-1034550871, -1026532055, -1018442799, -1010684275),
+    (-1002993390, -994974960, -986886005, -979127171),
+    (-971436668, -963418809, -955329008, -947570016),
+    (-939879351, -931861389, -923771640, -916013091),  # 1940
+    (-908321952, -900303976, -892214809, -884456125),
+    (-876764936, -868747398, -860658186, -852898800),
+    (-845207817, -837190034, -829100870, -821341827),
+    (-813651057, -805633036, -797543875, -789785084),
+    (-782094140, -774076049, -765986986, -758228158),
+    (-750536811, -742518912, -734429934, -726671172),
+    (-718980411, -710962843, -702873054, -695114205),
+    (-687423764, -679405736, -671315869, -663557175),
+    (-655866689, -647848605, -639759221, -632000197),
+    (-624309861, -616292608, -608202956, -600443170),  # 1950
+    (-592752827, -584735680, -576645759, -568886366),
+    (-561195944, -553178816, -545088949, -537329780),
+    (-529639139, -521621972, -513532415, -505772881),
+    (-498081964, -490064726, -481975453, -474215708),
+    (-466525463, -458508486, -450418715, -442658914),
+    (-434968750, -426951343, -418861465, -411101999),
+    (-403411379, -395393936, -387304403, -379545050),
+    (-371854419, -363837753, -355747837, -347987985),
+    (-340297495, -332280580, -324190260, -316430707),
+    (-308740607, -300723429, -292633235, -284873611),  # 1960
+    (-277183639, -269166560, -261076619, -253316397),
+    (-245626193, -237609318, -229519453, -221759049),
+    (-214069184, -206052923, -197962555, -190202251),
+    (-182512173, -174495755, -166405365, -158645392),
+    (-150954878, -142938222, -134848404, -127088338),
+    (-119397988, -111381960, -103292174, -95531472),
+    (-87841353, -79824991, -71734879, -63974583),
+    (-56284640, -48267964, -40177990, -32417975),
+    (-24727874, -16711457, -8621546, -861337),
+    (6829020, 14845400, 22935579, 30695782),  # 1970
+    (38385530, 46401618, 54492336, 62252677),
+    (69942128, 77958414, 86049209, 93809618),
+    (101499191, 109515680, 117606112, 125366907),
+    (133056443, 141071902, 149162351, 156923803),
+    (164613447, 172628833, 180719759, 188480781),
+    (196170623, 204186300, 212276939, 220037756),
+    (227727785, 235743274, 243833404, 251594638),
+    (259284863, 267300623, 275390774, 283152108),
+    (290841766, 298857421, 306947834, 314709036),
+    (322398632, 330414472, 338504973, 346265817),  # 1980
+    (353955823, 361971933, 370062364, 377823085),
+    (385513003, 393528232, 401618824, 409379942),
+    (417069578, 425084974, 433176151, 440937050),
+    (448626314, 456642188, 464733228, 472494223),
+    (480183279, 488198703, 496289302, 504050915),
+    (511740217, 519755454, 527846388, 535608184),
+    (543297174, 551311901, 559403172, 567164809),
+    (574853972, 582868648, 590959787, 598721330),
+    (606410952, 614426038, 622516833, 630278578),
+    (637968013, 645982425, 654072987, 661835277),  # 1990
+    (669524574, 677539185, 685630144, 693392077),
+    (701081342, 709096508, 717187425, 724949053),
+    (732638497, 740653244, 748743808, 756505608),
+    (764195341, 772210113, 780301213, 788063024),
+    (795752127, 803766924, 811858440, 819620269),
+    (827309046, 835323886, 843415268, 851177215),
+    (858866142, 866881258, 874972609, 882734885),
+    (890423735, 898437817, 906529094, 914291851),
+    (921980812, 929994610, 938086354, 945848692),
+    (953537779, 961552126, 969643719, 977405909),  # 2000
+    (985095106, 993109127, 1001199932, 1008962553),
+    (1016651832, 1024665928, 1032756987, 1040519726),
+    (1048208450, 1056222692, 1064314073, 1072076692),
+    (1079765382, 1087779476, 1095870654, 1103632960),
+    (1111322069, 1119336432, 1127427854, 1135190160),
+    (1142879199, 1150892815, 1158984266, 1166746990),
+    (1174435709, 1182449250, 1190541138, 1198303734),
+    (1205992162, 1214006427, 1222098333, 1229861090),
+    (1237549483, 1245563197, 1253654380, 1261417673),
+    (1269106398, 1277119770, 1285211407, 1292974773),  # 2010
+    (1300663309, 1308676656, 1316768743, 1324531868),
+    (1332220531, 1340233794, 1348325404, 1356088363),
+    (1363777381, 1371791103, 1379882714, 1387645927),
+    (1395334692, 1403347940, 1411439411, 1419203048),
+    (1426891575, 1434904742, 1442996499, 1450759744),
+    (1458448278, 1466462118, 1474554134, 1482317118),
+    (1490005786, 1498019117, 1506110575, 1513873744),
+    (1521562595, 1529575705, 1537667713, 1545431032),
+    (1553119174, 1561132523, 1569225078, 1576988434),
+    (1584676245, 1592689488, 1600781506, 1608545008),  # 2020
+    (1616233116, 1624246397, 1632338533, 1640102426),
+    (1647790473, 1655802898, 1663895089, 1671659360),
+    (1679347534, 1687359537, 1695451867, 1703215709),
+    (1710904052, 1718916727, 1727009087, 1734772902),
+    (1742461357, 1750473803, 1758565228, 1766329452),
+    (1774018025, 1782030338, 1790121981, 1797886282),
+    (1805574349, 1813587117, 1821679370, 1829443397),
+    (1837131495, 1845144187, 1853235985, 1860999647),
+    (1868688186, 1876700965, 1884793177, 1892556914),
+    (1900245193, 1908257546, 1916350080, 1924114245),  # 2030
+    (1931802126, 1939814295, 1947906985, 1955671001),
+    (1963358581, 1971371393, 1979464320, 1987228624),
+    (1994916231, 2002928535, 2011020767, 2018785627),
+    (2026473517, 2034485119, 2042577641, 2050342508),
+    (2058030231, 2066042055, 2074135203, 2081899920),
+    (2089587838, 2097599601, 2105691866, 2113456440),
+    (2121144683, 2129156614, 2137248853, 2145013733),
+    (2152701706, 2160713432, 2168805804, 2176571008),
+    (2184258790, 2192270313, 2200362644, 2208127304),
+    (2215815170, 2223827252, 2231919964, 2239684440),  # 2040
+    (2247372478, 2255384221, 2263476462, 2271241169),
+    (2278929268, 2286940619, 2295033163, 2302797914),
+    (2310485338, 2318497172, 2326590486, 2334355345),
+    (2342042504, 2350054338, 2358146942, 2365911886),
+    (2373599328, 2381610906, 2389703647, 2397468979),
+    (2405156344, 2413167352, 2421260576, 2429026182),
+    (2436713632, 2444724282, 2452817358, 2460582508),
+    (2468270104, 2476281309, 2484374513, 2492139810),
+    (2499827392, 2507838514, 2515931032, 2523696806),
+    (2531384451, 2539395257, 2547487787, 2555253599),  # 2050
+    (2562940828, 2570951997, 2579045320, 2586810926),
+    (2594498245, 2602509452, 2610602222, 2618367512),
+    (2626055323, 2634066329, 2642159259, 2649924678),
+    (2657612151, 2665622914, 2673716453, 2681482282),
+    (2689169402, 2697180077, 2705273411, 2713039023),
+    (2720725952, 2728736980, 2736830458, 2744596385),
+    (2752283364, 2760294033, 2768387086, 2776153461),
+    (2783840792, 2791850734, 2799943796, 2807709990),
+    (2815397147, 2823407329, 2831501105, 2839267171),
+    (2846954405, 2854964832, 2863057786, 2870823781),  # 2060
+    (2878511271, 2886521630, 2894614380, 2902380627),
+    (2910067747, 2918077981, 2926171293, 2933937859),
+    (2941624851, 2949635015, 2957728193, 2965494167),
+    (2973181219, 2981191642, 2989285125, 2997051029),
+    (3004738194, 3012748453, 3020841860, 3028608151),
+    (3036295294, 3044305089, 3052398526, 3060164838),
+    (3067851324, 3075861468, 3083955687, 3091722295),
+    (3099408648, 3107418936, 3115512515, 3123279270),
+    (3130966013, 3138975788, 3147069223, 3154836235),
+    (3162523006, 3170532268, 3178626402, 3186393673),  # 2070
+    (3194080594, 3202089763, 3210183578, 3217950347),
+    (3225637378, 3233646943, 3241740586, 3249507478),
+    (3257194518, 3265204138, 3273297436, 3281064761),
+    (3288751851, 3296761226, 3304854347, 3312621435),
+    (3320308116, 3328317747, 3336411652, 3344178548),
+    (3351865254, 3359875131, 3367968739, 3375735328),
+    (3383422392, 3391431934, 3399525478, 3407292177),
+    (3414978778, 3422988005, 3431082400, 3438849608),
+    (3446535771, 3454545090, 3462639321, 3470406373),
+    (3478092380, 3486101779, 3494195919, 3501963304),  # 2080
+    (3509649391, 3517658320, 3525752405, 3533520288),
+    (3541206775, 3549215135, 3557309116, 3565076820),
+    (3572763171, 3580771574, 3588866039, 3596633744),
+    (3604320111, 3612328978, 3620422890, 3628190621),
+    (3635877358, 3643886116, 3651979557, 3659747472),
+    (3667433865, 3675442326, 3683536483, 3691304711),
+    (3698991050, 3706999711, 3715093852, 3722861463),
+    (3730547977, 3738556757, 3746650852, 3754418328),
+    (3762104953, 3770113536, 3778207774, 3785975682),
+    (3793662275, 3801670715, 3809764923, 3817532777),  # 2090
+    (3825218676, 3833227300, 3841322016, 3849090078),
+    (3856775780, 3864784665, 3872879075, 3880647283),
+    (3888333440, 3896341793, 3904435903, 3912204215),
+    (3919890264, 3927897909, 3935992764, 3943761371),
+    (3951447469, 3959455303, 3967550039, 3975318222),
+    (3983004348, 3991012421, 3999106657, 4006874947),
+    (4014561078, 4022568978, 4030663126, 4038432021),
+    (4046118202, 4054125955, 4062220029, 4069988626),
+    (4077674440, 4085682276, 4093776843, 4101545239),
+    (4109231200, 4117239311, 4125333809, 4133102034),  # 2100
+    (4140788377, 4148796271, 4156890578, 4164658921),
+    (4172344745, 4180352194, 4188447245, 4196216154),
+    (4203901575, 4211909335, 4220004457, 4227773232),
+    (4235458639, 4243466446, 4251561164, 4259330135),
+    (4267015776, 4275022918, 4283117718, 4290887219),
+    (4298573241, 4306580155, 4314675006, 4322444180),
+    (4330129999, 4338137049, 4346232021, 4354001134),
+    (4361686936, 4369694440, 4377789084, 4385558278),
+    (4393244367, 4401251906, 4409346146, 4417115447),
+    (4424801101, 4432808133, 4440903022, 4448672535),  # 2110
+    (4456358043, 4464365348, 4472460537, 4480229475),
+    (4487915177, 4495922586, 4504017531, 4511786375),
+    (4519472056, 4527478856, 4535573946, 4543343403),
+    (4551028948, 4559035800, 4567131070, 4574900563),
+    (4582585548, 4590592448, 4598687762, 4606457421),
+    (4614142330, 4622149249, 4630244379, 4638014264),
+    (4645699780, 4653706377, 4661801277, 4669571203),
+    (4677256593, 4685262411, 4693357804, 4701127931),
+    (4708813345, 4716819541, 4724915008, 4732684803),
+    (4740370331, 4748376938, 4756471774, 4764241646),  # 2120
+    (4771927150, 4779933308, 4788028031, 4795798479),
+    (4803484036, 4811490347, 4819585364, 4827355465),
+    (4835040740, 4843047196, 4851142407, 4858912182),
+    (4866597541, 4874604093, 4882699336, 4890469096),
+    (4898154790, 4906161378, 4914256644, 4922026532),
+    (4929711552, 4937717625, 4945813384, 4953583742),
+    (4961268385, 4969274712, 4977370755, 4985141059),
+    (4992825729, 5000832138, 5008927761, 5016698201),
+    (5024383111, 5032388518, 5040484101, 5048255117),
+    (5055940365, 5063945617, 5072041468, 5079812195),  # 2130
+    (5087497237, 5095502740, 5103598369, 5111369029),
+    (5119054088, 5127059767, 5135154949, 5142925799),
+    (5150611164, 5158617026, 5166712069, 5174482961),
+    (5182167919, 5190173289, 5198268694, 5206039626),
+    (5213724530, 5221730063, 5229825886, 5237596317),
+    (5245281416, 5253287311, 5261382955, 5269153280),
+    (5276838317, 5284843477, 5292939085, 5300710047),
+    (5308394862, 5316400170, 5324496260, 5332267254),
+    (5339951521, 5347957083, 5356053108, 5363824242),
+    (5371508491, 5379513753, 5387609522, 5395380909),  # 2140
+    (5403065758, 5411070852, 5419166756, 5426938181),
+    (5434622899, 5442627365, 5450723520, 5458495061),
+    (5466179707, 5474184397, 5482280644, 5490051986),
+    (5497736743, 5505742061, 5513837904, 5521609367),
+    (5529294061, 5537298626, 5545394158, 5553166111),
+    (5560850853, 5568855488, 5576951565, 5584723226),
+    (5592407816, 5600412758, 5608508892, 5616280229),
+    (5623964872, 5631969596, 5640065494, 5647836892),
+    (5655521855, 5663526734, 5671622862, 5679394469),
+    (5687078768, 5695083247, 5703179602, 5710951567),  # 2150
+    (5718635512, 5726640014, 5734736499, 5742508429),
+    (5750192553, 5758197336, 5766293648, 5774065626),
+    (5781750017, 5789753739, 5797849765, 5805622124),
+    (5813306786, 5821310407, 5829406866, 5837179018),
+    (5844863413, 5852867618, 5860963921, 5868735996),
+    (5876420294, 5884424442, 5892520139, 5900292408),
+    (5907977031, 5915981356, 5924077300, 5931849649),
+    (5939533843, 5947537827, 5955634130, 5963406436),
+    (5971090576, 5979094500, 5987191107, 5994963026),
+    (6002647329, 6010651722, 6018748441, 6026520349),  # 2160
+    (6034204575, 6042208225, 6050304689, 6058077298),
+    (6065761321, 6073764872, 6081861811, 6089634536),
+    (6097318071, 6105322108, 6113419093, 6121191931),
+    (6128875591, 6136879136, 6144975526, 6152748524),
+    (6160432851, 6168436149, 6176532859, 6184305923),
+    (6191990065, 6199993084, 6208089955, 6215863071),
+    (6223547107, 6231550182, 6239646824, 6247419733),
+    (6255103884, 6263107676, 6271204172, 6278977131),
+    (6286661289, 6294664420, 6302760498, 6310533826),
+    (6318217975, 6326220949, 6334317579, 6342090541),  # 2170
+    (6349774446, 6357778015, 6365874991, 6373647644),
+    (6381331559, 6389334820, 6397431300, 6405204021),
+    (6412888134, 6420891362, 6428988278, 6436761377),
+    (6444444765, 6452447862, 6460545174, 6468318634),
+    (6476001656, 6484004489, 6492101657, 6499875072),
+    (6507558421, 6515561481, 6523658784, 6531432373),
+    (6539116063, 6547118101, 6555215046, 6562989018),
+    (6570672896, 6578674692, 6586771879, 6594545730),
+    (6602229412, 6610232070, 6618329275, 6626103090),
+    (6633786750, 6641789317, 6649885646, 6657659587),  # 2180
+    (6665343635, 6673346178, 6681442818, 6689216875),
+    (6696900508, 6704903023, 6713000231, 6720774147),
+    (6728457721, 6736460090, 6744557213, 6752330652),
+    (6760014471, 6768017271, 6776114667, 6783888203),
+    (6791571875, 6799574105, 6807671274, 6815445409),
+    (6823128755, 6831130739, 6839228159, 6847002343),
+    (6854685268, 6862687834, 6870785554, 6878559780),
+    (6886242873, 6894244926, 6902341914, 6910116213),
+    (6917799941, 6925801522, 6933898825, 6941673239),
+    (6949356586, 6957358216, 6965455970, 6973230456),  # 2190
+    (6980913629, 6988915280, 6997012519, 7004786811),
+    (7012470101, 7020472156, 7028569433, 7036343914),
+    (7044027203, 7052028743, 7060125836, 7067900749),
+    (7075584085, 7083585246, 7091682584, 7099457099),
+    (7107140271, 7115142083, 7123239955, 7131014272),
+    (7138697556, 7146699218, 7154796438, 7162570894),
+    (7170254346, 7178255752, 7186353248, 7194128119),
+    (7201810823, 7209812408, 7217910572, 7225685747),
+    (7233368247, 7241369606, 7249467315, 7257242318),
+    (7264925254, 7272926592, 7281024489, 7288799621),  # 2200
+)
+# Define range of years covered
+_START_YEAR = 1900
+_END_YEAR = 2200
+
+# The targets of the PyMeeus equinox and solstice calculation, in the order
+# of the table columns.
+_TARGETS = ("spring", "summer", "autumn", "winter")
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _pymeeus_equinox_solstice(year: int, target: str) -> int:
+    """
+    Calculate the UTC instant of an equinox or solstice with PyMeeus.
+
+    This is the slow path, for the years out of the precomputed table. It
+    takes a few milliseconds.
+
+    :param year:
+        The year.
+
+    :param target:
+        The PyMeeus target: ``spring``, ``summer``, ``autumn`` or ``winter``
+        for the March equinox, June solstice, September equinox and December
+        solstice respectively.
+
+    :return:
+        The instant, in seconds since 1970-01-01 00:00 UTC.
+    """
+    epoch = Sun.get_equinox_solstice(year, target=target)
+    y, m, d, h, mi, s = map(int, Epoch(epoch).get_full_date())
+    instant = datetime(y, m, d, h, mi, s, tzinfo=timezone.utc)
+    return int(instant.timestamp())
+
+
+def _get_equinox_solstice_date(
+    year: int, target: str, utc_offset: int
+) -> date:
+    """
+    Calculate the local date of an equinox or solstice.
+
+    The years from 1900 to 2200 are looked up in a table precomputed with
+    PyMeeus; other years are calculated with it.
+
+    :param year:
+        The year.
+
+    :param target:
+        The PyMeeus target: ``spring``, ``summer``, ``autumn`` or ``winter``
+        for the March equinox, June solstice, September equinox and December
+        solstice respectively.
+
+    :param utc_offset:
+        The fixed offset of the local time from UTC, in hours.
+
+    :return:
+        The date of the equinox or solstice in the local time.
+    """
+    if _START_YEAR <= year <= _END_YEAR:
+        instant = _EQUINOX_SOLSTICE_TIMES[year - _START_YEAR][
+            _TARGETS.index(target)
+        ]
+    else:
+        instant = _pymeeus_equinox_solstice(year, target)
+    return date.fromordinal(
+        _UNIX_EPOCH_ORDINAL + (instant + utc_offset * 3600) // 86400
+    )
@@ -0,0 +1,93 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+from calendar import monthrange
+from datetime import date
+
+
+def _get_nth_weekday_from(n: int, weekday: int, from_dt: date) -> date:
+    """
+    Calculate the n-th occurrence of a week day counting from a date, which
+    counts itself if it falls on that week day. This is what adding
+    ``relativedelta(weekday=MO(n))`` does, at a fraction of its cost.
+
+    :param n:
+        The occurrence number, counting backwards if negative (e.g. -1 for
+        the last week day on or before the date).
+
+    :param weekday:
+        The week day (:data:`holidays.constants.MON` to
+        :data:`holidays.constants.SUN`).
+
+    :param from_dt:
+        The date to count from.
+
+    :return:
+        The date of the n-th week day.
+    """
+    ordinal = from_dt.toordinal()
+    if n > 0:
+        ordinal += (weekday - from_dt.weekday()) % 7 + (n - 1) * 7
+    else:
+        ordinal -= (from_dt.weekday() - weekday) % 7 - (n + 1) * 7
+    return date.fromordinal(ordinal)
+
+
+def _get_nth_weekday_of_month(
+    n: int, weekday: int, month: int, year: int
+) -> date:
+    """
+    Calculate the n-th occurrence of a week day in a month (e.g. the 3rd
+    Monday of January).
+
+    :param n:
+        The occurrence number, counting from the end of the month if
+        negative (e.g. -1 for the last one).
+
+    :param weekday:
+        The week day (:data:`holidays.constants.MON` to
+        :data:`holidays.constants.SUN`).
+
+    :param month:
+        The month.
+
+    :param year:
+        The year.
+
+    :return:
+        The date of the n-th week day of the month.
+    """
+    if n > 0:
+        return _get_nth_weekday_from(n, weekday, date(year, month, 1))
+    return _get_nth_weekday_from(
+        n, weekday, date(year, month, monthrange(year, month)[1])
+    )
+
+
+def _get_last_weekday_of_month(weekday: int, month: int, year: int) -> date:
+    """
+    Calculate the last occurrence of a week day in a month (e.g. the last
+    Monday of May).
+
+    :param weekday:
+        The week day (:data:`holidays.constants.MON` to
+        :data:`holidays.constants.SUN`).
+
+    :param month:
+        The month.
+
+    :param year:
+        The year.
+
+    :return:
+        The date of the last week day of the month.
+    """
+    return _get_nth_weekday_of_month(-1, weekday, month, year)
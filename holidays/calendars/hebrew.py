@@ -0,0 +1,129 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+from datetime import date
+from functools import lru_cache
+
+# The Hebrew months, numbered from Nisan as in package `convertdate
+# <https://pypi.org/project/convertdate/>`__. The year starts with Tishri;
+# in leap years Adar is Adar I and VEADAR is Adar II.
+NISAN = 1
+IYYAR = 2
+SIVAN = 3
+TAMMUZ = 4
+AV = 5
+ELUL = 6
+TISHRI = 7
+HESHVAN = 8
+KISLEV = 9
+TEVETH = 10
+SHEVAT = 11
+ADAR = 12
+VEADAR = 13
+
+# The Hebrew year starting in the autumn of a Gregorian year, less one.
+_HEBREW_YEAR_OFFSET = 3760
+
+# The days from the start of each month from Nisan to Elul to the start of
+# the next year: these months have the same length every year.
+_DAYS_BEFORE_NEW_YEAR = (177, 147, 118, 88, 59, 29)
+
+# The date ordinal of the day before the Hebrew calendar epoch, plus one.
+_EPOCH_ORDINAL = -1373427
+
+
+def _elapsed_days(year: int) -> int:
+    """Return the days from the epoch to the molad of Tishri of a Hebrew
+    year, postponed by a day if needed to avoid Sunday, Wednesday and
+    Friday."""
+    months = (235 * year - 234) // 19
+    parts = 12084 + 13753 * months
+    days = months * 29 + parts // 25920
+    if (3 * (days + 1)) % 7 < 3:
+        days += 1
+    return days
+
+
+@lru_cache(maxsize=None)
+def _new_year(year: int) -> int:
+    """
+    Calculate the date ordinal of the Hebrew new year (1 Tishri).
+
+    :param year:
+        The Hebrew year.
+
+    :return:
+        The date ordinal of the first day of the year.
+    """
+    days = _elapsed_days(year)
+    if _elapsed_days(year + 1) - days == 356:
+        days += 2
+    elif days - _elapsed_days(year - 1) == 382:
+        days += 1
+    return days + _EPOCH_ORDINAL
+
+
+def _is_leap_year(year: int) -> bool:
+    """Return whether a Hebrew year has 13 months."""
+    return (year * 7 + 1) % 19 < 7
+
+
+def _month_start(year: int, month: int) -> int:
+    """Return the date ordinal of the first day of a month of a Hebrew
+    year."""
+    if month < TISHRI:
+        return _new_year(year + 1) - _DAYS_BEFORE_NEW_YEAR[month - 1]
+
+    # Heshvan and Kislev are one day longer or shorter depending on the
+    # length of the year (353 to 355 days, or 383 to 385 if leap).
+    length = _new_year(year + 1) - _new_year(year)
+    months = month - TISHRI
+    start = _new_year(year) + 29 * months + (months + 1) // 2
+    if month > HESHVAN and length % 10 == 5:
+        start += 1
+    if month > KISLEV and length % 10 == 3:
+        start -= 1
+    if month == VEADAR:
+        # Adar I is 30 days long, where Adar is 29.
+        start += 1
+    return start
+
+
+@lru_cache(maxsize=None)
+def _hebrew_to_gre(Gyear: int, Hmonth: int, Hday: int) -> date:
+    """
+    Find the Gregorian date of a Hebrew calendar month and day falling
+    within the Gregorian year, as ``convertdate.hebrew.to_jd_gregorianyear``
+    does.
+
+    The dates are calculated from the Hebrew new year, which is memoized per
+    Hebrew year, adding the lengths of the months; the results are memoized
+    too.
+
+    :param Gyear:
+        The Gregorian year.
+
+    :param Hmonth:
+        The Hebrew month (:data:`NISAN` to :data:`VEADAR`).
+
+    :param Hday:
+        The Hebrew day.
+
+    :return:
+        The Gregorian date within the Gregorian year specified.
+    """
+    for year in (Gyear + _HEBREW_YEAR_OFFSET, Gyear + _HEBREW_YEAR_OFFSET + 1):
+        dt = date.fromordinal(_month_start(year, Hmonth) + Hday - 1)
+        if dt.year == Gyear:
+            return dt
+    raise ValueError(
+        f"Hebrew date {Hmonth}/{Hday} does not fall in year {Gyear}."
+    )
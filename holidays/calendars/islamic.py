@@ -0,0 +1,77 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from typing import Tuple
+
+from hijri_converter import ummalqura
+
+# The Umm al-Qura month starts of hijri_converter are Reduced Julian Days:
+# this is the offset to turn them into date ordinals.
+_RJD_TO_ORDINAL = 2400000 - 1721425
+
+# The date ordinal of the first day of each month of the supported Hijri
+# years, followed by the day after the last one.
+_MONTH_STARTS = array(
+    "i", (rjd + _RJD_TO_ORDINAL for rjd in ummalqura.MONTH_STARTS)
+)
+# The number of months before the first one of _MONTH_STARTS.
+_MONTH_OFFSET = ummalqura.HIJRI_OFFSET
+
+
+@lru_cache(maxsize=None)
+def _islamic_to_gre(Gyear: int, Hmonth: int, Hday: int) -> Tuple[date, ...]:
+    """
+    Find the Gregorian dates of all instances of Islamic (Lunar Hijrī) calendar
+    month and day falling within the Gregorian year. There could be up to two
+    such instances in a single Gregorian year since the Islamic (Lunar Hijrī)
+    calendar is about 11 days shorter.
+
+    Uses the Umm al-Qura calendar data of package `hijri_converter
+    <https://www.pypy.org/package/hijri_converter>`__, precomputed as an
+    array of month start dates: each conversion is an array lookup, and the
+    results are memoized.
+
+    :param Gyear:
+        The Gregorian year.
+
+    :param Hmonth:
+        The Lunar Hijrī (Islamic) month.
+
+    :param Hday:
+        The Lunar Hijrī (Islamic) day.
+
+    :return:
+        The Gregorian dates within the Gregorian year specified that match
+        the Islamic (Lunar Hijrī) calendar day and month specified. Dates out
+        of the supported range, or days past the end of the month, have no
+        instances.
+    """
+    # The (zero-based) Hijri year of the first day of the Gregorian one.
+    Hyear = (
+        bisect_right(_MONTH_STARTS, date(Gyear, 1, 1).toordinal())
+        - 1
+        + _MONTH_OFFSET
+    ) // 12
+    gre_dates = []
+    for y in (Hyear - 1, Hyear, Hyear + 1):
+        idx = y * 12 + Hmonth - 1 - _MONTH_OFFSET
+        if not 0 <= idx < len(_MONTH_STARTS) - 1:
+            continue
+        start = _MONTH_STARTS[idx]
+        if 1 <= Hday <= _MONTH_STARTS[idx + 1] - start:
+            dt = date.fromordinal(start + Hday - 1)
+            if dt.year == Gyear:
+                gre_dates.append(dt)
+    return tuple(gre_dates)
@@ -0,0 +1,1172 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+
+# The Korean lunar calendar data of package `korean_lunar_calendar
+# <https://github.com/usingsky/korean_lunar_calendar_py/>`__, one entry per
+# year starting from 1000. The bits of each entry hold:
+# * 0 to 11: whether the months 12 to 1 (in this order) are 30 days long,
+# * 12 to 15: the leap month, or 0 if there is none,
+# * 16: whether the leap month is 30 days long,
+# * 17 to 25: the number of days of the lunar year,
+# * 30: whether the solar year is a leap year (Julian calendar before 1582).
+_KOREAN_LUNAR_DATA = (
+    0x82C60A57,  # 1000
+    0x82FEC52B,
+    0x82C40D2A,
+    0x82C60D55,
+    0xC30095AD,
+    0x82C4056A,
+    0x82C6096D,
+    0x830054DD,
+    0xC2C404AD,
+    0x82C40A4D,
+    0x83002E4D,  # 1010
+    0x82C40B26,
+    0xC300AB56,
+    0x82C60AD5,
+    0x82C4035A,
+    0x8300697A,
+    0xC2C6095B,
+    0x82C4049B,
+    0x83004A9B,
+    0x82C40A4B,
+    0xC301CAA5,  # 1020
+    0x82C406AA,
+    0x82C60AD5,
+    0x830092DD,
+    0xC2C402B5,
+    0x82C60957,
+    0x82FE54AE,
+    0x82C60C97,
+    0xC2C4064B,
+    0x82FF254A,
+    0x82C60DA9,  # 1030
+    0x8300A6B6,
+    0xC2C6066D,
+    0x82C4026E,
+    0x8301692E,
+    0x82C4092E,
+    0xC2C40C96,
+    0x83004D95,
+    0x82C40D4A,
+    0x8300CD69,
+    0xC2C40B58,  # 1040
+    0x82C80D6B,
+    0x8301926B,
+    0x82C4025D,
+    0xC2C4092B,
+    0x83005AAB,
+    0x82C40A95,
+    0x82C40B4A,
+    0xC3021EAB,
+    0x82C402D5,
+    0x8301B55A,  # 1050
+    0x82C604BB,
+    0xC2C4025B,
+    0x83007537,
+    0x82C4052B,
+    0x82C40695,
+    0xC3003755,
+    0x82C406AA,
+    0x8303CAB5,
+    0x82C40275,
+    0xC2C404B6,  # 1060
+    0x83008A5E,
+    0x82C40A56,
+    0x82C40D26,
+    0xC3005EA6,
+    0x82C60D55,
+    0x82C405AA,
+    0x83001D6A,
+    0xC2C6096D,
+    0x8300B4AF,
+    0x82C4049D,  # 1070
+    0x82C40A4D,
+    0xC3007D2D,
+    0x82C40AA6,
+    0x82C60B55,
+    0x830045D5,
+    0xC2C4035A,
+    0x82C6095D,
+    0x83011173,
+    0x82C4045B,
+    0xC3009A4F,  # 1080
+    0x82C4064B,
+    0x82C40AA5,
+    0x83006B69,
+    0xC2C606B5,
+    0x82C402DA,
+    0x83002AB6,
+    0x82C60937,
+    0xC2FEC497,
+    0x82C60C97,
+    0x82C4064B,  # 1090
+    0x82FE86AA,
+    0xC2C60DA5,
+    0x82C405B4,
+    0x83034A6D,
+    0x82C402AE,
+    0xC2C40E61,
+    0x83002D2E,
+    0x82C40C96,
+    0x83009D4D,
+    0x82C40D4A,  # 1100
+    0x82C60D65,
+    0x83016595,
+    0x82C6055D,
+    0xC2C4026D,
+    0x83002A5D,
+    0x82C4092B,
+    0x8300AA97,
+    0xC2C40A95,
+    0x82C40B4A,
+    0x83008B5A,  # 1110
+    0x82C60AD5,
+    0xC2C6055B,
+    0x830042B7,
+    0x82C40457,
+    0x82C4052B,
+    0xC3001D2B,
+    0x82C40695,
+    0x8300972D,
+    0x82C405AA,
+    0xC2C60AB5,  # 1120
+    0x830054ED,
+    0x82C404B6,
+    0x82C60A57,
+    0xC2FF344E,
+    0x82C40D26,
+    0x8301BE92,
+    0x82C60D55,
+    0xC2C405AA,
+    0x830089BA,
+    0x82C6096D,  # 1130
+    0x82C404AE,
+    0xC3004A9D,
+    0x82C40A4D,
+    0x82C40D25,
+    0x83002F25,
+    0xC2C40B54,
+    0x8303AD69,
+    0x82C402DA,
+    0x82C6095D,
+    0xC301649B,  # 1140
+    0x82C4049B,
+    0x82C40A4B,
+    0x83004B4B,
+    0xC2C406A5,
+    0x8300BB53,
+    0x82C406B4,
+    0x82C60AB6,
+    0xC3018956,
+    0x82C60997,
+    0x82C40497,  # 1150
+    0x83004697,
+    0xC2C4054B,
+    0x82FEC6A5,
+    0x82C60DA5,
+    0x82C405AC,
+    0xC303AAB5,
+    0x82C4026E,
+    0x82C4092E,
+    0x83006CAE,
+    0xC2C40C96,  # 1160
+    0x82C40D4A,
+    0x83002F4A,
+    0x82C60D55,
+    0xC300B56B,
+    0x82C6055B,
+    0x82C4025D,
+    0x8300793D,
+    0xC2C40927,
+    0x82C40A95,
+    0x83015D15,  # 1170
+    0x82C40B4A,
+    0xC2C60B55,
+    0x830112D5,
+    0x82C604DB,
+    0x82FE925E,
+    0xC2C60A57,
+    0x82C4052B,
+    0x83006AAB,
+    0x82C40695,
+    0xC2C406AA,  # 1180
+    0x83003BAA,
+    0x82C60AB5,
+    0x8300B4B7,
+    0xC2C404AE,
+    0x82C60A57,
+    0x82FE752E,
+    0x82C40D26,
+    0xC2C60E93,
+    0x830056D5,
+    0x82C405AA,  # 1190
+    0x82C609B5,
+    0xC300256D,
+    0x82C404AE,
+    0x8301AA4D,
+    0x82C40A4D,
+    0xC2C40D26,
+    0x83006D65,
+    0x82C40B52,
+    0x82C60D6A,
+    0xC30026DA,  # 1200
+    0x82C6095D,
+    0x8301C49D,
+    0x82C4049B,
+    0xC2C40A4B,
+    0x83008AAB,
+    0x82C406A5,
+    0x82C40B54,
+    0xC3004BB4,
+    0x82C60AB6,
+    0x82C6095B,  # 1210
+    0x83002537,
+    0xC2C40497,
+    0x8300964F,
+    0x82C4054B,
+    0x82C406A5,
+    0xC30176C5,
+    0x82C405AC,
+    0x82C60AB6,
+    0x8301386E,
+    0xC2C4092E,  # 1220
+    0x8300CC97,
+    0x82C40C96,
+    0x82C40D4A,
+    0xC3008DAA,
+    0x82C60B55,
+    0x82C4056A,
+    0x83025ADB,
+    0xC2C4025D,
+    0x82C4092E,
+    0x83002D2B,  # 1230
+    0x82C40A95,
+    0xC3009D4D,
+    0x82C40B2A,
+    0x82C60B55,
+    0x83007575,
+    0xC2C404DA,
+    0x82C60A5B,
+    0x83004557,
+    0x82C4052B,
+    0xC301CA93,  # 1240
+    0x82C40693,
+    0x82C406AA,
+    0x83008ADA,
+    0xC2C60AE5,
+    0x82C404B6,
+    0x83004AAE,
+    0x82C60A57,
+    0xC2C40527,
+    0x82FF2526,
+    0x82C60E53,  # 1250
+    0x8300A6CB,
+    0xC2C405AA,
+    0x82C605AD,
+    0x830164AD,
+    0x82C404AE,
+    0xC2C40A4E,
+    0x83004D4D,
+    0x82C40D26,
+    0x8300BD53,
+    0xC2C40B52,  # 1260
+    0x82C60B6A,
+    0x8301956A,
+    0x82C60557,
+    0xC2C4049D,
+    0x83015A1B,
+    0x82C40A4B,
+    0x82C40AA5,
+    0xC3001EA5,
+    0x82C40B52,
+    0x8300BB5A,  # 1270
+    0x82C60AB6,
+    0xC2C6095B,
+    0x830064B7,
+    0x82C40497,
+    0x82C4064B,
+    0xC300374B,
+    0x82C406A5,
+    0x8300B6B3,
+    0x82C405AC,
+    0xC2C60AB6,  # 1280
+    0x830182AD,
+    0x82C4049E,
+    0x82C40A4D,
+    0xC3005D4B,
+    0x82C40B25,
+    0x82C40B52,
+    0x83012E52,
+    0xC2C60B5A,
+    0x8300A95E,
+    0x82C6095B,  # 1290
+    0x82C4049B,
+    0xC3006A57,
+    0x82C40A4B,
+    0x82C40AA5,
+    0x83004BA5,
+    0xC2C406D4,
+    0x8300CAD6,
+    0x82C60AB6,
+    0x82C60937,
+    0x8300849F,  # 1300
+    0x82C40497,
+    0x82C4064B,
+    0x82FE56CA,
+    0xC2C60DA5,
+    0x82C405AA,
+    0x83001D6C,
+    0x82C60A6E,
+    0xC300B92F,
+    0x82C4092E,
+    0x82C40C96,  # 1310
+    0x83007D55,
+    0xC2C40D4A,
+    0x82C60D55,
+    0x83013555,
+    0x82C4056A,
+    0xC2C60A6D,
+    0x83001A5D,
+    0x82C4092B,
+    0x83008A5B,
+    0xC2C40A95,  # 1320
+    0x82C40B2A,
+    0x83015B2A,
+    0x82C60AD5,
+    0xC2C404DA,
+    0x83001CBA,
+    0x82C60A57,
+    0x8300952F,
+    0xC2C40527,
+    0x82C40693,
+    0x830076B3,  # 1330
+    0x82C406AA,
+    0xC2C60AB5,
+    0x83003575,
+    0x82C404B6,
+    0x8300CA67,
+    0xC2C40A2E,
+    0x82C40D16,
+    0x83008E96,
+    0x82C40D4A,
+    0xC2C60DAA,  # 1340
+    0x830055EA,
+    0x82C6056D,
+    0x82C404AE,
+    0xC301285D,
+    0x82C40A2D,
+    0x8300AD17,
+    0x82C40AA5,
+    0xC2C40B52,
+    0x83007D74,
+    0x82C60ADA,  # 1350
+    0x82C6055D,
+    0xC300353B,
+    0x82C4045B,
+    0x82C40A2B,
+    0x83011A2B,
+    0xC2C40AA5,
+    0x83009B55,
+    0x82C406B2,
+    0x82C60AD6,
+    0xC3015536,  # 1360
+    0x82C60937,
+    0x82C40457,
+    0x83003A57,
+    0xC2C4052B,
+    0x82FEAAA6,
+    0x82C60D95,
+    0x82C405AA,
+    0xC3017AAC,
+    0x82C60A6E,
+    0x82C4052E,  # 1370
+    0x83003CAE,
+    0xC2C40A56,
+    0x8300BD2B,
+    0x82C40D2A,
+    0x82C60D55,
+    0xC30095AD,
+    0x82C4056A,
+    0x82C60A6D,
+    0x8300555D,
+    0xC2C4052B,  # 1380
+    0x82C40A8D,
+    0x83002E55,
+    0x82C40B2A,
+    0xC300AB56,
+    0x82C60AD5,
+    0x82C404DA,
+    0x83006A7A,
+    0xC2C60A57,
+    0x82C4051B,
+    0x83014A17,  # 1390
+    0x82C40653,
+    0xC301C6A9,
+    0x82C405AA,
+    0x82C60AB5,
+    0x830092BD,
+    0xC2C402B6,
+    0x82C60A37,
+    0x82FE552E,
+    0x82C40D16,
+    0x82C60E4B,  # 1400
+    0x82FE3752,
+    0x82C60DAA,
+    0x8301B5B4,
+    0xC2C6056D,
+    0x82C402AE,
+    0x83007A3D,
+    0x82C40A2D,
+    0xC2C40D15,
+    0x83004D95,
+    0x82C40B52,  # 1410
+    0x8300CB69,
+    0xC2C60ADA,
+    0x82C6055D,
+    0x8301925B,
+    0x82C4045B,
+    0xC2C40A2B,
+    0x83005AAB,
+    0x82C40A95,
+    0x82C40B52,
+    0xC3001EAA,  # 1420
+    0x82C60AB6,
+    0x8300C55B,
+    0x82C604B7,
+    0xC2C40457,
+    0x83007537,
+    0x82C4052B,
+    0x82C40695,
+    0xC3014695,
+    0x82C405AA,
+    0x8300CAB5,  # 1430
+    0x82C60A6E,
+    0xC2C404AE,
+    0x83008A5E,
+    0x82C40A56,
+    0x82C40D2A,
+    0xC3006EAA,
+    0x82C60D55,
+    0x82C4056A,
+    0x8301295A,
+    0xC2C6095D,  # 1440
+    0x8300B4AF,
+    0x82C4049B,
+    0x82C40A4D,
+    0xC3007D2D,
+    0x82C40B2A,
+    0x82C60B55,
+    0x830045D5,
+    0xC2C402DA,
+    0x82C6095B,
+    0x83011157,  # 1450
+    0x82C4049B,
+    0xC3009A4F,
+    0x82C4064B,
+    0x82C406A9,
+    0x83006AEA,
+    0xC2C606B5,
+    0x82C402B6,
+    0x83002AAE,
+    0x82C60937,
+    0xC2FFB496,  # 1460
+    0x82C40C96,
+    0x82C60E4B,
+    0x82FE76B2,
+    0xC2C60DAA,
+    0x82C605AD,
+    0x8300336D,
+    0x82C4026E,
+    0xC2C4092E,
+    0x83002D2D,
+    0x82C40C95,  # 1470
+    0x83009D4D,
+    0xC2C40B4A,
+    0x82C60B69,
+    0x8301655A,
+    0x82C6055B,
+    0xC2C4025D,
+    0x83002A5B,
+    0x82C4092B,
+    0x8300AA97,
+    0xC2C40695,  # 1480
+    0x82C4074A,
+    0x83008B5A,
+    0x82C60AB6,
+    0xC2C6053B,
+    0x830042B7,
+    0x82C40257,
+    0x82C4052B,
+    0xC3001D2B,
+    0x82C40695,
+    0x830096AD,  # 1490
+    0x82C405AA,
+    0xC2C60AB5,
+    0x830054ED,
+    0x82C404AE,
+    0x82C60A57,
+    0xC2FF344E,
+    0x82C40D2A,
+    0x8301BD94,
+    0x82C60B55,
+    0x82C4056A,  # 1500
+    0x8300797A,
+    0x82C6095D,
+    0x82C404AE,
+    0xC3004A9B,
+    0x82C40A4D,
+    0x82C40D25,
+    0x83011AAA,
+    0xC2C60B55,
+    0x8300956D,
+    0x82C402DA,  # 1510
+    0x82C6095B,
+    0xC30054B7,
+    0x82C40497,
+    0x82C40A4B,
+    0x83004B4B,
+    0xC2C406A9,
+    0x8300CAD5,
+    0x82C605B5,
+    0x82C402B6,
+    0xC300895E,  # 1520
+    0x82C6092F,
+    0x82C40497,
+    0x82FE4696,
+    0xC2C40D4A,
+    0x8300CEA5,
+    0x82C60D69,
+    0x82C6056D,
+    0xC301A2B5,
+    0x82C4026E,
+    0x82C4092E,  # 1530
+    0x83006CAD,
+    0xC2C40C95,
+    0x82C40D4A,
+    0x83002F4A,
+    0x82C60B59,
+    0xC300C56D,
+    0x82C6055B,
+    0x82C4025D,
+    0x8300793B,
+    0xC2C4092B,  # 1540
+    0x82C40A95,
+    0x83015B15,
+    0x82C406CA,
+    0xC2C60AD5,
+    0x830112B6,
+    0x82C604BB,
+    0x8300925F,
+    0xC2C40257,
+    0x82C4052B,
+    0x82FE6AAA,  # 1550
+    0x82C60E95,
+    0xC2C406AA,
+    0x83003BAA,
+    0x82C60AB5,
+    0x8300B4B7,
+    0xC2C404AE,
+    0x82C60A57,
+    0x82FE752D,
+    0x82C40D26,
+    0xC2C60D95,  # 1560
+    0x830055D5,
+    0x82C4056A,
+    0x82C6096D,
+    0xC300255D,
+    0x82C404AE,
+    0x8300AA4F,
+    0x82C40A4D,
+    0xC2C40D25,
+    0x83006D69,
+    0x82C60B55,  # 1570
+    0x82C4035A,
+    0xC3002ABA,
+    0x82C6095B,
+    0x8301C49B,
+    0x82C40497,
+    0xC2C40A4B,
+    0x83008B2B,
+    0x82C406A5,
+    0x82C406D4,
+    0xC3034AB5,  # 1580
+    0x82C402B6,
+    0x82C60937,
+    0x8300252F,
+    0xC2C40497,
+    0x82FE964E,
+    0x82C40D4A,
+    0x82C60EA5,
+    0xC30166A9,
+    0x82C6056D,
+    0x82C402B6,  # 1590
+    0x8301385E,
+    0xC2C4092E,
+    0x8300BC97,
+    0x82C40A95,
+    0x82C40D4A,
+    0xC3008DAA,
+    0x82C60B4D,
+    0x82C6056B,
+    0x830042DB,
+    0xC2C4025D,  # 1600
+    0x82C4092D,
+    0x83002D2B,
+    0x82C40A95,
+    0xC3009B4D,
+    0x82C406AA,
+    0x82C60AD5,
+    0x83006575,
+    0xC2C604BB,
+    0x82C4025B,
+    0x83013457,  # 1610
+    0x82C4052B,
+    0xC2FFBA94,
+    0x82C60E95,
+    0x82C406AA,
+    0x83008ADA,
+    0xC2C609B5,
+    0x82C404B6,
+    0x83004AAE,
+    0x82C60A4F,
+    0xC2C20526,  # 1620
+    0x83012D26,
+    0x82C60D55,
+    0x8301A5A9,
+    0xC2C4056A,
+    0x82C6096D,
+    0x8301649D,
+    0x82C4049E,
+    0xC2C40A4D,
+    0x83004D4D,
+    0x82C40D25,  # 1630
+    0x8300BD53,
+    0xC2C40B54,
+    0x82C60B5A,
+    0x8301895A,
+    0x82C6095B,
+    0xC2C4049B,
+    0x83004A97,
+    0x82C40A4B,
+    0x82C40AA5,
+    0xC3001EA5,  # 1640
+    0x82C406D4,
+    0x8302BADB,
+    0x82C402B6,
+    0xC2C60937,
+    0x830064AF,
+    0x82C40497,
+    0x82C4064B,
+    0xC2FE374A,
+    0x82C60DA5,
+    0x8300B6B5,  # 1650
+    0x82C6056D,
+    0xC2C402AE,
+    0x8300793E,
+    0x82C4092E,
+    0x82C40C96,
+    0xC3015D15,
+    0x82C40D4A,
+    0x82C60DA5,
+    0x83013555,
+    0xC2C4056A,  # 1660
+    0x83007A7A,
+    0x82C60A5D,
+    0x82C4092D,
+    0xC3006AAB,
+    0x82C40A95,
+    0x82C40B4A,
+    0x83004BAA,
+    0xC2C60AD5,
+    0x82C4055A,
+    0x830128BA,  # 1670
+    0x82C60A5B,
+    0xC3007537,
+    0x82C4052B,
+    0x82C40693,
+    0x83015715,
+    0xC2C406AA,
+    0x82C60AD5,
+    0x830035B5,
+    0x82C404B6,
+    0xC3008A5E,  # 1680
+    0x82C40A4E,
+    0x82C40D26,
+    0x83006EA6,
+    0xC2C40D52,
+    0x82C60DAA,
+    0x8301466A,
+    0x82C6056D,
+    0xC2C404AE,
+    0x83003A9D,
+    0x82C40A4D,  # 1690
+    0x83007D2B,
+    0xC2C40B25,
+    0x82C40D52,
+    0x83015D54,
+    0x82C60B5A,
+    0xC2C6055D,
+    0x8300355B,
+    0x82C4049B,
+    0x83007657,
+    0x82C40A4B,  # 1700
+    0x82C40AA5,
+    0x83006B65,
+    0x82C406D2,
+    0xC2C60ADA,
+    0x830045B6,
+    0x82C60937,
+    0x82C40497,
+    0xC3003697,
+    0x82C4064D,
+    0x82FE76AA,  # 1710
+    0x82C60DA5,
+    0xC2C405AA,
+    0x83005AEC,
+    0x82C60AAE,
+    0x82C4092E,
+    0xC3003D2E,
+    0x82C40C96,
+    0x83018D45,
+    0x82C40D4A,
+    0xC2C60D55,  # 1720
+    0x83016595,
+    0x82C4056A,
+    0x82C60A6D,
+    0xC300455D,
+    0x82C4052D,
+    0x82C40A95,
+    0x83013C95,
+    0xC2C40B4A,
+    0x83017B4A,
+    0x82C60AD5,  # 1730
+    0x82C4055A,
+    0xC3015A3A,
+    0x82C60A5B,
+    0x82C4052B,
+    0x83014A17,
+    0xC2C40693,
+    0x830096AB,
+    0x82C406AA,
+    0x82C60AB5,
+    0xC30064F5,  # 1740
+    0x82C404B6,
+    0x82C60A57,
+    0x82FE452E,
+    0xC2C40D16,
+    0x82C60E93,
+    0x82FE3752,
+    0x82C60DAA,
+    0xC30175AA,
+    0x82C6056D,
+    0x82C404AE,  # 1750
+    0x83015A1D,
+    0xC2C40A2D,
+    0x82C40D15,
+    0x83004DA5,
+    0x82C40B52,
+    0xC3009D6A,
+    0x82C60ADA,
+    0x82C6055D,
+    0x8301629B,
+    0xC2C4045B,  # 1760
+    0x82C40A2B,
+    0x83005B2B,
+    0x82C40A95,
+    0xC2C40B52,
+    0x83012AB2,
+    0x82C60AD6,
+    0x83017556,
+    0xC2C60537,
+    0x82C40457,
+    0x83005657,  # 1770
+    0x82C4052B,
+    0xC2C40695,
+    0x83003795,
+    0x82C405AA,
+    0x8300AAB6,
+    0xC2C60A6D,
+    0x82C404AE,
+    0x83006A6E,
+    0x82C40A56,
+    0xC2C40D2A,  # 1780
+    0x83005EAA,
+    0x82C60D55,
+    0x82C405AA,
+    0xC3003B6A,
+    0x82C60A6D,
+    0x830074BD,
+    0x82C404AB,
+    0xC2C40A8D,
+    0x83005D55,
+    0x82C40B2A,  # 1790
+    0x82C60B55,
+    0xC30045D5,
+    0x82C404DA,
+    0x82C6095D,
+    0x83002557,
+    0xC2C4049B,
+    0x83006A97,
+    0x82C4064B,
+    0x82C406A9,
+    0x83004BAA,  # 1800
+    0x82C606B5,
+    0x82C402BA,
+    0x83002AB6,
+    0xC2C60937,
+    0x82FE652E,
+    0x82C40D16,
+    0x82C60E4B,
+    0xC2FE56D2,
+    0x82C60DA9,
+    0x82C605B5,  # 1810
+    0x8300336D,
+    0xC2C402AE,
+    0x82C40A2E,
+    0x83002E2D,
+    0x82C40C95,
+    0xC3006D55,
+    0x82C40B52,
+    0x82C60B69,
+    0x830045DA,
+    0xC2C6055D,  # 1820
+    0x82C4025D,
+    0x83003A5B,
+    0x82C40A2B,
+    0xC3017A8B,
+    0x82C40A95,
+    0x82C40B4A,
+    0x83015B2A,
+    0xC2C60AD5,
+    0x82C6055B,
+    0x830042B7,  # 1830
+    0x82C40257,
+    0xC300952F,
+    0x82C4052B,
+    0x82C40695,
+    0x830066D5,
+    0xC2C405AA,
+    0x82C60AB5,
+    0x8300456D,
+    0x82C404AE,
+    0xC2C60A57,  # 1840
+    0x82FF3456,
+    0x82C40D2A,
+    0x83017E8A,
+    0xC2C60D55,
+    0x82C405AA,
+    0x83005ADA,
+    0x82C6095D,
+    0xC2C404AE,
+    0x83004AAB,
+    0x82C40A4D,  # 1850
+    0x83008D2B,
+    0xC2C40B29,
+    0x82C60B55,
+    0x83007575,
+    0x82C402DA,
+    0xC2C6095D,
+    0x830054D7,
+    0x82C4049B,
+    0x82C40A4B,
+    0xC3013A4B,  # 1860
+    0x82C406A9,
+    0x83008AD9,
+    0x82C606B5,
+    0xC2C402B6,
+    0x83015936,
+    0x82C60937,
+    0x82C40497,
+    0xC2FE4696,
+    0x82C40E4A,
+    0x8300AEA6,  # 1870
+    0x82C60DA9,
+    0xC2C605AD,
+    0x830162AD,
+    0x82C402AE,
+    0x82C4092E,
+    0xC3005CAD,
+    0x82C40C95,
+    0x82C40D4A,
+    0x83013D4A,
+    0xC2C60B69,  # 1880
+    0x8300757A,
+    0x82C6055B,
+    0x82C4025D,
+    0xC300595B,
+    0x82C4092B,
+    0x82C40A95,
+    0x83004D95,
+    0xC2C40B4A,
+    0x82C60B55,
+    0x830026D5,  # 1890
+    0x82C6055B,
+    0xC3006277,
+    0x82C40257,
+    0x82C4052B,
+    0x82FE5AAA,
+    0xC2C60E95,
+    0x82C406AA,
+    0x83003BAA,
+    0x82C60AB5,
+    0x830084BD,  # 1900
+    0x82C404AE,
+    0x82C60A57,
+    0x82FE554D,
+    0xC2C40D26,
+    0x82C60D95,
+    0x83014655,
+    0x82C4056A,
+    0xC2C609AD,
+    0x8300255D,
+    0x82C404AE,  # 1910
+    0x83006A5B,
+    0xC2C40A4D,
+    0x82C40D25,
+    0x83005DA9,
+    0x82C60B55,
+    0xC2C4056A,
+    0x83002ADA,
+    0x82C6095D,
+    0x830074BB,
+    0xC2C4049B,  # 1920
+    0x82C40A4B,
+    0x83005B4B,
+    0x82C406A9,
+    0xC2C40AD4,
+    0x83024BB5,
+    0x82C402B6,
+    0x82C6095B,
+    0xC3002537,
+    0x82C40497,
+    0x82FE6656,  # 1930
+    0x82C40E4A,
+    0xC2C60EA5,
+    0x830156A9,
+    0x82C605B5,
+    0x82C402B6,
+    0xC30138AE,
+    0x82C4092E,
+    0x83017C8D,
+    0x82C40C95,
+    0xC2C40D4A,  # 1940
+    0x83016D8A,
+    0x82C60B69,
+    0x82C6056D,
+    0xC301425B,
+    0x82C4025D,
+    0x82C4092D,
+    0x83002D2B,
+    0xC2C40A95,
+    0x83007D55,
+    0x82C40B4A,  # 1950
+    0x82C60B55,
+    0xC3015555,
+    0x82C604DB,
+    0x82C4025B,
+    0x83013857,
+    0xC2C4052B,
+    0x83008A9B,
+    0x82C40695,
+    0x82C406AA,
+    0xC3006AEA,  # 1960
+    0x82C60AB5,
+    0x82C404B6,
+    0x83004AAE,
+    0xC2C60A57,
+    0x82C40527,
+    0x82FE3726,
+    0x82C60D95,
+    0xC30076B5,
+    0x82C4056A,
+    0x82C609AD,  # 1970
+    0x830054DD,
+    0xC2C404AE,
+    0x82C40A4E,
+    0x83004D4D,
+    0x82C40D25,
+    0xC3008D59,
+    0x82C40B54,
+    0x82C60D6A,
+    0x8301695A,
+    0xC2C6095B,  # 1980
+    0x82C4049B,
+    0x83004A9B,
+    0x82C40A4B,
+    0xC300AB27,
+    0x82C406A5,
+    0x82C406D4,
+    0x83026B75,
+    0xC2C402B6,
+    0x82C6095B,
+    0x830054B7,  # 1990
+    0x82C40497,
+    0xC2C4064B,
+    0x82FE374A,
+    0x82C60EA5,
+    0x830086D9,
+    0xC2C605AD,
+    0x82C402B6,
+    0x8300596E,
+    0x82C4092E,
+    0xC2C40C96,  # 2000
+    0x83004E95,
+    0x82C40D4A,
+    0x82C60DA5,
+    0xC3002755,
+    0x82C4056C,
+    0x83027ABB,
+    0x82C4025D,
+    0xC2C4092D,
+    0x83005CAB,
+    0x82C40A95,  # 2010
+    0x82C40B4A,
+    0xC3013B4A,
+    0x82C60B55,
+    0x8300955D,
+    0x82C404BA,
+    0xC2C60A5B,
+    0x83005557,
+    0x82C4052B,
+    0x82C40A95,
+    0xC3004B95,  # 2020
+    0x82C406AA,
+    0x82C60AD5,
+    0x830026B5,
+    0xC2C404B6,
+    0x83006A6E,
+    0x82C60A57,
+    0x82C40527,
+    0xC2FE56A6,
+    0x82C60D93,
+    0x82C405AA,  # 2030
+    0x83003B6A,
+    0xC2C6096D,
+    0x8300B4AF,
+    0x82C404AE,
+    0x82C40A4D,
+    0xC3016D0D,
+    0x82C40D25,
+    0x82C40D52,
+    0x83005DD4,
+    0xC2C60B6A,  # 2040
+    0x82C6096D,
+    0x8300255B,
+    0x82C4049B,
+    0xC3007A57,
+    0x82C40A4B,
+    0x82C40B25,
+    0x83015B25,
+    0xC2C406D4,
+    0x82C60ADA,
+    0x830138B6,  # 2050
+)
+# Define range of years covered
+_START_YEAR = 1000
+_END_YEAR = 2050
+# The last supported lunar date, which is 2050/12/31 in the solar calendar.
+_LUNAR_END_DATE = (2050, 11, 18)
+# The days from the day before the start of the first solar year to the
+# start of the first lunar one (1000/2/13).
+_SOLAR_LUNAR_DAY_DIFF = 43
+
+# The days before the start of each month of a common and a leap solar year.
+_SOLAR_MONTH_OFFSETS = (
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334),
+    (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335),
+)
+
+# Everything below is calculated once from the table, for each year from
+# _START_YEAR on:
+# * the days from the start of the lunar year to the start of each of its
+#   regular months (counting the leap month before them), 12 entries per
+#   year,
+_MONTH_OFFSETS = array("H")
+# * the days from the start of the first lunar year to the start of the
+#   lunar year, followed by the start of the year after the last one,
+_LUNAR_YEAR_STARTS = array("i", (0,))
+# * the days from the start of the first solar year to the start of the
+#   solar year, followed by the start of the year after the last one.
+_SOLAR_YEAR_STARTS = array("i", (0,))
+for _data in _KOREAN_LUNAR_DATA:
+    _leap_month = (_data >> 12) & 0x0F
+    _offset = 0
+    for _month in range(1, 13):
+        _MONTH_OFFSETS.append(_offset)
+        _offset += 29 + ((_data >> (12 - _month)) & 0x01)
+        if _month == _leap_month:
+            _offset += 29 + ((_data >> 16) & 0x01)
+    _LUNAR_YEAR_STARTS.append(_LUNAR_YEAR_STARTS[-1] + ((_data >> 17) & 0x1FF))
+    _SOLAR_YEAR_STARTS.append(
+        _SOLAR_YEAR_STARTS[-1] + 365 + ((_data >> 30) & 0x01)
+    )
+del _data, _leap_month, _offset, _month
+
+
+def _korean_lunar_to_gre(year: int, month: int, day: int) -> date:
+    """
+    Calculate the solar date of a Korean lunar date, as package
+    `korean_lunar_calendar
+    <https://github.com/usingsky/korean_lunar_calendar_py/>`__ does.
+
+    The calendar is calculated once, when the module is imported: every
+    conversion is then a few lookups in arrays holding no state, which makes
+    it safe to use from any number of threads.
+
+    :param year:
+        The Korean lunar year(년).
+
+    :param month:
+        The Korean lunar month(월), not a leap one.
+
+    :param day:
+        The Korean lunar day(일).
+
+    :return:
+        The solar date. Before 1582 this is a Julian calendar date, as it was
+        used in Korea at the time.
+
+    :raise:
+        ValueError if the lunar date is out of the supported range (1000/1/1
+        to 2050/11/18) or does not exist.
+    """
+    idx = year - _START_YEAR
+    if (
+        not 0 <= idx <= _END_YEAR - _START_YEAR
+        or not 1 <= month <= 12
+        or not 1 <= day <= 29 + ((_KOREAN_LUNAR_DATA[idx] >> (12 - month)) & 1)
+        or (year, month, day) > _LUNAR_END_DATE
+    ):
+        raise ValueError(
+            f"Invalid or unsupported Korean lunar date {year}/{month}/{day}."
+        )
+
+    # The days from the day before the start of the first solar year.
+    days = (
+        _LUNAR_YEAR_STARTS[idx]
+        + _MONTH_OFFSETS[idx * 12 + month - 1]
+        + day
+        + _SOLAR_LUNAR_DAY_DIFF
+    )
+    if days > _SOLAR_YEAR_STARTS[idx + 1]:
+        year += 1
+        idx += 1
+    days -= _SOLAR_YEAR_STARTS[idx] + 1
+    month_offsets = _SOLAR_MONTH_OFFSETS[
+        (_KOREAN_LUNAR_DATA[idx] >> 30) & 0x01
+    ]
+    month = bisect_right(month_offsets, days)
+    return date(year, month, days - month_offsets[month - 1] + 1)
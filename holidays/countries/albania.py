@@ -10,14 +10,14 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, EASTER_WESTERN, easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAR, MAY, SEP, NOV, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.islamic import _islamic_to_gre
+from holidays.constants import JAN, MAR, MAY, SEP, NOV, DEC, MON
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class Albania(HolidayBase):
@@ -33,9 +33,9 @@ class Albania(HolidayBase):
 
         self[dt] = holiday_name
         if self.observed and self._is_weekend(dt):
-            dt += rd(weekday=MO(+1))
+            dt = _get_nth_weekday_from(1, MON, dt)
             while dt.year == holiday_date.year and dt in self:
-                dt += rd(days=+1)
+                dt += td(days=+1)
             self[dt] = f"{holiday_name} (Observed)"
 
         return dt
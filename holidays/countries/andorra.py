@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAR, MAY, JUL, AUG, SEP, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -47,22 +47,22 @@ class Andorra(HolidayBase):
         easter_sunday = easter(year)
 
         # Carnival.
-        self[easter_sunday + rd(days=-47)] = "Carnival"
+        self[easter_sunday + td(days=-47)] = "Carnival"
 
         # Constitution Day.
         self[date(year, MAR, 14)] = "Constitution Day"
 
         # Good Friday.
-        self[easter_sunday + rd(days=-2)] = "Good Friday"
+        self[easter_sunday + td(days=-2)] = "Good Friday"
 
         # Easter Sunday.
-        self[easter_sunday + rd(days=+1)] = "Easter Monday"
+        self[easter_sunday + td(days=+1)] = "Easter Monday"
 
         # Labour Day.
         self[date(year, MAY, 1)] = "Labour Day"
 
         # Whit Monday.
-        self[easter_sunday + rd(days=+50)] = "Whit Monday"
+        self[easter_sunday + td(days=+50)] = "Whit Monday"
 
         # Assumption Day.
         self[date(year, AUG, 15)] = "Assumption Day"
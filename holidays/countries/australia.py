@@ -10,13 +10,14 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, TU, WE, FR
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, MAR, APR, MAY, JUN, AUG, SEP, OCT, NOV
-from holidays.constants import DEC, SAT, SUN
+from holidays.constants import DEC, MON, TUE, WED, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -53,7 +54,7 @@ class Australia(HolidayBase):
         jan1 = date(year, JAN, 1)
         self[jan1] = name
         if self.observed and self._is_weekend(jan1):
-            self[jan1 + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, jan1)] = name + " (Observed)"
 
         # Australia Day
         jan26 = date(year, JAN, 26)
@@ -64,7 +65,9 @@ class Australia(HolidayBase):
                 name = "Australia Day"
             self[jan26] = name
             if self.observed and year >= 1946 and self._is_weekend(jan26):
-                self[jan26 + rd(weekday=MO)] = name + " (Observed)"
+                self[_get_nth_weekday_from(1, MON, jan26)] = (
+                    name + " (Observed)"
+                )
         elif year >= 1888 and self.subdiv != "SA":
             name = "Anniversary Day"
             self[jan26] = name
@@ -74,9 +77,9 @@ class Australia(HolidayBase):
             name = "Adelaide Cup"
             if year >= 2006:
                 # subject to proclamation ?!?!
-                self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+                self[_get_nth_weekday_of_month(2, MON, MAR, year)] = name
             else:
-                self[date(year, MAR, 1) + rd(weekday=MO(+3))] = name
+                self[_get_nth_weekday_of_month(3, MON, MAR, year)] = name
 
         # Canberra Day
         # Info from https://www.timeanddate.com/holidays/australia/canberra-day
@@ -86,20 +89,20 @@ class Australia(HolidayBase):
             if year >= 1913 and year <= 1957:
                 self[date(year, MAR, 12)] = name
             if year >= 1958 and year <= 2007:
-                self[date(year, MAR, 1) + rd(weekday=MO(+3))] = name
+                self[_get_nth_weekday_of_month(3, MON, MAR, year)] = name
             if year >= 2008 and year != 2012:
-                self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+                self[_get_nth_weekday_of_month(2, MON, MAR, year)] = name
             if year == 2012:
                 self[date(year, MAR, 12)] = name
 
         # Easter
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-2)] = "Good Friday"
         if self.subdiv in {"ACT", "NSW", "NT", "QLD", "SA", "VIC"}:
-            self[easter_date + rd(days=-1)] = "Easter Saturday"
+            self[easter_date + td(days=-1)] = "Easter Saturday"
         if self.subdiv in {"ACT", "NSW", "QLD", "VIC"}:
             self[easter_date] = "Easter Sunday"
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         # Anzac Day
         if year > 1920:
@@ -111,7 +114,9 @@ class Australia(HolidayBase):
                     "WA",
                     "NT",
                 }:
-                    self[apr25 + rd(weekday=MO)] = name + " (Observed)"
+                    self[_get_nth_weekday_from(1, MON, apr25)] = (
+                        name + " (Observed)"
+                    )
                 elif apr25.weekday() == SUN and self.subdiv in {
                     "ACT",
                     "NT",
@@ -119,7 +124,9 @@ class Australia(HolidayBase):
                     "SA",
                     "WA",
                 }:
-                    self[apr25 + rd(weekday=MO)] = name + " (Observed)"
+                    self[_get_nth_weekday_from(1, MON, apr25)] = (
+                        name + " (Observed)"
+                    )
 
         # Western Australia Day
         if self.subdiv == "WA" and year > 1832:
@@ -127,7 +134,7 @@ class Australia(HolidayBase):
                 name = "Western Australia Day"
             else:
                 name = "Foundation Day"
-            self[date(year, JUN, 1) + rd(weekday=MO(+1))] = name
+            self[_get_nth_weekday_of_month(1, MON, JUN, year)] = name
 
         # Sovereign's Birthday
         if 1952 <= year <= 2022:
@@ -139,16 +146,16 @@ class Australia(HolidayBase):
                 if year == 2012:
                     self[date(year, JUN, 11)] = "Queen's Diamond Jubilee"
                 if year < 2016 and year != 2012:
-                    dt = date(year, JUN, 1) + rd(weekday=MO(+2))
+                    dt = _get_nth_weekday_of_month(2, MON, JUN, year)
                     self[dt] = name
                 else:
-                    dt = date(year, OCT, 1) + rd(weekday=MO)
+                    dt = _get_nth_weekday_of_month(1, MON, OCT, year)
                     self[dt] = name
             elif self.subdiv == "WA":
                 # by proclamation ?!?!
-                self[date(year, OCT, 1) + rd(weekday=MO(-1))] = name
+                self[_get_nth_weekday_from(-1, MON, date(year, OCT, 1))] = name
             elif self.subdiv in {"ACT", "NSW", "NT", "SA", "TAS", "VIC"}:
-                dt = date(year, JUN, 1) + rd(weekday=MO(+2))
+                dt = _get_nth_weekday_of_month(2, MON, JUN, year)
                 self[dt] = name
         elif year > 1911:
             self[date(year, JUN, 3)] = name  # George V
@@ -158,39 +165,39 @@ class Australia(HolidayBase):
         # Picnic Day
         if self.subdiv == "NT":
             name = "Picnic Day"
-            self[date(year, AUG, 1) + rd(weekday=MO)] = name
+            self[_get_nth_weekday_of_month(1, MON, AUG, year)] = name
 
         # Bank Holiday
         if self.subdiv == "NSW":
             if year >= 1912:
                 name = "Bank Holiday"
-                self[date(year, 8, 1) + rd(weekday=MO)] = name
+                self[_get_nth_weekday_from(1, MON, date(year, 8, 1))] = name
 
         # Labour Day
         name = "Labour Day"
         if self.subdiv in {"ACT", "NSW", "SA"}:
-            self[date(year, OCT, 1) + rd(weekday=MO)] = name
+            self[_get_nth_weekday_of_month(1, MON, OCT, year)] = name
         elif self.subdiv == "WA":
-            self[date(year, MAR, 1) + rd(weekday=MO)] = name
+            self[_get_nth_weekday_of_month(1, MON, MAR, year)] = name
         elif self.subdiv == "VIC":
-            self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+            self[_get_nth_weekday_of_month(2, MON, MAR, year)] = name
         elif self.subdiv == "QLD":
             if 2013 <= year <= 2015:
-                self[date(year, OCT, 1) + rd(weekday=MO)] = name
+                self[_get_nth_weekday_of_month(1, MON, OCT, year)] = name
             else:
-                self[date(year, MAY, 1) + rd(weekday=MO)] = name
+                self[_get_nth_weekday_of_month(1, MON, MAY, year)] = name
         elif self.subdiv == "NT":
             name = "May Day"
-            self[date(year, MAY, 1) + rd(weekday=MO)] = name
+            self[_get_nth_weekday_of_month(1, MON, MAY, year)] = name
         elif self.subdiv == "TAS":
             name = "Eight Hours Day"
-            self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+            self[_get_nth_weekday_of_month(2, MON, MAR, year)] = name
 
         # Family & Community Day
         if self.subdiv == "ACT":
             name = "Family & Community Day"
             if 2007 <= year <= 2009:
-                self[date(year, NOV, 1) + rd(weekday=TU)] = name
+                self[_get_nth_weekday_of_month(1, TUE, NOV, year)] = name
             elif year == 2010:
                 # first Monday of the September/October school holidays
                 # moved to the second Monday if this falls on Labour day
@@ -216,7 +223,7 @@ class Australia(HolidayBase):
         if self.subdiv == "ACT":
             name = "Reconciliation Day"
             if year >= 2018:
-                self[date(year, 5, 27) + rd(weekday=MO)] = name
+                self[_get_nth_weekday_from(1, MON, date(year, 5, 27))] = name
 
         if self.subdiv == "VIC":
             # Grand Final Day
@@ -229,10 +236,14 @@ class Australia(HolidayBase):
                 # Rescheduled due to COVID-19
                 self[date(year, SEP, 24)] = "Grand Final Day"
             elif year >= 2015:
-                self[date(year, SEP, 24) + rd(weekday=FR)] = "Grand Final Day"
+                self[
+                    _get_nth_weekday_from(1, FRI, date(year, SEP, 24))
+                ] = "Grand Final Day"
 
             # Melbourne Cup
-            self[date(year, NOV, 1) + rd(weekday=TU)] = "Melbourne Cup"
+            self[
+                _get_nth_weekday_of_month(1, TUE, NOV, year)
+            ] = "Melbourne Cup"
 
         # The Royal Queensland Show (Ekka)
         # The Show starts on the first Friday of August - providing this is
@@ -246,7 +257,11 @@ class Australia(HolidayBase):
                 self[date(year, OCT, 29)] = name
             else:
                 self[
-                    date(year, AUG, 5) + rd(weekday=FR) + rd(weekday=WE)
+                    _get_nth_weekday_from(
+                        1,
+                        WED,
+                        _get_nth_weekday_from(1, FRI, date(year, AUG, 5)),
+                    )
                 ] = name
 
         # Christmas Day
@@ -10,13 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT
 from holidays.constants import NOV, DEC
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class Azerbaijan(HolidayBase):
@@ -28,11 +27,11 @@ class Azerbaijan(HolidayBase):
 
     def _populate(self, year: int) -> None:
         def _add_observed(hol_date: date, hol_name: str) -> None:
-            next_workday = hol_date + rd(days=+1)
+            next_workday = hol_date + td(days=+1)
             while next_workday.year == year and (
                 self._is_weekend(next_workday) or self.get(next_workday)
             ):
-                next_workday += rd(days=+1)
+                next_workday += td(days=+1)
             _add_holiday(next_workday, f"{hol_name} (Observed)")
 
         def _add_holiday(hol_date: date, hol_name: str) -> None:
@@ -149,13 +148,13 @@ class Azerbaijan(HolidayBase):
                         for date_obs in dates_obs[yr]:
                             _add_holiday(date(yr, *date_obs), name)
                             _add_holiday(
-                                date(yr, *date_obs) + rd(days=+1), name
+                                date(yr, *date_obs) + td(days=+1), name
                             )
                     else:
                         for dt in _islamic_to_gre(yr, hmonth, hday):
                             _add_holiday(dt, f"{name}* (*estimated)")
                             _add_holiday(
-                                dt + rd(days=+1), f"{name}* (*estimated)"
+                                dt + td(days=+1), f"{name}* (*estimated)"
                             )
 
         """
@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUL, AUG, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -38,16 +38,16 @@ class Belgium(HolidayBase):
         self[easter_date] = "Pasen"
 
         # Second easter day
-        self[easter_date + rd(days=+1)] = "Paasmaandag"
+        self[easter_date + td(days=+1)] = "Paasmaandag"
 
         # Ascension day
-        self[easter_date + rd(days=+39)] = "O.L.H. Hemelvaart"
+        self[easter_date + td(days=+39)] = "O.L.H. Hemelvaart"
 
         # Pentecost
-        self[easter_date + rd(days=+49)] = "Pinksteren"
+        self[easter_date + td(days=+49)] = "Pinksteren"
 
         # Pentecost monday
-        self[easter_date + rd(days=+50)] = "Pinkstermaandag"
+        self[easter_date + td(days=+50)] = "Pinkstermaandag"
 
         # International Workers' Day
         self[date(year, MAY, 1)] = "Dag van de Arbeid"
@@ -11,13 +11,13 @@
 #  Copyright: Kateryna Golovanova <kate@kgthreads.com>, 2022
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, easter
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import DEC, JAN, JUN, MAR, MAY, NOV, SUN
+from holidays.calendars.islamic import _islamic_to_gre
+from holidays.constants import JAN, MAR, MAY, JUN, NOV, DEC, SUN
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class BosniaAndHerzegovina(HolidayBase):
@@ -41,15 +41,15 @@ class BosniaAndHerzegovina(HolidayBase):
         self[date(year, JAN, 2)] = "Drugi dan Nove Godine"
 
         if self.observed and date(year, JAN, 1).weekday() == SUN:
-            self[date(year, JAN, 1) + rd(days=+2)] = "Treći dan Nove Godine"
+            self[date(year, JAN, 1) + td(days=+2)] = "Treći dan Nove Godine"
 
         # Labor Day.
         may_1 = date(year, MAY, 1)
         self[may_1] = "Dan rada"
-        self[may_1 + rd(days=+1)] = "Drugi dan Dana rada"
+        self[may_1 + td(days=+1)] = "Drugi dan Dana rada"
 
         if self.observed and may_1.weekday() == SUN:
-            self[may_1 + rd(days=+2)] = "Treći dan Dana rada"
+            self[may_1 + td(days=+2)] = "Treći dan Dana rada"
 
         if self.subdiv == "FBiH":
             # Independence Day.
@@ -57,22 +57,22 @@ class BosniaAndHerzegovina(HolidayBase):
 
             easter_date = easter(year)
             # Catholic Good Friday.
-            self[easter_date + rd(days=-2)] = "Veliki Petak (Katolički)"
+            self[easter_date + td(days=-2)] = "Veliki Petak (Katolički)"
 
             # Catholic Easter.
             self[easter_date] = "Uskrs (Katolički)"
-            self[easter_date + rd(days=+1)] = "Uskrsni ponedjeljak (Katolički)"
+            self[easter_date + td(days=+1)] = "Uskrsni ponedjeljak (Katolički)"
 
             # Corpus Cristi.
             self[
-                easter_date + rd(days=+60)
+                easter_date + td(days=+60)
             ] = "Tijelovo (Tijelo i Krv Kristova)"
 
             # Eid al-Fitr.
             # Date of observance is announced yearly, this is an estimate.
             for dt in _islamic_to_gre(year, 10, 1):
                 self[dt] = "Ramazanski Bajram"
-                self[dt + rd(days=+1)] = "Drugi Dan Ramazanski Bajram"
+                self[dt + td(days=+1)] = "Drugi Dan Ramazanski Bajram"
 
             # Eid ul-Adha.
             # Date of observance is announced yearly, this is an estimate.
@@ -80,7 +80,7 @@ class BosniaAndHerzegovina(HolidayBase):
             for dt in _islamic_to_gre(year, 12, 10):
                 self[dt] = name
                 for d in range(1, 4):
-                    self[dt + rd(days=+d)] = name
+                    self[dt + td(days=+d)] = name
 
             # Islamic New Year.
             for dt in _islamic_to_gre(year, 1, 1):
@@ -116,12 +116,12 @@ class BosniaAndHerzegovina(HolidayBase):
 
             easter_date = easter(year, method=EASTER_ORTHODOX)
             # Orthodox Good Friday.
-            self[easter_date + rd(days=-2)] = "Veliki Petak (Pravoslavni)"
+            self[easter_date + td(days=-2)] = "Veliki Petak (Pravoslavni)"
 
             # Orthodox Easter.
             self[easter_date] = "Vaskrs (Pravoslavni)"
             self[
-                easter_date + rd(days=+1)
+                easter_date + td(days=+1)
             ] = "Uskrsni ponedjeljak (Pravoslavni)"
 
             # Victory Day.
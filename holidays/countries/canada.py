@@ -10,13 +10,15 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, SU
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC, FRI, SUN
+from holidays.constants import OCT, NOV, DEC, MON, FRI, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -47,9 +49,9 @@ class Canada(HolidayBase):
     @staticmethod
     def _get_nearest_monday(d: date) -> date:
         if d.weekday() < FRI:
-            return d + rd(weekday=MO(-1))
+            return _get_nth_weekday_from(-1, MON, d)
         else:
-            return d + rd(weekday=MO)
+            return _get_nth_weekday_from(1, MON, d)
 
     def _populate(self, year):
         super()._populate(year)
@@ -61,7 +63,9 @@ class Canada(HolidayBase):
         name = "New Year's Day"
         self[date(year, JAN, 1)] = name
         if self.observed and self._is_weekend(date(year, JAN, 1)):
-            self[date(year, JAN, 1) + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_of_month(1, MON, JAN, year)] = (
+                name + " (Observed)"
+            )
 
         # Family Day / Louis Riel Day (MB) / Islander Day (PE)
         # / Heritage Day (NS, YT)
@@ -71,21 +75,27 @@ class Canada(HolidayBase):
             or (self.subdiv == "ON" and year >= 2008)
             or (self.subdiv == "NB" and year >= 2018)
         ):
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = "Family Day"
+            self[_get_nth_weekday_of_month(3, MON, FEB, year)] = "Family Day"
         elif self.subdiv == "BC":
             if 2013 <= year <= 2018:
-                self[date(year, FEB, 1) + rd(weekday=MO(+2))] = "Family Day"
+                self[
+                    _get_nth_weekday_of_month(2, MON, FEB, year)
+                ] = "Family Day"
             elif year > 2018:
-                self[date(year, FEB, 1) + rd(weekday=MO(+3))] = "Family Day"
+                self[
+                    _get_nth_weekday_of_month(3, MON, FEB, year)
+                ] = "Family Day"
         elif self.subdiv == "MB" and year >= 2008:
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = "Louis Riel Day"
+            self[
+                _get_nth_weekday_of_month(3, MON, FEB, year)
+            ] = "Louis Riel Day"
         elif self.subdiv == "PE" and year >= 2010:
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = "Islander Day"
+            self[_get_nth_weekday_of_month(3, MON, FEB, year)] = "Islander Day"
         elif self.subdiv == "PE" and year == 2009:
-            self[date(year, FEB, 1) + rd(weekday=MO(+2))] = "Islander Day"
+            self[_get_nth_weekday_of_month(2, MON, FEB, year)] = "Islander Day"
         elif self.subdiv == "NS" and year >= 2015:
             # http://novascotia.ca/lae/employmentrights/NovaScotiaHeritageDay.asp
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = "Heritage Day"
+            self[_get_nth_weekday_of_month(3, MON, FEB, year)] = "Heritage Day"
         elif self.subdiv == "YT" and year >= 1974:
             # start date?
             # https://www.britannica.com/topic/Heritage-Day-Canadian-holiday
@@ -95,12 +105,7 @@ class Canada(HolidayBase):
             # http://heritageyukon.ca/programs/heritage-day
             # https://en.wikipedia.org/wiki/Family_Day_(Canada)#Yukon_Heritage_Day
             # Friday before the last Sunday in February
-            dt = (
-                date(year, MAR, 1)
-                + rd(days=-1)
-                + rd(weekday=SU(-1))
-                + rd(days=-2)
-            )
+            dt = _get_last_weekday_of_month(SUN, FEB, year) + td(days=-2)
             self[dt] = "Heritage Day"
 
         # St. Patrick's Day
@@ -111,9 +116,9 @@ class Canada(HolidayBase):
 
         easter_date = easter(year)
         # Good Friday
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-2)] = "Good Friday"
         # Easter Monday
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         # St. George's Day
         if self.subdiv == "NL" and year >= 1990:
@@ -128,7 +133,7 @@ class Canada(HolidayBase):
 
         # Victoria Day / National Patriots' Day (QC)
         if year >= 1953:
-            dt = date(year, MAY, 24) + rd(weekday=MO(-1))
+            dt = _get_nth_weekday_from(-1, MON, date(year, MAY, 24))
             if self.subdiv not in {"NB", "NS", "PE", "NL", "QC"}:
                 self[dt] = "Victoria Day"
             elif self.subdiv == "QC":
@@ -144,7 +149,7 @@ class Canada(HolidayBase):
             dt = date(year, JUN, 24)
             self[dt] = name
             if self.observed and dt.weekday() == SUN:
-                self[dt + rd(days=+1)] = name + " (Observed)"
+                self[dt + td(days=+1)] = name + " (Observed)"
 
         # Discovery Day
         if self.subdiv == "NL" and year >= 1997:
@@ -152,7 +157,9 @@ class Canada(HolidayBase):
             dt = self._get_nearest_monday(date(year, JUN, 24))
             self[dt] = "Discovery Day"
         elif self.subdiv == "YT" and year >= 1912:
-            self[date(year, AUG, 1) + rd(weekday=MO(+3))] = "Discovery Day"
+            self[
+                _get_nth_weekday_of_month(3, MON, AUG, year)
+            ] = "Discovery Day"
 
         # Canada Day / Memorial Day (NL)
         if year >= 1983:
@@ -162,7 +169,7 @@ class Canada(HolidayBase):
         dt = date(year, JUL, 1)
         self[dt] = name
         if year >= 1879 and self.observed and self._is_weekend(dt):
-            self[dt + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, dt)] = name + " (Observed)"
 
         # Nunavut Day
         if self.subdiv == "NU":
@@ -171,29 +178,37 @@ class Canada(HolidayBase):
                 dt = date(year, JUL, 9)
                 self[dt] = name
                 if self.observed and dt.weekday() == SUN:
-                    self[dt + rd(days=+1)] = name + " (Observed)"
+                    self[dt + td(days=+1)] = name + " (Observed)"
             elif year == 2000:
                 self[date(2000, APR, 1)] = name
 
         # Civic Holiday
         if year >= 1900 and self.subdiv in {"MB", "NT", "ON"}:
-            self[date(year, AUG, 1) + rd(weekday=MO)] = "Civic Holiday"
+            self[
+                _get_nth_weekday_of_month(1, MON, AUG, year)
+            ] = "Civic Holiday"
         elif year >= 1974 and self.subdiv == "AB":
             # https://en.wikipedia.org/wiki/Civic_Holiday#Alberta
-            self[date(year, AUG, 1) + rd(weekday=MO)] = "Heritage Day"
+            self[_get_nth_weekday_of_month(1, MON, AUG, year)] = "Heritage Day"
         elif year >= 1974 and self.subdiv == "BC":
             # https://en.wikipedia.org/wiki/Civic_Holiday
-            self[date(year, AUG, 1) + rd(weekday=MO)] = "British Columbia Day"
+            self[
+                _get_nth_weekday_of_month(1, MON, AUG, year)
+            ] = "British Columbia Day"
         elif year >= 1900 and self.subdiv == "NB":
             # https://en.wikipedia.org/wiki/Civic_Holiday
-            self[date(year, AUG, 1) + rd(weekday=MO)] = "New Brunswick Day"
+            self[
+                _get_nth_weekday_of_month(1, MON, AUG, year)
+            ] = "New Brunswick Day"
         elif year >= 1900 and self.subdiv == "SK":
             # https://en.wikipedia.org/wiki/Civic_Holiday
-            self[date(year, AUG, 1) + rd(weekday=MO)] = "Saskatchewan Day"
+            self[
+                _get_nth_weekday_of_month(1, MON, AUG, year)
+            ] = "Saskatchewan Day"
 
         # Labour Day
         if year >= 1894:
-            self[date(year, SEP, 1) + rd(weekday=MO)] = "Labour Day"
+            self[_get_nth_weekday_of_month(1, MON, SEP, year)] = "Labour Day"
 
         # Funeral of Queen Elizabeth II
         # https://www.narcity.com/provinces-territories-will-have-a-day-off-monday-mourn-queen
@@ -224,7 +239,9 @@ class Canada(HolidayBase):
                 # https://books.google.ca/books?id=KcwlQsmheG4C&pg=RA1-PA1940&lpg=RA1-PA1940&dq=canada+thanksgiving+1935&source=bl&ots=j4qYrcfGuY&sig=gxXeAQfXVsOF9fOwjSMswPHJPpM&hl=en&sa=X&ved=0ahUKEwjO0f3J2PjOAhVS4mMKHRzKBLAQ6AEIRDAG#v=onepage&q=canada%20thanksgiving%201935&f=false
                 self[date(1935, OCT, 25)] = "Thanksgiving"
             else:
-                self[date(year, OCT, 1) + rd(weekday=MO(+2))] = "Thanksgiving"
+                self[
+                    _get_nth_weekday_of_month(2, MON, OCT, year)
+                ] = "Thanksgiving"
 
         # Remembrance Day
         if year >= 1931 and self.subdiv not in {"ON", "QC"}:
@@ -236,21 +253,21 @@ class Canada(HolidayBase):
                 and dt.weekday() == SUN
                 and self.subdiv in {"NS", "NL", "NT", "PE", "SK"}
             ):
-                self[dt + rd(weekday=MO)] = name + " (Observed)"
+                self[_get_nth_weekday_from(1, MON, dt)] = name + " (Observed)"
 
         # Christmas Day
         name = "Christmas Day"
         dt = date(year, DEC, 25)
         self[dt] = name
         if self.observed and self._is_weekend(dt):
-            self[dt + rd(days=+2)] = name + " (Observed)"
+            self[dt + td(days=+2)] = name + " (Observed)"
 
         # Boxing Day
         name = "Boxing Day"
         dt = date(year, DEC, 26)
         self[dt] = name
         if self.observed and self._is_weekend(dt):
-            self[dt + rd(days=+2)] = name + " (Observed)"
+            self[dt + td(days=+2)] = name + " (Observed)"
 
 
 class CA(Canada):
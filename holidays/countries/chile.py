@@ -9,19 +9,21 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date, datetime
+from datetime import date
+from datetime import timedelta as td
 
-from dateutil import tz
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
-from pymeeus.Epoch import Epoch
-from pymeeus.Sun import Sun
 
+from holidays.calendars.astronomy import _get_equinox_solstice_date
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
-from holidays.constants import TUE, WED, THU, FRI, SAT, SUN
+from holidays.constants import MON, TUE, WED, THU, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
 
+# Chile Standard Time (winter), in hours from UTC.
+CLT = -4
+
 
 class Chile(HolidayBase):
     """
@@ -71,25 +73,25 @@ class Chile(HolidayBase):
         # Holy Week (Law 2.977)
         easter_date = easter(year)
         self[
-            easter_date + rd(days=-2)
+            easter_date + td(days=-2)
         ] = "Semana Santa (Viernes Santo) [Good Friday)]"
         self[
-            easter_date + rd(days=-1)
+            easter_date + td(days=-1)
         ] = "Semana Santa (Sábado Santo) [Good Saturday)]"
 
         # Ascension
         if year <= 1967:
             self[
-                easter_date + rd(days=+39)
+                easter_date + td(days=+39)
             ] = "Ascensión del Señor [Ascension of Jesus]"
 
         # Corpus Christi
         if year <= 1967 or 1987 <= year <= 2006:
             # Law 19.668
             if year <= 1999:
-                dt = easter_date + rd(days=+60)
+                dt = easter_date + td(days=+60)
             else:
-                dt = easter_date + rd(days=+57)
+                dt = easter_date + td(days=+57)
             self[dt] = "Corpus Christi [Corpus Christi]"
 
         # Labour Day (Law 2.200, renamed with Law 18.018)
@@ -107,15 +109,9 @@ class Chile(HolidayBase):
         if year == 2021:
             self[date(year, JUN, 21)] = name
         elif year >= 2022:
-            epoch = Sun.get_equinox_solstice(year, target="summer")
-            # Received date for UTC timezone needs to be adjusted
-            # to match Chile's timezone
+            # The June solstice, in Chile's timezone
             # https://www.feriadoschilenos.cl/#DiaNacionalDeLosPueblosIndigenasII
-            equinox = map(int, Epoch(epoch).get_full_date())
-            adjusted_date = datetime(*equinox, tzinfo=tz.UTC).astimezone(
-                tz.gettz("America/Santiago")
-            )
-            self[date(year, JUN, adjusted_date.day)] = name
+            self[_get_equinox_solstice_date(year, "summer", CLT)] = name
 
         # Saint Peter and Saint Paul (Law 16.840, Law 18.432)
         if year <= 1967 or year >= 1986:
@@ -123,9 +119,9 @@ class Chile(HolidayBase):
             if year >= 2000:
                 # floating Monday holiday (Law 19.668)
                 if dt.weekday() < FRI:
-                    dt += rd(weekday=MO(-1))
+                    dt = _get_nth_weekday_from(-1, MON, dt)
                 elif dt.weekday() == FRI:
-                    dt += rd(weekday=MO)
+                    dt = _get_nth_weekday_from(1, MON, dt)
             self[dt] = "San Pedro y San Pablo [Saint Peter and Saint Paul]"
 
         # Day of Virgin of Carmen (Law 20.148)
@@ -147,7 +143,7 @@ class Chile(HolidayBase):
         # Day of National Unity (Law 19.588, Law 19.793)
         elif 1999 <= year <= 2001:
             self[
-                date(year, SEP, 1) + rd(weekday=MO)
+                _get_nth_weekday_of_month(1, MON, SEP, year)
             ] = "Día de la Unidad Nacional [Day of National Unity]"
 
         # National Holiday Friday preceding Independence Day (Law 20.983)
@@ -184,9 +180,9 @@ class Chile(HolidayBase):
             if year >= 2000:
                 # floating Monday holiday (Law 19.668)
                 if dt.weekday() < FRI:
-                    dt += rd(weekday=MO(-1))
+                    dt = _get_nth_weekday_from(-1, MON, dt)
                 elif dt.weekday() == FRI:
-                    dt += rd(weekday=MO)
+                    dt = _get_nth_weekday_from(1, MON, dt)
                 if year <= 2019:
                     # Day of the Meeting of Two Worlds (Law 3.810)
                     name = (
@@ -207,9 +203,9 @@ class Chile(HolidayBase):
             # if it falls on a Tuesday, or to the following Friday
             # if it falls on a Wednesday (Law 20.299)
             if dt.weekday() == WED:
-                dt += rd(days=+2)
+                dt += td(days=+2)
             elif dt.weekday() == TUE:
-                dt += rd(days=-4)
+                dt += td(days=-4)
             self[dt] = (
                 "Día Nacional de las Iglesias Evangélicas y Protestantes"
                 " [Reformation Day]"
@@ -10,12 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAY, JUL, OCT, DEC, SUN
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, MAY, JUL, OCT, DEC, MON, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -46,7 +47,9 @@ class Cuba(HolidayBase):
             and self.observed
             and date(year, JAN, 1).weekday() == SUN
         ):
-            self[date(year, JAN, 1) + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_of_month(1, MON, JAN, year)] = (
+                name + " (Observed)"
+            )
 
         # Granted in 2007 decree.
         if year > 2007:
@@ -57,12 +60,14 @@ class Cuba(HolidayBase):
         #   https://bit.ly/3v6bM18
         # Permanently granted in 2013 decree for 2014 and onwards.
         if year >= 2012:
-            self[easter(year) + rd(days=-2)] = "Viernes Santo [Good Friday]"
+            self[easter(year) + td(days=-2)] = "Viernes Santo [Good Friday]"
 
         name = "Día Internacional de los Trabajadores [Labour Day]"
         self[date(year, MAY, 1)] = name
         if self.observed and date(year, MAY, 1).weekday() == SUN:
-            self[date(year, MAY, 1) + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_of_month(1, MON, MAY, year)] = (
+                name + " (Observed)"
+            )
 
         self[date(year, JUL, 25)] = (
             "Conmemoración del asalto a Moncada "
@@ -81,7 +86,9 @@ class Cuba(HolidayBase):
         name = "Inicio de las Guerras de Independencia [Independence Day]"
         self[date(year, OCT, 10)] = name
         if self.observed and date(year, OCT, 10).weekday() == SUN:
-            self[date(year, OCT, 10) + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, date(year, OCT, 10))] = (
+                name + " (Observed)"
+            )
 
         # In 1969, Christmas was cancelled for the sugar harvest but then was
         # cancelled for good:
@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUL, SEP, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -36,8 +36,8 @@ class Czechia(HolidayBase):
 
         easter_date = easter(year)
         if year <= 1951 or year >= 2016:
-            self[easter_date + rd(days=-2)] = "Velký pátek"
-        self[easter_date + rd(days=+1)] = "Velikonoční pondělí"
+            self[easter_date + td(days=-2)] = "Velký pátek"
+        self[easter_date + td(days=+1)] = "Velikonoční pondělí"
 
         if year >= 1951:
             self[date(year, MAY, 1)] = "Svátek práce"
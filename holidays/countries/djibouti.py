@@ -10,12 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAY, JUN, FRI, SAT
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 # Since Djibouti share most of it's holidays with other muslim countries,
 # this class is just a copy of Egypt's.
@@ -77,7 +76,7 @@ class Djibouti(HolidayBase):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Eid al-Fitr")
                 _add_holiday(
-                    hol_date + rd(days=+1), "Eid al-Fitr deuxième jour"
+                    hol_date + td(days=+1), "Eid al-Fitr deuxième jour"
                 )
 
         # Arafat & Eid al-Adha - Scarfice Festive
@@ -86,9 +85,9 @@ class Djibouti(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 12, 9):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Arafat")
-                _add_holiday(hol_date + rd(days=+1), "Eid al-Adha")
+                _add_holiday(hol_date + td(days=+1), "Eid al-Adha")
                 _add_holiday(
-                    hol_date + rd(days=+2), "Eid al-Adha deuxième jour"
+                    hol_date + td(days=+2), "Eid al-Adha deuxième jour"
                 )
 
         # Islamic New Year - (hijari_year, 1, 1)
@@ -10,13 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, FEB, MAY, JUN, AUG, SEP, NOV, DEC, TUE
-from holidays.constants import WED, THU, FRI, SUN
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import JAN, FEB, MAY, JUN, AUG, SEP, NOV, DEC, MON
+from holidays.constants import TUE, WED, THU, FRI, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -33,9 +33,9 @@ class DominicanRepublic(HolidayBase):
         # Law No. 139-97 - Holidays Dominican Republic - Jun 27, 1997
         if holiday >= date(1997, JUN, 27):
             if holiday.weekday() in {TUE, WED}:
-                holiday += rd(weekday=MO(-1))
+                holiday = _get_nth_weekday_from(-1, MON, holiday)
             elif holiday.weekday() in latest_days:
-                holiday += rd(weekday=MO(+1))
+                holiday = _get_nth_weekday_from(1, MON, holiday)
         return holiday
 
     def _populate(self, year):
@@ -61,7 +61,7 @@ class DominicanRepublic(HolidayBase):
         easter_date = easter(year)
 
         # Good Friday
-        self[easter_date + rd(days=-2)] = "Viernes Santo [Good Friday]"
+        self[easter_date + td(days=-2)] = "Viernes Santo [Good Friday]"
 
         # Labor Day
         labor_day = self.__change_day_by_law(
@@ -71,7 +71,7 @@ class DominicanRepublic(HolidayBase):
 
         # Feast of Corpus Christi
         self[
-            easter_date + rd(days=+60)
+            easter_date + td(days=+60)
         ] = "Corpus Christi [Feast of Corpus Christi]"
 
         # Restoration Day
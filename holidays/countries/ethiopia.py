@@ -11,13 +11,13 @@
 
 from calendar import isleap
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter, EASTER_ORTHODOX
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAR, MAY, SEP
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 # Ethiopian holidays are estimated: it is common for the day to be pushed
 # if falls in a weekend, although not a rule that can be implemented.
@@ -66,7 +66,7 @@ class Ethiopia(HolidayBase):
 
         # Ethiopian Good Friday
         easter_date = easter(year, EASTER_ORTHODOX)
-        self[easter_date + rd(days=-2)] = "ስቅለት/Ethiopian Good Friday"
+        self[easter_date + td(days=-2)] = "ስቅለት/Ethiopian Good Friday"
 
         # Ethiopian  Easter - Orthodox Easter
         self[easter_date] = "ፋሲካ/Ethiopian Easter"
@@ -108,12 +108,12 @@ class Ethiopia(HolidayBase):
         # date of observance is announced yearly
         for date_obs in _islamic_to_gre(year, 12, 9):
             hol_date = date_obs
-            self[hol_date + rd(days=+1)] = "አረፋ/Eid-Al-Adha"
+            self[hol_date + td(days=+1)] = "አረፋ/Eid-Al-Adha"
 
         # Prophet Muhammad's Birthday - (hijari_year, 3, 12)
         for date_obs in _islamic_to_gre(year, 3, 12):
             hol_date = date_obs
-            self[hol_date + rd(days=+1)] = "መውሊድ/Prophet Muhammad's Birthday"
+            self[hol_date + td(days=+1)] = "መውሊድ/Prophet Muhammad's Birthday"
 
     # Ethiopian leap years are coincident with leap years in the Gregorian
     # calendar until the end of February 2100. It starts earlier from new year
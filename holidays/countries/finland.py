@@ -10,12 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import FR, SA
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAY, JUN, OCT, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import JAN, MAY, JUN, OCT, DEC, FRI, SAT
 from holidays.holiday_base import HolidayBase
 
 
@@ -33,21 +33,27 @@ class Finland(HolidayBase):
 
         self[date(year, JAN, 1)] = "Uudenvuodenpäivä"
         self[date(year, JAN, 6)] = "Loppiainen"
-        self[easter_date + rd(days=-2)] = "Pitkäperjantai"
+        self[easter_date + td(days=-2)] = "Pitkäperjantai"
         self[easter_date] = "Pääsiäispäivä"
-        self[easter_date + rd(days=+1)] = "2. pääsiäispäivä"
+        self[easter_date + td(days=+1)] = "2. pääsiäispäivä"
         self[date(year, MAY, 1)] = "Vappu"
-        self[easter_date + rd(days=+39)] = "Helatorstai"
-        self[easter_date + rd(days=+49)] = "Helluntaipäivä"
-        self[date(year, JUN, 20) + rd(weekday=SA)] = "Juhannuspäivä"
-        self[date(year, OCT, 31) + rd(weekday=SA)] = "Pyhäinpäivä"
+        self[easter_date + td(days=+39)] = "Helatorstai"
+        self[easter_date + td(days=+49)] = "Helluntaipäivä"
+        self[
+            _get_nth_weekday_from(1, SAT, date(year, JUN, 20))
+        ] = "Juhannuspäivä"
+        self[
+            _get_nth_weekday_from(1, SAT, date(year, OCT, 31))
+        ] = "Pyhäinpäivä"
         self[date(year, DEC, 6)] = "Itsenäisyyspäivä"
         self[date(year, DEC, 25)] = "Joulupäivä"
         self[date(year, DEC, 26)] = "Tapaninpäivä"
 
         # Juhannusaatto (Midsummer Eve) and Jouluaatto (Christmas Eve) are not
         # official holidays, but are de facto.
-        self[date(year, JUN, 19) + rd(weekday=FR)] = "Juhannusaatto"
+        self[
+            _get_nth_weekday_from(1, FRI, date(year, JUN, 19))
+        ] = "Juhannusaatto"
         self[date(year, DEC, 24)] = "Jouluaatto"
 
 
@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -87,17 +87,17 @@ class France(HolidayBase):
             "Martinique",
             "Polynésie Française",
         }:
-            self[easter_date + rd(days=-2)] = "Vendredi saint"
+            self[easter_date + td(days=-2)] = "Vendredi saint"
 
         if self.subdiv == "Alsace-Moselle":
             self[date(year, DEC, 26)] = "Deuxième jour de Noël"
 
         if year >= 1886:
-            self[easter_date + rd(days=+1)] = "Lundi de Pâques"
-            self[easter_date + rd(days=+50)] = "Lundi de Pentecôte"
+            self[easter_date + td(days=+1)] = "Lundi de Pâques"
+            self[easter_date + td(days=+50)] = "Lundi de Pentecôte"
 
         if year >= 1802:
-            self[easter_date + rd(days=+39)] = "Ascension"
+            self[easter_date + td(days=+39)] = "Ascension"
             self[date(year, AUG, 15)] = "Assomption"
             self[date(year, NOV, 1)] = "Toussaint"
 
@@ -10,13 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import WE
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAR, MAY, AUG, SEP, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import JAN, MAR, MAY, AUG, SEP, OCT, NOV, DEC, WED
+from holidays.holiday_base import FixedHoliday, HolidayBase
 
 
 class Germany(HolidayBase):
@@ -74,6 +74,43 @@ class Germany(HolidayBase):
         "ST",
         "TH",
     ]
+    fixed_holidays = (
+        FixedHoliday(JAN, 1, "Neujahr", 1991),
+        FixedHoliday(
+            JAN,
+            6,
+            "Heilige Drei Könige",
+            1991,
+            subdivs={"BW", "BY", "BYP", "ST"},
+        ),
+        FixedHoliday(
+            MAR, 8, "Internationaler Frauentag", 2019, subdivs={"BE"}
+        ),
+        FixedHoliday(MAY, 1, "Erster Mai", 1991),
+        FixedHoliday(AUG, 15, "Mariä Himmelfahrt", 1991, subdivs={"BY", "SL"}),
+        FixedHoliday(SEP, 20, "Weltkindertag", 2019, subdivs={"TH"}),
+        FixedHoliday(OCT, 3, "Tag der Deutschen Einheit", 1990),
+        FixedHoliday(
+            OCT,
+            31,
+            "Reformationstag",
+            1990,
+            subdivs={"BB", "MV", "SN", "ST", "TH"},
+        ),
+        FixedHoliday(
+            OCT, 31, "Reformationstag", 2018, subdivs={"HB", "HH", "NI", "SH"}
+        ),
+        FixedHoliday(OCT, 31, "Reformationstag", 2017, 2017),
+        FixedHoliday(
+            NOV,
+            1,
+            "Allerheiligen",
+            1990,
+            subdivs={"BW", "BY", "BYP", "NW", "RP", "SL"},
+        ),
+        FixedHoliday(DEC, 25, "Erster Weihnachtstag", 1990),
+        FixedHoliday(DEC, 26, "Zweiter Weihnachtstag", 1990),
+    )
 
     def _populate(self, year):
         super()._populate(year)
@@ -82,15 +119,9 @@ class Germany(HolidayBase):
             return
 
         if year > 1990:
-
-            self[date(year, JAN, 1)] = "Neujahr"
-
-            if self.subdiv in {"BW", "BY", "BYP", "ST"}:
-                self[date(year, JAN, 6)] = "Heilige Drei Könige"
-
             easter_date = easter(year)
 
-            self[easter_date + rd(days=-2)] = "Karfreitag"
+            self[easter_date + td(days=-2)] = "Karfreitag"
 
             if self.subdiv == "BB":
                 # will always be a Sunday and we have no "observed" rule so
@@ -98,9 +129,7 @@ class Germany(HolidayBase):
                 # holiday by law
                 self[easter_date] = "Ostersonntag"
 
-            self[easter_date + rd(days=+1)] = "Ostermontag"
-
-            self[date(year, MAY, 1)] = "Erster Mai"
+            self[easter_date + td(days=+1)] = "Ostermontag"
 
             if self.subdiv == "BE" and year == 2020:
                 self[date(year, MAY, 8)] = (
@@ -108,47 +137,24 @@ class Germany(HolidayBase):
                     "und der Beendigung des Zweiten Weltkriegs in Europa"
                 )
 
-            self[easter_date + rd(days=+39)] = "Christi Himmelfahrt"
+            self[easter_date + td(days=+39)] = "Christi Himmelfahrt"
 
             if self.subdiv == "BB":
                 # will always be a Sunday and we have no "observed" rule so
                 # this is pretty pointless but it's nonetheless an official
                 # holiday by law
-                self[easter_date + rd(days=+49)] = "Pfingstsonntag"
+                self[easter_date + td(days=+49)] = "Pfingstsonntag"
 
-            self[easter_date + rd(days=+50)] = "Pfingstmontag"
+            self[easter_date + td(days=+50)] = "Pfingstmontag"
 
             if self.subdiv in {"BW", "BY", "BYP", "HE", "NW", "RP", "SL"}:
-                self[easter_date + rd(days=+60)] = "Fronleichnam"
-
-            if self.subdiv in {"BY", "SL"}:
-                self[date(year, AUG, 15)] = "Mariä Himmelfahrt"
-
-        self[date(year, OCT, 3)] = "Tag der Deutschen Einheit"
-
-        if (
-            self.subdiv in {"BB", "MV", "SN", "ST", "TH"}
-            or (self.subdiv in {"HB", "HH", "NI", "SH"} and year >= 2018)
-            or year == 2017
-        ):
-            self[date(year, OCT, 31)] = "Reformationstag"
-
-        if self.subdiv in {"BW", "BY", "BYP", "NW", "RP", "SL"}:
-            self[date(year, NOV, 1)] = "Allerheiligen"
+                self[easter_date + td(days=+60)] = "Fronleichnam"
 
         if year <= 1994 or self.subdiv == "SN":
             # last wednesday before year-11-23
-            self[date(year, NOV, 22) + rd(weekday=WE(-1))] = "Buß- und Bettag"
-
-        if year >= 2019:
-            if self.subdiv == "TH":
-                self[date(year, SEP, 20)] = "Weltkindertag"
-
-            if self.subdiv == "BE":
-                self[date(year, MAR, 8)] = "Internationaler Frauentag"
-
-        self[date(year, DEC, 25)] = "Erster Weihnachtstag"
-        self[date(year, DEC, 26)] = "Zweiter Weihnachtstag"
+            self[
+                _get_nth_weekday_from(-1, WED, date(year, NOV, 22))
+            ] = "Buß- und Bettag"
 
 
 class DE(Germany):
@@ -10,12 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, easter
-from dateutil.relativedelta import MO, TU
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAR, MAY, AUG, OCT, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, MAR, MAY, AUG, OCT, DEC, MON, TUE
 from holidays.holiday_base import HolidayBase
 
 
@@ -37,17 +38,17 @@ class Greece(HolidayBase):
         self[date(year, JAN, 6)] = "Θεοφάνεια [Epiphany]"
 
         # Clean Monday
-        self[easter_date + rd(days=-48)] = "Καθαρά Δευτέρα [Clean Monday]"
+        self[easter_date + td(days=-48)] = "Καθαρά Δευτέρα [Clean Monday]"
 
         # Independence Day
         self[date(year, MAR, 25)] = "Εικοστή Πέμπτη Μαρτίου [Independence Day]"
 
         # Easter Monday
-        self[easter_date + rd(days=+1)] = "Δευτέρα του Πάσχα [Easter Monday]"
+        self[easter_date + td(days=+1)] = "Δευτέρα του Πάσχα [Easter Monday]"
 
         # Monday of the Holy Spirit
         self[
-            easter_date + rd(days=+50)
+            easter_date + td(days=+50)
         ] = "Δευτέρα του Αγίου Πνεύματος [Monday of the Holy Spirit]"
 
         # Labour Day
@@ -57,11 +58,15 @@ class Greece(HolidayBase):
         self[date(year, MAY, 1)] = name
         if self.observed and self._is_weekend(year, MAY, 1):
             # https://en.wikipedia.org/wiki/Public_holidays_in_Greece
-            labour_day_observed_date = date(year, MAY, 1) + rd(weekday=MO)
+            labour_day_observed_date = _get_nth_weekday_of_month(
+                1, MON, MAY, year
+            )
             # In 2016 and 2021, Labour Day coincided with other holidays
             # https://www.timeanddate.com/holidays/greece/labor-day
             if self.get(labour_day_observed_date):
-                labour_day_observed_date += rd(weekday=TU)
+                labour_day_observed_date = _get_nth_weekday_from(
+                    1, TUE, labour_day_observed_date
+                )
             self[labour_day_observed_date] = name_observed
 
         # Assumption of Mary
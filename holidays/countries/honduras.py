@@ -10,12 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import WE
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, APR, MAY, SEP, OCT, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, APR, MAY, SEP, OCT, DEC, WED
 from holidays.holiday_base import HolidayBase
 
 
@@ -33,13 +33,13 @@ class Honduras(HolidayBase):
 
         easter_date = easter(year)
         # Maundy Thursday
-        self[easter_date + rd(days=-3)] = "Jueves Santo [Maundy Thursday]"
+        self[easter_date + td(days=-3)] = "Jueves Santo [Maundy Thursday]"
 
         # Good Friday
-        self[easter_date + rd(days=-2)] = "Viernes Santo [Good Friday]"
+        self[easter_date + td(days=-2)] = "Viernes Santo [Good Friday]"
 
         # Holy Saturday
-        self[easter_date + rd(days=-1)] = "Sábado de Gloria [Holy Saturday]"
+        self[easter_date + td(days=-1)] = "Sábado de Gloria [Holy Saturday]"
 
         # Panamerican Day
         self[date(year, APR, 14)] = "Día de las Américas [Panamerican Day]"
@@ -66,10 +66,10 @@ class Honduras(HolidayBase):
             # Morazan Weekend
             # (First Wednesday of October from 12 noon to Saturday 12 noon)
             holiday_name = "Semana Morazánica [Morazan Weekend]"
-            first_wednesday = date(year, OCT, 1) + rd(weekday=WE(+1))
+            first_wednesday = _get_nth_weekday_of_month(1, WED, OCT, year)
             self[first_wednesday] = holiday_name
-            self[first_wednesday + rd(days=+1)] = holiday_name
-            self[first_wednesday + rd(days=+2)] = holiday_name
+            self[first_wednesday + td(days=+1)] = holiday_name
+            self[first_wednesday + td(days=+2)] = holiday_name
 
         # Christmas
         self[date(year, DEC, 25)] = "Navidad [Christmas]"
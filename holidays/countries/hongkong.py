@@ -10,15 +10,16 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.chinese import _ChineseLuniSolar
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, APR, MAY, JUN, JUL, AUG, SEP, OCT, DEC
 from holidays.constants import MON, TUE, WED, THU, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _ChineseLuniSolar
 
 
 class HongKong(HolidayBase):
@@ -58,7 +59,7 @@ class HongKong(HolidayBase):
         # The first day of January
         first_date = date(year, JAN, 1)
         if self.observed and first_date.weekday() == SUN:
-            self[first_date + rd(days=+1)] = (
+            self[first_date + td(days=+1)] = (
                 day_following + "the first day of January"
             )
         else:
@@ -75,38 +76,38 @@ class HongKong(HolidayBase):
             self[new_year_date] = name
             if new_year_date.weekday() in {MON, TUE, WED, THU}:
                 self[new_year_date] = name
-                self[new_year_date + rd(days=+1)] = second_day_lunar
-                self[new_year_date + rd(days=+2)] = third_day_lunar
+                self[new_year_date + td(days=+1)] = second_day_lunar
+                self[new_year_date + td(days=+2)] = third_day_lunar
             if new_year_date.weekday() == FRI:
                 self[new_year_date] = name
-                self[new_year_date + rd(days=+1)] = second_day_lunar
-                self[new_year_date + rd(days=+3)] = fourth_day_lunar
+                self[new_year_date + td(days=+1)] = second_day_lunar
+                self[new_year_date + td(days=+3)] = fourth_day_lunar
             if new_year_date.weekday() == SAT:
                 self[new_year_date] = name
-                self[new_year_date + rd(days=+2)] = third_day_lunar
-                self[new_year_date + rd(days=+3)] = fourth_day_lunar
+                self[new_year_date + td(days=+2)] = third_day_lunar
+                self[new_year_date + td(days=+3)] = fourth_day_lunar
             if new_year_date.weekday() == SUN:
                 if year in {2006, 2007, 2010}:
-                    self[new_year_date + rd(days=-1)] = preceding_day_lunar
+                    self[new_year_date + td(days=-1)] = preceding_day_lunar
                 else:
-                    self[new_year_date + rd(days=+3)] = fourth_day_lunar
+                    self[new_year_date + td(days=+3)] = fourth_day_lunar
             else:
                 self[new_year_date] = name
             if new_year_date.weekday() == SAT:
-                self[new_year_date + rd(days=+3)] = fourth_day_lunar
+                self[new_year_date + td(days=+3)] = fourth_day_lunar
             else:
-                self[new_year_date + rd(days=+1)] = second_day_lunar
+                self[new_year_date + td(days=+1)] = second_day_lunar
             if new_year_date.weekday() == FRI:
-                self[new_year_date + rd(days=+3)] = fourth_day_lunar
+                self[new_year_date + td(days=+3)] = fourth_day_lunar
             else:
-                self[new_year_date + rd(days=+2)] = third_day_lunar
+                self[new_year_date + td(days=+2)] = third_day_lunar
         else:
             self[new_year_date] = name
-            self[new_year_date + rd(days=+1)] = second_day_lunar
-            self[new_year_date + rd(days=+2)] = third_day_lunar
+            self[new_year_date + td(days=+1)] = second_day_lunar
+            self[new_year_date + td(days=+2)] = third_day_lunar
 
         easter_date = easter(year)
-        easter_monday_date = easter_date + rd(days=+1)
+        easter_monday_date = easter_date + td(days=+1)
         # Ching Ming Festival
         name = "Ching Ming Festival"
         if self.is_leap_year(year) or (
@@ -119,17 +120,17 @@ class HongKong(HolidayBase):
             ching_ming_date.weekday() == SUN
             or ching_ming_date == easter_monday_date
         ):
-            self[ching_ming_date + rd(days=+1)] = day_following + name
+            self[ching_ming_date + td(days=+1)] = day_following + name
         else:
             self[ching_ming_date] = name
 
         # Easter Holiday
         good_friday = "Good Friday"
         easter_monday = "Easter Monday"
-        self[easter_date + rd(days=-2)] = good_friday
-        self[easter_date + rd(days=-1)] = day_following + good_friday
+        self[easter_date + td(days=-2)] = good_friday
+        self[easter_date + td(days=-1)] = day_following + good_friday
         if self.observed and self.get(easter_monday_date):
-            self[easter_monday_date + rd(days=+1)] = (
+            self[easter_monday_date + td(days=+1)] = (
                 day_following + easter_monday
             )
         else:
@@ -140,7 +141,7 @@ class HongKong(HolidayBase):
             name = "The Birthday of the Buddha"
             buddha_date = self.cnls.lunar_to_gre(year, 4, 8)
             if self.observed and buddha_date.weekday() == SUN:
-                self[buddha_date + rd(days=+1)] = day_following + name
+                self[buddha_date + td(days=+1)] = day_following + name
             else:
                 self[buddha_date] = name
 
@@ -149,7 +150,7 @@ class HongKong(HolidayBase):
             name = "Labour Day"
             labour_date = date(year, MAY, 1)
             if self.observed and labour_date.weekday() == SUN:
-                self[labour_date + rd(days=+1)] = day_following + name
+                self[labour_date + td(days=+1)] = day_following + name
             else:
                 self[labour_date] = name
 
@@ -157,7 +158,7 @@ class HongKong(HolidayBase):
         name = "Tuen Ng Festival"
         tuen_ng_date = self.cnls.lunar_to_gre(year, 5, 5)
         if self.observed and tuen_ng_date.weekday() == SUN:
-            self[tuen_ng_date + rd(days=+1)] = day_following + name
+            self[tuen_ng_date + td(days=+1)] = day_following + name
         else:
             self[tuen_ng_date] = name
 
@@ -166,7 +167,7 @@ class HongKong(HolidayBase):
             name = "Hong Kong Special Administrative Region Establishment Day"
             hksar_date = date(year, JUL, 1)
             if self.observed and hksar_date.weekday() == SUN:
-                self[hksar_date + rd(days=+1)] = day_following + name
+                self[hksar_date + td(days=+1)] = day_following + name
             else:
                 self[hksar_date] = name
 
@@ -182,11 +183,11 @@ class HongKong(HolidayBase):
                 if 1983 <= year <= 2010:
                     self[mid_autumn_date] = name
                 else:
-                    self[mid_autumn_date + rd(days=+2)] = (
+                    self[mid_autumn_date + td(days=+2)] = (
                         "The second day of the " + name + " (Monday)"
                     )
             else:
-                self[mid_autumn_date + rd(days=+1)] = (
+                self[mid_autumn_date + td(days=+1)] = (
                     day_following + "the " + name
                 )
         else:
@@ -199,7 +200,7 @@ class HongKong(HolidayBase):
             if self.observed and (
                 national_date.weekday() == SUN or self.get(national_date)
             ):
-                self[national_date + rd(days=+1)] = day_following + name
+                self[national_date + td(days=+1)] = day_following + name
             else:
                 self[national_date] = name
 
@@ -207,7 +208,7 @@ class HongKong(HolidayBase):
         name = "Chung Yeung Festival"
         chung_yeung_date = self.cnls.lunar_to_gre(year, 9, 9)
         if self.observed and chung_yeung_date.weekday() == SUN:
-            self[chung_yeung_date + rd(days=+1)] = day_following + name
+            self[chung_yeung_date + td(days=+1)] = day_following + name
         else:
             self[chung_yeung_date] = name
 
@@ -218,32 +219,32 @@ class HongKong(HolidayBase):
         christmas_date = date(year, DEC, 25)
         if self.observed:
             if christmas_date.weekday() == SUN:
-                self[christmas_date + rd(days=+1)] = first_after_christmas
-                self[christmas_date + rd(days=+2)] = second_after_christmas
+                self[christmas_date + td(days=+1)] = first_after_christmas
+                self[christmas_date + td(days=+2)] = second_after_christmas
             elif christmas_date.weekday() == SAT:
                 self[christmas_date] = name
-                self[christmas_date + rd(days=+2)] = first_after_christmas
+                self[christmas_date + td(days=+2)] = first_after_christmas
             else:
                 self[christmas_date] = name
-                self[christmas_date + rd(days=+1)] = first_after_christmas
+                self[christmas_date + td(days=+1)] = first_after_christmas
         else:
             self[christmas_date] = name
-            self[christmas_date + rd(days=+1)] = day_following + name
+            self[christmas_date + td(days=+1)] = day_following + name
 
         # Previous holidays
         if 1952 <= year <= 1997:
             # Queen's Birthday (June 2nd Monday)
-            dt = date(year, JUN, 1) + rd(weekday=MO(+2))
+            dt = _get_nth_weekday_of_month(2, MON, JUN, year)
             self[dt] = "Queen's Birthday"
 
         if year <= 1996:
             # Anniversary of the liberation of Hong Kong (August last Monday)
-            dt = date(year, AUG, 31) + rd(weekday=MO(-1))
+            dt = _get_last_weekday_of_month(MON, AUG, year)
             self[dt] = "Anniversary of the liberation of Hong Kong"
 
             # Anniversary of the victory in the Second Sino-Japanese War
             self[
-                dt + rd(days=-1)
+                dt + td(days=-1)
             ] = "Anniversary of the victory in the Second Sino-Japanese War"
 
     @staticmethod
@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAR, APR, MAY, AUG, OCT, NOV, DEC, MON
 from holidays.constants import TUE, THU
@@ -61,21 +61,21 @@ class Hungary(HolidayBase):
 
         # Good Friday
         if 2017 <= year:
-            self[easter_date + rd(days=-2)] = "Nagypéntek"
+            self[easter_date + td(days=-2)] = "Nagypéntek"
 
         # Easter
         self[easter_date] = "Húsvét"
 
         # Second easter day
         if 1955 != year:
-            self[easter_date + rd(days=+1)] = "Húsvét Hétfő"
+            self[easter_date + td(days=+1)] = "Húsvét Hétfő"
 
         # Pentecost
-        self[easter_date + rd(days=+49)] = "Pünkösd"
+        self[easter_date + td(days=+49)] = "Pünkösd"
 
         # Pentecost monday
         if year <= 1952 or 1992 <= year:
-            self[easter_date + rd(days=+50)] = "Pünkösdhétfő"
+            self[easter_date + td(days=+50)] = "Pünkösdhétfő"
 
         # International Workers' Day
         if 1946 <= year:
@@ -150,9 +150,9 @@ class Hungary(HolidayBase):
         # TODO: should it be a separate flag?
         if self.observed and since <= day.year:
             if day.weekday() == TUE and before:
-                self[day + rd(days=-1)] = desc + " előtti pihenőnap"
+                self[day + td(days=-1)] = desc + " előtti pihenőnap"
             elif day.weekday() == THU and after:
-                self[day + rd(days=+1)] = desc + " utáni pihenőnap"
+                self[day + td(days=+1)] = desc + " utáni pihenőnap"
 
 
 class HU(Hungary):
@@ -11,13 +11,13 @@
 
 import warnings
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAR, APR, MAY, JUN, AUG, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class India(HolidayBase):
@@ -269,20 +269,20 @@ class India(HolidayBase):
         name = "Eid ul-Fitr"
         for dt in _islamic_to_gre(year, 10, 1):
             self[dt] = f"{name}* (*estimated)"
-            self[dt + rd(days=+1)] = f"{name}* (*estimated)"
+            self[dt + td(days=+1)] = f"{name}* (*estimated)"
 
         # Eid al-Adha, i.e., Feast of the Sacrifice
         name = "Eid al-Adha"
         for dt in _islamic_to_gre(year, 12, 10):
             self[dt] = f"{name}* (*estimated)"
-            self[dt + rd(days=+1)] = f"{name}* (*estimated)"
+            self[dt + td(days=+1)] = f"{name}* (*estimated)"
 
         # Christian holidays
         easter_date = easter(year)
-        self[easter_date + rd(days=-7)] = "Palm Sunday"
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-7)] = "Palm Sunday"
+        self[easter_date + td(days=-2)] = "Good Friday"
         self[easter_date] = "Easter Sunday"
-        self[easter_date + rd(days=+49)] = "Feast of Pentecost"
+        self[easter_date + td(days=+49)] = "Feast of Pentecost"
         self[date(year, DEC, 25)] = "Christmas Day"
 
 
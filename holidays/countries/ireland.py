@@ -9,12 +9,14 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, FEB, MAR, MAY, JUN, AUG, OCT, DEC, FRI
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, FEB, MAR, MAY, JUN, AUG, OCT, DEC, MON, FRI
 from holidays.holiday_base import HolidayBase
 
 
@@ -42,17 +44,17 @@ class Ireland(HolidayBase):
             if dt.weekday() == FRI:
                 self[dt] = name
             else:
-                self[dt + rd(weekday=MO)] = name
+                self[_get_nth_weekday_from(1, MON, dt)] = name
 
         # St. Patrick's Day
         name = "St. Patrick's Day"
         dt = date(year, MAR, 17)
         self[dt] = name
         if self.observed and self._is_weekend(dt):
-            self[dt + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, dt)] = name + " (Observed)"
 
         # Easter Monday
-        self[easter(year) + rd(days=+1)] = "Easter Monday"
+        self[easter(year) + td(days=+1)] = "Easter Monday"
 
         # May bank holiday (first Monday in May)
         if year >= 1978:
@@ -60,31 +62,37 @@ class Ireland(HolidayBase):
             if year == 1995:
                 dt = date(year, MAY, 8)
             else:
-                dt = date(year, MAY, 1) + rd(weekday=MO)
+                dt = _get_nth_weekday_of_month(1, MON, MAY, year)
             self[dt] = name
 
         # June bank holiday (first Monday in June)
-        self[date(year, JUN, 1) + rd(weekday=MO)] = "June Bank Holiday"
+        self[
+            _get_nth_weekday_of_month(1, MON, JUN, year)
+        ] = "June Bank Holiday"
 
         # Summer bank holiday (first Monday in August)
-        self[date(year, AUG, 1) + rd(weekday=MO)] = "August Bank Holiday"
+        self[
+            _get_nth_weekday_of_month(1, MON, AUG, year)
+        ] = "August Bank Holiday"
 
         # October Bank Holiday (last Monday in October)
-        self[date(year, OCT, 31) + rd(weekday=MO(-1))] = "October Bank Holiday"
+        self[
+            _get_last_weekday_of_month(MON, OCT, year)
+        ] = "October Bank Holiday"
 
         # Christmas Day
         name = "Christmas Day"
         dt = date(year, DEC, 25)
         self[dt] = name
         if self.observed and self._is_weekend(dt):
-            self[dt + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, dt)] = name + " (Observed)"
 
         # St. Stephen's Day
         name = "St. Stephen's Day"
         dt = date(year, DEC, 26)
         self[dt] = name
         if self.observed and self._is_weekend(dt):
-            self[dt + rd(days=+2)] = name + " (Observed)"
+            self[dt + td(days=+2)] = name + " (Observed)"
 
 
 class IE(Ireland):
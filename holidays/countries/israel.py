@@ -9,14 +9,11 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+from datetime import timedelta as td
 
-from datetime import date
-
-from convertdate import gregorian, hebrew
-from convertdate.holidays import hanukkah, lag_baomer, passover, purim
-from convertdate.holidays import rosh_hashanah, shavuot, sukkot, yom_kippur
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.hebrew import NISAN, IYYAR, SIVAN, TISHRI, KISLEV
+from holidays.calendars.hebrew import ADAR, VEADAR, _HEBREW_YEAR_OFFSET
+from holidays.calendars.hebrew import _hebrew_to_gre, _is_leap_year
 from holidays.constants import WED, THU, SAT
 from holidays.holiday_base import HolidayBase
 
@@ -30,26 +27,22 @@ class Israel(HolidayBase):
 
         # Passover
         name = "Passover I"
-        passover_start_dt = date(*passover(year, eve=True))
+        passover_start_dt = _hebrew_to_gre(year, NISAN, 15) + td(days=-1)
         self[passover_start_dt] = name + " - Eve"
-        self[passover_start_dt + rd(days=+1)] = name
+        self[passover_start_dt + td(days=+1)] = name
 
         name = "Passover"
         for offset in range(2, 6):
-            self[passover_start_dt + rd(days=offset)] = name + " - Chol HaMoed"
+            self[passover_start_dt + td(days=offset)] = name + " - Chol HaMoed"
 
         name = "Passover VII"
-        self[passover_start_dt + rd(days=+6)] = name + " - Eve"
-        self[passover_start_dt + rd(days=+7)] = name
+        self[passover_start_dt + td(days=+6)] = name + " - Eve"
+        self[passover_start_dt + td(days=+7)] = name
 
         # Memorial Day
         name = "Memorial Day"
-        memorial_day_dt = date(
-            *gregorian.from_jd(
-                hebrew.to_jd_gregorianyear(year, hebrew.IYYAR, 3)
-            )
-        )
-        self[memorial_day_dt + rd(days=+1)] = name
+        memorial_day_dt = _hebrew_to_gre(year, IYYAR, 3)
+        self[memorial_day_dt + td(days=+1)] = name
 
         observed_delta = 0
         if self.observed:
@@ -60,77 +53,81 @@ class Israel(HolidayBase):
                 observed_delta = 1
 
             if observed_delta != 0:
-                self[memorial_day_dt + rd(days=observed_delta + 1)] = (
+                self[memorial_day_dt + td(days=observed_delta + 1)] = (
                     name + " (Observed)"
                 )
 
         # Independence Day
         name = "Independence Day"
-        self[memorial_day_dt + rd(days=+2)] = name
+        self[memorial_day_dt + td(days=+2)] = name
 
         if self.observed and observed_delta != 0:
-            self[memorial_day_dt + rd(days=observed_delta + 2)] = (
+            self[memorial_day_dt + td(days=observed_delta + 2)] = (
                 name + " (Observed)"
             )
 
         # Lag Baomer
         name = "Lag B'Omer"
-        lag_baomer_dt = date(*lag_baomer(year, eve=False))
+        lag_baomer_dt = _hebrew_to_gre(year, IYYAR, 18)
         self[lag_baomer_dt] = name
 
         # Shavuot
         name = "Shavuot"
-        shavuot_dt = date(*shavuot(year, eve=True))
+        shavuot_dt = _hebrew_to_gre(year, SIVAN, 6) + td(days=-1)
         self[shavuot_dt] = name + " - Eve"
-        self[shavuot_dt + rd(days=+1)] = name
+        self[shavuot_dt + td(days=+1)] = name
 
         # Rosh Hashana
         name = "Rosh Hashanah"
-        rosh_hashanah_dt = date(*rosh_hashanah(year, eve=True))
+        rosh_hashanah_dt = _hebrew_to_gre(year, TISHRI, 1) + td(days=-1)
         self[rosh_hashanah_dt] = name + " - Eve"
-        self[rosh_hashanah_dt + rd(days=+1)] = name
-        self[rosh_hashanah_dt + rd(days=+2)] = name
+        self[rosh_hashanah_dt + td(days=+1)] = name
+        self[rosh_hashanah_dt + td(days=+2)] = name
 
         # Yom Kippur
         name = "Yom Kippur"
-        yom_kippur_dt = date(*yom_kippur(year, eve=True))
+        yom_kippur_dt = _hebrew_to_gre(year, TISHRI, 10) + td(days=-1)
         self[yom_kippur_dt] = name + " - Eve"
-        self[yom_kippur_dt + rd(days=+1)] = name
+        self[yom_kippur_dt + td(days=+1)] = name
 
         # Sukkot
         name = "Sukkot I"
-        sukkot_start_dt = date(*sukkot(year, eve=True))
+        sukkot_start_dt = _hebrew_to_gre(year, TISHRI, 15) + td(days=-1)
         self[sukkot_start_dt] = name + " - Eve"
-        self[sukkot_start_dt + rd(days=+1)] = name
+        self[sukkot_start_dt + td(days=+1)] = name
 
         name = "Sukkot"
         for offset in range(2, 7):
-            self[sukkot_start_dt + rd(days=offset)] = name + " - Chol HaMoed"
+            self[sukkot_start_dt + td(days=offset)] = name + " - Chol HaMoed"
 
         name = "Sukkot VII"
-        self[sukkot_start_dt + rd(days=+7)] = name + " - Eve"
-        self[sukkot_start_dt + rd(days=+8)] = name
+        self[sukkot_start_dt + td(days=+7)] = name + " - Eve"
+        self[sukkot_start_dt + td(days=+8)] = name
 
         # Hanukkah
         name = "Hanukkah"
-        hk_start_date = date(*hanukkah(year, eve=False))
+        hk_start_date = _hebrew_to_gre(year, KISLEV, 25)
         for offset in range(8):
-            hk_date = hk_start_date + rd(days=offset)
+            hk_date = hk_start_date + td(days=offset)
             if hk_date.year == year:
                 self[hk_date] = name
         # Some o prior's year Hannukah may fall in current year.
-        hk_start_date = date(*hanukkah(year - 1, eve=False))
+        hk_start_date = _hebrew_to_gre(year - 1, KISLEV, 25)
         for offset in range(8):
-            hk_date = hk_start_date + rd(days=offset)
+            hk_date = hk_start_date + td(days=offset)
             if hk_date.year == year:
                 self[hk_date] = name
 
         # Purim
         name = "Purim"
-        purim_date = date(*purim(year, eve=True))
+        # Adar II in leap years.
+        purim_month = (
+            VEADAR if _is_leap_year(year + _HEBREW_YEAR_OFFSET) else ADAR
+        )
+        purim_date = _hebrew_to_gre(year, purim_month, 14) + td(days=-1)
         self[purim_date] = name + " - Eve"
-        self[purim_date + rd(days=+1)] = name
-        self[purim_date + rd(days=+2)] = "Shushan Purim"
+        self[purim_date + td(days=+1)] = name
+        self[purim_date + td(days=+2)] = "Shushan Purim"
 
 
 class IL(Israel):
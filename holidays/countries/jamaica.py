@@ -10,12 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, SU
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, FEB, MAY, JUN, AUG, OCT, DEC, SUN
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, FEB, MAY, JUN, AUG, OCT, DEC, MON, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -33,7 +34,7 @@ class Jamaica(HolidayBase):
         name = "New Year's Day"
         _date = date(year, JAN, 1)
         if self.observed and _date.weekday() == SUN:
-            self[_date + rd(weekday=MO(+1))] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, _date)] = name + " (Observed)"
         else:
             self[_date] = name
 
@@ -41,24 +42,24 @@ class Jamaica(HolidayBase):
         self[date(year, FEB, 14)] = "Valentine's Day"
 
         # Mother's Day
-        self[date(year, MAY, 1) + rd(weekday=SU(+2))] = "Mother's Day"
+        self[_get_nth_weekday_of_month(2, SUN, MAY, year)] = "Mother's Day"
 
         # Labour Day
         name = "Labour Day"
         _date = date(year, MAY, 23)
         if self.observed and _date.weekday() == SUN:
-            self[_date + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, _date)] = name + " (Observed)"
         else:
             self[_date] = name
 
         # Father's Day
-        self[date(year, JUN, 1) + rd(weekday=SU(+3))] = "Father's Day"
+        self[_get_nth_weekday_of_month(3, SUN, JUN, year)] = "Father's Day"
 
         # Emancipation Day
         name = "Emancipation Day"
         _date = date(year, AUG, 1)
         if self.observed and _date.weekday() == SUN:
-            self[_date + rd(weekday=MO)] = name + " (Observed)"
+            self[_get_nth_weekday_from(1, MON, _date)] = name + " (Observed)"
         else:
             self[_date] = name
 
@@ -66,12 +67,14 @@ class Jamaica(HolidayBase):
         name = "Independence Day"
         _date = date(year, AUG, 6)
         if self.observed and self._is_weekend(_date):
-            self[_date + rd(weekday=MO)] = name
+            self[_get_nth_weekday_from(1, MON, _date)] = name
         else:
             self[_date] = name
 
         # National Heroes Day
-        self[date(year, OCT, 1) + rd(weekday=MO(+3))] = "National Heroes Day"
+        self[
+            _get_nth_weekday_of_month(3, MON, OCT, year)
+        ] = "National Heroes Day"
 
         # Christmas
         self[date(year, DEC, 25)] = "Christmas day"
@@ -86,16 +89,16 @@ class Jamaica(HolidayBase):
         easter_date = easter(year)
 
         # Ash Wednesday
-        self[easter_date + rd(days=-46)] = "Ash Wednesday"
+        self[easter_date + td(days=-46)] = "Ash Wednesday"
 
         # Good Friday
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-2)] = "Good Friday"
 
         # Easter
         self[easter_date] = "Easter"
 
         # Easter
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
 
 class JM(Jamaica):
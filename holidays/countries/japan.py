@@ -9,17 +9,17 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date, datetime
+from datetime import date
+from datetime import timedelta as td
 
-from dateutil import tz
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
-from pymeeus.Epoch import Epoch
-from pymeeus.Sun import Sun
+from holidays.calendars.astronomy import _get_equinox_solstice_date
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
+from holidays.constants import OCT, NOV, DEC, MON, SUN
+from holidays.holiday_base import FixedHoliday, HolidayBase
 
-from holidays.constants import SUN, JAN, FEB, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+# Japan Standard Time, in hours from UTC.
+JST = 9
 
 
 class Japan(HolidayBase):
@@ -38,6 +38,32 @@ class Japan(HolidayBase):
             (OCT, 22, "即位礼正殿の儀が行われる日"),  # Enthronement ceremony.
         ),
     }
+    fixed_holidays = (
+        FixedHoliday(JAN, 1, "元日"),  # New Year's Day
+        FixedHoliday(JAN, 15, "成人の日", end_year=1999),  # Coming of Age Day
+        FixedHoliday(FEB, 11, "建国記念の日", 1967),  # Foundation Day
+        # Reiwa Emperor's Birthday
+        FixedHoliday(FEB, 23, "天皇誕生日", 2020),
+        # Showa Emperor's Birthday, Greenery Day or Showa Day
+        FixedHoliday(APR, 29, "天皇誕生日", end_year=1988),
+        FixedHoliday(APR, 29, "みどりの日", 1989, 2006),
+        FixedHoliday(APR, 29, "昭和の日", 2007),
+        FixedHoliday(MAY, 3, "憲法記念日"),  # Constitution Memorial Day
+        FixedHoliday(MAY, 4, "みどりの日", 2007),  # Greenery Day
+        FixedHoliday(MAY, 5, "こどもの日"),  # Children's Day
+        FixedHoliday(JUL, 20, "海の日", 1996, 2002),  # Marine Day
+        FixedHoliday(AUG, 11, "山の日", 2016, 2019),  # Mountain Day
+        FixedHoliday(AUG, 11, "山の日", 2022),
+        # Respect for the Aged Day
+        FixedHoliday(SEP, 15, "敬老の日", 1966, 2002),
+        FixedHoliday(OCT, 10, "体育の日", 1966, 1999),  # Health and Sports Day
+        FixedHoliday(NOV, 3, "文化の日"),  # Culture Day
+        FixedHoliday(NOV, 23, "勤労感謝の日"),  # Labour Thanksgiving Day
+        # Heisei Emperor's Birthday
+        FixedHoliday(DEC, 23, "天皇誕生日", 1989, 2018),
+    )
+    # The equinoxes are the costly part of a year.
+    month_holidays = {"_populate_equinoxes": (MAR, SEP)}
 
     def _populate(self, year):
         if year < 1949 or year > 2099:
@@ -45,122 +71,86 @@ class Japan(HolidayBase):
 
         super()._populate(year)
 
-        # New Year's Day
-        self[date(year, JAN, 1)] = "元日"
-
         # Coming of Age Day
-        if year <= 1999:
-            self[date(year, JAN, 15)] = "成人の日"
-        else:
-            self[date(year, JAN, 1) + rd(weekday=MO(+2))] = "成人の日"
-
-        # Foundation Day
-        if year >= 1967:
-            self[date(year, FEB, 11)] = "建国記念の日"
-
-        # Reiwa Emperor's Birthday
-        if year >= 2020:
-            self[date(year, FEB, 23)] = "天皇誕生日"
-
-        # Vernal Equinox Day
-        epoch = Sun.get_equinox_solstice(year, target="spring")
-        equinox = map(int, Epoch(epoch).get_full_date())
-        adjusted_date = datetime(*equinox, tzinfo=tz.UTC).astimezone(
-            tz.gettz("Asia/Tokyo")
-        )
-        self[adjusted_date.date()] = "春分の日"
-
-        # Showa Emperor's Birthday, Greenery Day or Showa Day
-        if year <= 1988:
-            self[date(year, APR, 29)] = "天皇誕生日"
-        elif year <= 2006:
-            self[date(year, APR, 29)] = "みどりの日"
-        else:
-            self[date(year, APR, 29)] = "昭和の日"
-
-        # Constitution Memorial Day
-        self[date(year, MAY, 3)] = "憲法記念日"
-
-        # Greenery Day
-        if year >= 2007:
-            self[date(year, MAY, 4)] = "みどりの日"
-
-        # Children's Day
-        self[date(year, MAY, 5)] = "こどもの日"
+        if year >= 2000:
+            self[_get_nth_weekday_of_month(2, MON, JAN, year)] = "成人の日"
 
         # Marine Day
-        if 1996 <= year <= 2002:
-            self[date(year, JUL, 20)] = "海の日"
-        elif year == 2020:
+        if year == 2020:
             self[date(year, JUL, 23)] = "海の日"
         elif year == 2021:
             self[date(year, JUL, 22)] = "海の日"
         elif year >= 2003:
-            self[date(year, JUL, 1) + rd(weekday=MO(+3))] = "海の日"
+            self[_get_nth_weekday_of_month(3, MON, JUL, year)] = "海の日"
 
         # Mountain Day
         if year == 2020:
             self[date(year, AUG, 10)] = "山の日"
         elif year == 2021:
             self[date(year, AUG, 8)] = "山の日"
-        elif year >= 2016:
-            self[date(year, AUG, 11)] = "山の日"
 
         # Respect for the Aged Day
-        if 1966 <= year <= 2002:
-            self[date(year, SEP, 15)] = "敬老の日"
-        elif year >= 2003:
-            self[date(year, SEP, 1) + rd(weekday=MO(+3))] = "敬老の日"
-
-        # Autumnal Equinox Day
-        epoch = Sun.get_equinox_solstice(year, target="autumn")
-        equinox = map(int, Epoch(epoch).get_full_date())
-        adjusted_date = datetime(*equinox, tzinfo=tz.UTC).astimezone(
-            tz.gettz("Asia/Tokyo")
-        )
-        self[adjusted_date.date()] = "秋分の日"
+        if year >= 2003:
+            self[_get_nth_weekday_of_month(3, MON, SEP, year)] = "敬老の日"
 
         # Health and Sports Day
-        if 1966 <= year <= 1999:
-            self[date(year, OCT, 10)] = "体育の日"
-        elif 2000 <= year <= 2019:
-            self[date(year, OCT, 1) + rd(weekday=MO(+2))] = "体育の日"
+        if 2000 <= year <= 2019:
+            self[_get_nth_weekday_of_month(2, MON, OCT, year)] = "体育の日"
         elif year == 2020:
             self[date(year, JUL, 24)] = "スポーツの日"
         elif year == 2021:
             self[date(year, JUL, 23)] = "スポーツの日"
         elif 2022 <= year:
-            self[date(year, OCT, 1) + rd(weekday=MO(+2))] = "スポーツの日"
-
-        # Culture Day
-        self[date(year, NOV, 3)] = "文化の日"
-
-        # Labour Thanksgiving Day
-        self[date(year, NOV, 23)] = "勤労感謝の日"
-
-        # Regarding the Emperor of Heisei
-        if 1989 <= year <= 2018:
-            # Heisei Emperor's Birthday
-            self[date(year, DEC, 23)] = "天皇誕生日"
+            self[_get_nth_weekday_of_month(2, MON, OCT, year)] = "スポーツの日"
 
         if self.observed:
             # When a national holiday falls on Sunday, next working day
             # shall become a public holiday (振替休日) - substitute holidays
             for dt in list(self.keys()):
                 if dt.year == year and dt.weekday() == SUN:
-                    hol_date = dt + rd(days=+1)
+                    hol_date = dt + td(days=+1)
                     while hol_date in self:
-                        hol_date += rd(days=+1)
+                        hol_date += td(days=+1)
                     self[hol_date] = "振替休日"
 
             # A weekday between national holidays becomes
             # a holiday too (国民の休日) - citizens' holidays
             for dt in list(self.keys()):
-                if dt.year == year and dt + rd(days=+2) in self:
-                    hol_date = dt + rd(days=+1)
+                if dt.year == year and dt + td(days=+2) in self:
+                    hol_date = dt + td(days=+1)
                     if hol_date.weekday() != SUN and hol_date not in self:
                         self[hol_date] = "国民の休日"
 
+    def _populate_equinoxes(self, year):
+        dates = []
+        for target, name in (
+            ("spring", "春分の日"),  # Vernal Equinox Day
+            ("autumn", "秋分の日"),  # Autumnal Equinox Day
+        ):
+            dates.append(_get_equinox_solstice_date(year, target, JST))
+            self[dates[-1]] = name
+
+        if self.observed:
+            # Substitute holidays, as above.
+            for dt in dates[:]:
+                if dt.weekday() == SUN:
+                    hol_date = dt + td(days=+1)
+                    while hol_date in self:
+                        hol_date += td(days=+1)
+                    self[hol_date] = "振替休日"
+                    dates.append(hol_date)
+
+            # Citizens' holidays next to the new dates, as above.
+            for dt in dates:
+                for hol_date in (dt + td(days=-1), dt + td(days=+1)):
+                    if (
+                        hol_date + td(days=-1) in self
+                        and hol_date + td(days=+1) in self
+                        and hol_date.weekday() != SUN
+                        and hol_date not in self
+                    ):
+                        self[hol_date] = "国民の休日"
+
 
 class JP(Japan):
     pass
@@ -9,9 +9,9 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAR, APR, MAY, JUL, OCT, DEC
 from holidays.holiday_base import HolidayBase
@@ -44,9 +44,9 @@ class Lesotho(HolidayBase):
                 self[date(year, MAY, 25)] = "Africa/Heroes Day"
 
             easter_date = easter(year)
-            self[easter_date + rd(days=-2)] = "Good Friday"
-            self[easter_date + rd(days=+1)] = "Easter Monday"
-            self[easter_date + rd(days=+39)] = "Ascension Day"
+            self[easter_date + td(days=-2)] = "Good Friday"
+            self[easter_date + td(days=+1)] = "Easter Monday"
+            self[easter_date + td(days=+39)] = "Ascension Day"
             self[date(year, MAY, 1)] = "Workers' Day"
 
             if year > 1997:
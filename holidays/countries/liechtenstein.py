@@ -11,11 +11,11 @@
 #  Copyright: Kateryna Golovanova <kate@kgthreads.com>, 2022
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import AUG, DEC, FEB, JAN, MAR, MAY, NOV, SEP
+from holidays.constants import JAN, FEB, MAR, MAY, AUG, SEP, NOV, DEC
 from holidays.holiday_base import HolidayBase
 
 
@@ -43,34 +43,34 @@ class Liechtenstein(HolidayBase):
 
         easter_date = easter(year)
         # Shrove Tuesday.
-        self[easter_date + rd(days=-47)] = "Fasnachtsdienstag"
+        self[easter_date + td(days=-47)] = "Fasnachtsdienstag"
 
         # Saint Joseph's Day.
         self[date(year, MAR, 19)] = "Josefstag"
 
         # Good Friday.
-        self[easter_date + rd(days=-2)] = "Karfreitag"
+        self[easter_date + td(days=-2)] = "Karfreitag"
 
         # Easter.
         self[easter_date] = "Ostersonntag"
 
         # Easter Monday.
-        self[easter_date + rd(days=+1)] = "Ostermontag"
+        self[easter_date + td(days=+1)] = "Ostermontag"
 
         # Labor Day.
         self[date(year, MAY, 1)] = "Tag der Arbeit"
 
         # Ascension Day.
-        self[easter_date + rd(days=+39)] = "Auffahrt"
+        self[easter_date + td(days=+39)] = "Auffahrt"
 
         # Pentecost.
-        self[easter_date + rd(days=+49)] = "Pfingstsonntag"
+        self[easter_date + td(days=+49)] = "Pfingstsonntag"
 
         # Whit Monday.
-        self[easter_date + rd(days=+50)] = "Pfingstmontag"
+        self[easter_date + td(days=+50)] = "Pfingstmontag"
 
         # Corpus Christi.
-        self[easter_date + rd(days=+60)] = "Fronleichnam"
+        self[easter_date + td(days=+60)] = "Fronleichnam"
 
         # National Day.
         self[date(year, AUG, 15)] = "Staatsfeiertag"
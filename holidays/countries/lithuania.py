@@ -10,11 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import SU
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -48,16 +49,16 @@ class Lithuania(HolidayBase):
         self[easter_date] = "Velykos"
 
         # Easter 2nd day
-        self[easter_date + rd(days=+1)] = "Velykų antroji diena"
+        self[easter_date + td(days=+1)] = "Velykų antroji diena"
 
         # International Workers' Day
         self[date(year, 5, 1)] = "Tarptautinė darbo diena"
 
         # Mother's day. First Sunday in May
-        self[date(year, 5, 1) + rd(weekday=SU)] = "Motinos diena"
+        self[_get_nth_weekday_from(1, SUN, date(year, 5, 1))] = "Motinos diena"
 
         # Fathers's day. First Sunday in June
-        self[date(year, 6, 1) + rd(weekday=SU)] = "Tėvo diena"
+        self[_get_nth_weekday_from(1, SUN, date(year, 6, 1))] = "Tėvo diena"
 
         # St. John's Day [Christian name],
         # Day of Dew [original pagan name]
@@ -10,12 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import SU
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAR, MAY, JUN, AUG, NOV, DEC
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, MAR, MAY, JUN, AUG, NOV, DEC, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -38,7 +39,7 @@ class Madagascar(HolidayBase):
         self[date(year, MAR, 29)] = "Fetin'ny mahery fo / Martyrs' Day"
         self[date(year, MAY, 1)] = "Labour Day"
         self[
-            date(year, JUN, 1) + rd(weekday=SU(+3))
+            _get_nth_weekday_of_month(3, SUN, JUN, year)
         ] = "Fetin'ny ray / Father's Day"
 
         if year >= 1960:
@@ -57,21 +58,21 @@ class Madagascar(HolidayBase):
 
         easter_date = easter(year)
         self[easter_date] = "Fetin'ny paska / Easter Sunday"
-        self[easter_date + rd(days=+1)] = "Alatsinain'ny paska / Easter Monday"
+        self[easter_date + td(days=+1)] = "Alatsinain'ny paska / Easter Monday"
         self[
-            easter_date + rd(days=+39)
+            easter_date + td(days=+39)
         ] = "Fiakaran'ny Jesosy kristy tany an-danitra / Ascension Day"
 
-        whit_sunday = easter_date + rd(days=+49)
+        whit_sunday = easter_date + td(days=+49)
         self[whit_sunday] = "Pentekosta / Whit Sunday"
 
         self[
-            easter_date + rd(days=+50)
+            easter_date + td(days=+50)
         ] = "Alatsinain'ny pentekosta / Whit Monday"
 
-        dt = date(year, MAY, 31) + rd(weekday=SU(-1))
+        dt = _get_last_weekday_of_month(SUN, MAY, year)
         if dt == whit_sunday:
-            dt += rd(days=+7)
+            dt += td(days=+7)
         self[dt] = "Fetin'ny Reny / Mother's Day"
 
 
@@ -10,12 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
-from dateutil.relativedelta import MO
 
-from holidays.constants import JAN, MAR, MAY, JUL, OCT, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import JAN, MAR, MAY, JUL, OCT, DEC, MON
 from holidays.holiday_base import HolidayBase
 
 
@@ -36,8 +36,8 @@ class Malawi(HolidayBase):
         self[date(year, JAN, 1)] = "New Year's Day"
 
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=-2)] = "Good Friday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         self[date(year, JAN, 15)] = "John Chilembwe Day"
         self[date(year, MAR, 3)] = "Martyrs Day"
@@ -51,7 +51,7 @@ class Malawi(HolidayBase):
         if self.observed:
             for k, v in list(self.items()):
                 if self._is_weekend(k) and k.year == year:
-                    self[k + rd(weekday=MO)] = v + " (Observed)"
+                    self[_get_nth_weekday_from(1, MON, k)] = v + " (Observed)"
 
 
 class MW(Malawi):
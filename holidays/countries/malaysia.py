@@ -10,16 +10,17 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 from typing import Iterable, Optional, Union
 
 from dateutil.easter import easter
-from dateutil.relativedelta import FR, MO, SA, SU
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.chinese import _ChineseLuniSolar
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC, FRI, SAT, SUN
+from holidays.constants import OCT, NOV, DEC, MON, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _ChineseLuniSolar, _islamic_to_gre
 
 
 class Malaysia(HolidayBase):
@@ -59,6 +60,8 @@ class Malaysia(HolidayBase):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
         """
         An subclass of :py:class:`HolidayBase` representing public holidays in
@@ -100,7 +103,9 @@ class Malaysia(HolidayBase):
         See parameters and usage in :py:class:`HolidayBase`.
         """
         self.cnls = _ChineseLuniSolar()
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
 
     def _populate(self, year):
         def _add_holiday(dt: date, hol: str) -> None:
@@ -118,7 +123,7 @@ class Malaysia(HolidayBase):
         # The second day of Chinese New Year is not a federal holiday in
         # Kelantan and Terengganu. However, it is gazetted as a state holiday
         # in both states, effectively making it a nationwide holiday.
-        self[hol_date + rd(days=+1)] = "Chinese New Year Holiday"
+        self[hol_date + td(days=+1)] = "Chinese New Year Holiday"
 
         # Wesak Day.
         # Date of observance is announced yearly
@@ -160,14 +165,14 @@ class Malaysia(HolidayBase):
 
         # Birthday of [His Majesty] the Yang di-Pertuan Agong.
         if year <= 2017:
-            hol_date = date(year, JUN, 1) + rd(weekday=SA)
+            hol_date = _get_nth_weekday_of_month(1, SAT, JUN, year)
         elif year == 2018:
             hol_date = date(2018, SEP, 9)
         elif year == 2020:
             # https://www.nst.com.my/news/nation/2020/03/571660/agongs-birthday-moved-june-6-june-8
             hol_date = date(2020, JUN, 8)
         else:
-            hol_date = date(year, JUN, 1) + rd(weekday=MO)
+            hol_date = _get_nth_weekday_of_month(1, MON, JUN, year)
         self[hol_date] = "Birthday of SPB Yang di-Pertuan Agong"
 
         # Hari Kebangsaan or National Day.
@@ -297,7 +302,7 @@ class Malaysia(HolidayBase):
         for hol_date, hol_suffix in hol_dates:
             _add_holiday(hol_date, f"{name}{hol_suffix}")
             _add_holiday(
-                hol_date + rd(days=+1), f"Second day of {name}{hol_suffix}"
+                hol_date + td(days=+1), f"Second day of {name}{hol_suffix}"
             )
 
         # Hari Raya Haji and Arafat Day.
@@ -342,11 +347,11 @@ class Malaysia(HolidayBase):
             _add_holiday(hol_date, f"{name}{hol_suffix}")
             if self.subdiv == "TRG":
                 # Arafat Day is one day before Eid al-Adha
-                _add_holiday(hol_date + rd(days=-1), f"Arafat Day{hol_suffix}")
+                _add_holiday(hol_date + td(days=-1), f"Arafat Day{hol_suffix}")
             if self.subdiv in {"KDH", "KTN", "PLS", "TRG"}:
                 # Second day
                 _add_holiday(
-                    hol_date + rd(days=+1), f"{name} Holiday{hol_suffix}"
+                    hol_date + td(days=+1), f"{name} Holiday{hol_suffix}"
                 )
 
         # ---------------------------------------------------------#
@@ -361,7 +366,7 @@ class Malaysia(HolidayBase):
 
             # Birthday of Tuan Yang Terutama Yang di-Pertua Negeri Sarawak (the
             # second Saturday of September).
-            second_sat_oct = date(year, OCT, 1) + rd(weekday=SA(+2))
+            second_sat_oct = _get_nth_weekday_of_month(2, SAT, OCT, year)
             self[second_sat_oct] = "Birthday of the Governor of Sarawak"
 
             # Sarawak Independence Day
@@ -552,7 +557,7 @@ class Malaysia(HolidayBase):
             if year >= 2020:
                 hol_date = date(year, AUG, 24)
             else:
-                hol_date = date(year, OCT, 1) + rd(weekday=FR(+2))
+                hol_date = _get_nth_weekday_of_month(2, FRI, OCT, year)
             self[hol_date] = "Birthday of the Governor of Malacca"
 
         elif self.subdiv == "NSN":
@@ -577,7 +582,7 @@ class Malaysia(HolidayBase):
         elif self.subdiv == "PNG":
             if year >= 2009:
                 self[date(year, JUL, 7)] = "George Town Heritage Day"
-            second_sat_jul = date(year, JUL, 1) + rd(weekday=SA(+2))
+            second_sat_jul = _get_nth_weekday_of_month(2, SAT, JUL, year)
             self[second_sat_jul] = "Birthday of the Governor of Penang"
 
         elif self.subdiv == "PLS":
@@ -613,23 +618,23 @@ class Malaysia(HolidayBase):
                 continue
             in_lieu_date = None
             if hol_date.weekday() == FRI and self.subdiv in {"JHR", "KDH"}:
-                in_lieu_date = hol_date + rd(days=+2)
+                in_lieu_date = hol_date + td(days=+2)
             elif hol_date.weekday() == SAT and self.subdiv in {
                 "KTN",
                 "TRG",
             }:
-                in_lieu_date = hol_date + rd(days=+1)
+                in_lieu_date = hol_date + td(days=+1)
             elif hol_date.weekday() == SUN and self.subdiv not in {
                 "JHR",
                 "KDH",
                 "KTN",
                 "TRG",
             }:
-                in_lieu_date = hol_date + rd(days=+1)
+                in_lieu_date = hol_date + td(days=+1)
             if not in_lieu_date:
                 continue
             while in_lieu_date.year == year and in_lieu_date in self:
-                in_lieu_date += rd(days=+1)
+                in_lieu_date += td(days=+1)
             _add_holiday(in_lieu_date, f"{hol_name} [In lieu]")
 
         # The last two days in May (Pesta Kaamatan).
@@ -705,7 +710,7 @@ class Malaysia(HolidayBase):
 
         # Good Friday.
         if self.subdiv in {"SBH", "SWK"}:
-            self[easter(year) + rd(days=-2)] = "Good Friday"
+            self[easter(year) + td(days=-2)] = "Good Friday"
 
         # -----------------------------
         # State holidays (single state)
@@ -745,7 +750,7 @@ class Malaysia(HolidayBase):
 
         elif self.subdiv == "KDH":
             if year >= 2020:
-                third_sun_jun = date(year, JUN, 1) + rd(weekday=SU(+3))
+                third_sun_jun = _get_nth_weekday_of_month(3, SUN, JUN, year)
                 self[third_sun_jun] = "Birthday of The Sultan of Kedah"
 
         elif self.subdiv == "KTN":
@@ -758,13 +763,13 @@ class Malaysia(HolidayBase):
             # This Holiday used to be on 27th until 2017
             # https://www.officeholidays.com/holidays/malaysia/birthday-of-the-sultan-of-perak  # noqa: E501
             if year >= 2018:
-                first_fri_nov = date(year, NOV, 1) + rd(weekday=FR)
+                first_fri_nov = _get_nth_weekday_of_month(1, FRI, NOV, year)
                 self[first_fri_nov] = "Birthday of the Sultan of Perak"
             else:
                 self[date(year, NOV, 27)] = "Birthday of the Sultan of Perak"
 
         elif self.subdiv == "SBH":
-            first_sat_oct = date(year, OCT, 1) + rd(weekday=SA)
+            first_sat_oct = _get_nth_weekday_of_month(1, SAT, OCT, year)
             self[first_sat_oct] = "Birthday of the Governor of Sabah"
             if year >= 2019:
                 self[date(year, DEC, 24)] = "Christmas Eve"
@@ -781,8 +786,12 @@ class MY(Malaysia):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
 
 
 class MYS(Malaysia):
@@ -796,5 +805,9 @@ class MYS(Malaysia):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
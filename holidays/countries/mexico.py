@@ -10,11 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
-
-from holidays.constants import FRI, SAT, SUN, JAN, FEB, MAR, MAY, SEP, NOV, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, FEB, MAR, MAY, SEP, NOV, DEC, MON, FRI
+from holidays.constants import SAT, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -25,9 +25,9 @@ class Mexico(HolidayBase):
     def _add_with_observed(self, holiday: date, name: str):
         self[holiday] = name
         if self.observed and holiday.weekday() == SAT:
-            self[holiday + rd(days=-1)] = name + " (Observed)"
+            self[holiday + td(days=-1)] = name + " (Observed)"
         elif self.observed and holiday.weekday() == SUN:
-            self[holiday + rd(days=+1)] = name + " (Observed)"
+            self[holiday + td(days=+1)] = name + " (Observed)"
 
     def _populate(self, year):
         super()._populate(year)
@@ -37,7 +37,7 @@ class Mexico(HolidayBase):
         dt = date(year, JAN, 1)
         self[dt] = name
         if self.observed and dt.weekday() == SUN:
-            self[dt + rd(days=+1)] = name + " (Observed)"
+            self[dt + td(days=+1)] = name + " (Observed)"
         # The next year's observed New Year's Day can be in this year
         # when it falls on a Friday (Jan 1st is a Saturday)
         if self.observed and date(year, DEC, 31).weekday() == FRI:
@@ -46,7 +46,7 @@ class Mexico(HolidayBase):
         # Constitution Day
         name = "Día de la Constitución [Constitution Day]"
         if self.observed and year >= 2007:
-            self[date(year, FEB, 1) + rd(weekday=MO(+1))] = (
+            self[_get_nth_weekday_of_month(1, MON, FEB, year)] = (
                 name + " (Observed)"
             )
 
@@ -56,7 +56,7 @@ class Mexico(HolidayBase):
         # Benito Juárez's birthday
         name = "Natalicio de Benito Juárez [Benito Juárez's birthday]"
         if self.observed and year >= 2007:
-            self[date(year, MAR, 1) + rd(weekday=MO(+3))] = (
+            self[_get_nth_weekday_of_month(3, MON, MAR, year)] = (
                 name + " (Observed)"
             )
 
@@ -77,7 +77,7 @@ class Mexico(HolidayBase):
         # Revolution Day
         name = "Día de la Revolución [Revolution Day]"
         if self.observed and year >= 2007:
-            self[date(year, NOV, 1) + rd(weekday=MO(+3))] = (
+            self[_get_nth_weekday_of_month(3, MON, NOV, year)] = (
                 name + " (Observed)"
             )
 
@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUL, SUN
 from holidays.holiday_base import HolidayBase
@@ -34,12 +34,12 @@ class Montenegro(HolidayBase):
     ) -> None:
         if holiday_date_1.weekday() == SUN:
             self[holiday_date_1] = holiday_name
-            self[holiday_date_1 + rd(days=+1)] = f"{holiday_name} (Observed)"
-            self[holiday_date_1 + rd(days=+2)] = f"{holiday_name} (Observed)"
+            self[holiday_date_1 + td(days=+1)] = f"{holiday_name} (Observed)"
+            self[holiday_date_1 + td(days=+2)] = f"{holiday_name} (Observed)"
         elif holiday_date_2.weekday() == SUN:
             self[holiday_date_1] = holiday_name
             self[holiday_date_2] = holiday_name
-            self[holiday_date_2 + rd(days=+1)] = f"{holiday_name} (Observed)"
+            self[holiday_date_2 + td(days=+1)] = f"{holiday_name} (Observed)"
         else:
             self[holiday_date_1] = holiday_name
             self[holiday_date_2] = holiday_name
@@ -63,13 +63,13 @@ class Montenegro(HolidayBase):
         easter_sunday = easter(year, method=EASTER_ORTHODOX)
 
         # Good Friday.
-        self[easter_sunday + rd(days=-2)] = "Orthodox Good Friday"
+        self[easter_sunday + td(days=-2)] = "Orthodox Good Friday"
 
         # Easter Sunday.
         self[easter_sunday] = "Orthodox Easter Sunday"
 
         # Easter Monday.
-        self[easter_sunday + rd(days=+1)] = "Orthodox Easter Monday"
+        self[easter_sunday + td(days=+1)] = "Orthodox Easter Monday"
 
         # Labour Day.
         self._add_holiday_observed(
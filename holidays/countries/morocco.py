@@ -10,12 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAR, MAY, JUL, AUG, NOV
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class Morocco(HolidayBase):
@@ -103,7 +102,7 @@ class Morocco(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 10, 1):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Eid al-Fitr")
-                _add_holiday(hol_date + rd(days=+1), "Eid al-Fitr")
+                _add_holiday(hol_date + td(days=+1), "Eid al-Fitr")
 
         # Eid al-Adha - Sacrifice Festive
         # date of observance is announced yearly
@@ -111,7 +110,7 @@ class Morocco(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 12, 10):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Eid al-Adha")
-                _add_holiday(hol_date + rd(days=+1), "Eid al-Adha")
+                _add_holiday(hol_date + td(days=+1), "Eid al-Adha")
 
         # Islamic New Year - (hijari_year, 1, 1)
         for date_obs in _islamic_to_gre(year, 1, 1):
@@ -123,7 +122,7 @@ class Morocco(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 3, 12):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Aid al Mawlid Annabawi")
-                _add_holiday(hol_date + rd(days=+1), "Aid al Mawlid Annabawi")
+                _add_holiday(hol_date + td(days=+1), "Aid al Mawlid Annabawi")
 
 
 class MA(Morocco):
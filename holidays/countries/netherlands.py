@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, APR, MAY, AUG, DEC, SUN
 from holidays.holiday_base import HolidayBase
@@ -37,19 +37,19 @@ class Netherlands(HolidayBase):
         self[easter_date] = "Eerste paasdag"
 
         # Good friday
-        self[easter_date + rd(days=-2)] = "Goede Vrijdag"
+        self[easter_date + td(days=-2)] = "Goede Vrijdag"
 
         # Second easter day
-        self[easter_date + rd(days=+1)] = "Tweede paasdag"
+        self[easter_date + td(days=+1)] = "Tweede paasdag"
 
         # Ascension day
-        self[easter_date + rd(days=+39)] = "Hemelvaart"
+        self[easter_date + td(days=+39)] = "Hemelvaart"
 
         # Pentecost
-        self[easter_date + rd(days=+49)] = "Eerste Pinksterdag"
+        self[easter_date + td(days=+49)] = "Eerste Pinksterdag"
 
         # Pentecost monday
-        self[easter_date + rd(days=+50)] = "Tweede Pinksterdag"
+        self[easter_date + td(days=+50)] = "Tweede Pinksterdag"
 
         # First christmas
         self[date(year, DEC, 25)] = "Eerste Kerstdag"
@@ -65,7 +65,7 @@ class Netherlands(HolidayBase):
         if year >= 2014:
             kings_day = date(year, APR, 27)
             if kings_day.weekday() == SUN:
-                kings_day += rd(days=-1)
+                kings_day += td(days=-1)
 
             self[kings_day] = "Koningsdag"
 
@@ -76,7 +76,7 @@ class Netherlands(HolidayBase):
                 queens_day = date(year, AUG, 31)
 
             if queens_day.weekday() == SUN:
-                queens_day += rd(days=1) if year < 1980 else rd(days=-1)
+                queens_day += td(days=1) if year < 1980 else td(days=-1)
 
             self[queens_day] = "Koninginnedag"
 
@@ -10,13 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, MAY, JUN, OCT, DEC
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class Nigeria(HolidayBase):
@@ -45,8 +45,8 @@ class Nigeria(HolidayBase):
         # Calculate Easter for given year
         # followed by easter related holidays
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=-2)] = "Good Friday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         # Worker's day
         if year >= 1981:
@@ -58,7 +58,7 @@ class Nigeria(HolidayBase):
         for yr in (year - 1, year):
             for hol_date in _islamic_to_gre(yr, 10, 1):
                 _add_holiday(hol_date, "Eid al-Fitr")
-                _add_holiday(hol_date + rd(days=+1), "Eid al-Fitr Holiday")
+                _add_holiday(hol_date + td(days=+1), "Eid al-Fitr Holiday")
 
         # Arafat Day & Eid al-Adha - Scarfice Festive
         # This is an estimate
@@ -66,7 +66,7 @@ class Nigeria(HolidayBase):
         for yr in (year - 1, year):
             for hol_date in _islamic_to_gre(yr, 12, 10):
                 _add_holiday(hol_date, "Eid al-Adha")
-                _add_holiday(hol_date + rd(days=+1), "Eid al-Adha Holiday")
+                _add_holiday(hol_date + td(days=+1), "Eid al-Adha Holiday")
 
         # Birthday of Prophet Muhammad
         for hol_date in _islamic_to_gre(year, 3, 12):
@@ -94,11 +94,11 @@ class Nigeria(HolidayBase):
         if self.observed and year >= 2016:
             for k, v in list(self.items()):
                 if self._is_weekend(k) and k.year == year:
-                    next_workday = k + rd(days=+1)
+                    next_workday = k + td(days=+1)
                     while self._is_weekend(next_workday) or self.get(
                         next_workday
                     ):
-                        next_workday += rd(days=+1)
+                        next_workday += td(days=+1)
                     self[next_workday] = v + " (Observed)"
 
 
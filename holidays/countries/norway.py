@@ -10,11 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date, datetime
+from datetime import timedelta as td
 
 from dateutil import rrule
 from dateutil.easter import easter
 from dateutil.relativedelta import SU
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, DEC
 from holidays.holiday_base import HolidayBase
@@ -48,6 +48,11 @@ class Norway(HolidayBase):
         self.include_sundays = include_sundays
         HolidayBase.__init__(self, **kwargs)
 
+    def _year_cache_key(self, year, observed):
+        return super()._year_cache_key(year, observed) + (
+            self.include_sundays,
+        )
+
     def _populate(self, year):
         super()._populate(year)
 
@@ -85,13 +90,13 @@ class Norway(HolidayBase):
         # "(...) has been celebrated for over 1000 years (...)" (in Norway)
 
         easter_date = easter(year)
-        self[easter_date + rd(days=-3)] = "Skjærtorsdag"
-        self[easter_date + rd(days=-2)] = "Langfredag"
+        self[easter_date + td(days=-3)] = "Skjærtorsdag"
+        self[easter_date + td(days=-2)] = "Langfredag"
         self[easter_date] = "Første påskedag"
-        self[easter_date + rd(days=+1)] = "Andre påskedag"
-        self[easter_date + rd(days=+39)] = "Kristi himmelfartsdag"
-        self[easter_date + rd(days=+49)] = "Første pinsedag"
-        self[easter_date + rd(days=+50)] = "Andre pinsedag"
+        self[easter_date + td(days=+1)] = "Andre påskedag"
+        self[easter_date + td(days=+39)] = "Kristi himmelfartsdag"
+        self[easter_date + td(days=+49)] = "Første pinsedag"
+        self[easter_date + td(days=+50)] = "Andre pinsedag"
 
 
 class NO(Norway):
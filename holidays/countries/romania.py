@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUN, AUG, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -39,7 +39,7 @@ class Romania(HolidayBase):
 
         # Easter (Friday, Sunday and Monday)
         for day_after_easter in (-2, 0, 1):
-            self[easter_date + rd(days=day_after_easter)] = "Paștele"
+            self[easter_date + td(days=day_after_easter)] = "Paștele"
 
         # Labour Day
         self[date(year, MAY, 1)] = "Ziua Muncii"
@@ -50,7 +50,7 @@ class Romania(HolidayBase):
 
         # Whit Monday
         for day_after_easter in (49, 50):
-            self[easter_date + rd(days=day_after_easter)] = "Rusaliile"
+            self[easter_date + td(days=day_after_easter)] = "Rusaliile"
 
         # Assumption of Mary
         self[date(year, AUG, 15)] = "Adormirea Maicii Domnului"
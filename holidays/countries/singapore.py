@@ -10,15 +10,16 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 from typing import Dict, Iterable, Optional, Tuple, Union
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, SEP, AUG
+from holidays.calendars.chinese import _ChineseLuniSolar
+from holidays.calendars.islamic import _islamic_to_gre
+from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
 from holidays.constants import OCT, NOV, DEC, SUN
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _ChineseLuniSolar, _islamic_to_gre
 
 
 class Singapore(HolidayBase):
@@ -45,6 +46,8 @@ class Singapore(HolidayBase):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
         """
         A subclass of :py:class:`HolidayBase` representing public holidays in
@@ -81,7 +84,9 @@ class Singapore(HolidayBase):
         """
 
         self.cnls = _ChineseLuniSolar()
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
 
     def _populate(self, year) -> None:
         def _add_holiday(dt: date, hol: str) -> None:
@@ -96,7 +101,7 @@ class Singapore(HolidayBase):
         # Chinese New Year (two days)
         hol_date = self.cnls.lunar_n_y_date(year)
         self[hol_date] = "Chinese New Year"
-        self[hol_date + rd(days=+1)] = "Chinese New Year"
+        self[hol_date + td(days=+1)] = "Chinese New Year"
 
         # Hari Raya Puasa
         # aka Eid al-Fitr
@@ -140,7 +145,7 @@ class Singapore(HolidayBase):
                 # Second day of Hari Raya Puasa (up to and including 1968)
                 if year <= 1968:
                     _add_holiday(
-                        hol_date + rd(days=+1),
+                        hol_date + td(days=+1),
                         "Second day of Hari Raya Puasa* (*estimated)",
                     )
 
@@ -183,14 +188,14 @@ class Singapore(HolidayBase):
 
         easter_date = easter(year)
         # Good Friday
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-2)] = "Good Friday"
 
         if year <= 1968:
             # Holy Saturday
-            self[easter_date + rd(days=-1)] = "Holy Saturday"
+            self[easter_date + td(days=-1)] = "Holy Saturday"
 
             # Easter Monday
-            self[easter_date + rd(days=+1)] = "Easter Monday"
+            self[easter_date + td(days=+1)] = "Easter Monday"
 
         # Labour Day
         self[date(year, MAY, 1)] = "Labour Day"
@@ -284,9 +289,9 @@ class Singapore(HolidayBase):
         if self.observed and year >= 1998:
             for (hol_date, hol_name) in list(self.items()):
                 if hol_date.year == year and hol_date.weekday() == SUN:
-                    in_lieu_date = hol_date + rd(days=+1)
+                    in_lieu_date = hol_date + td(days=+1)
                     while in_lieu_date.year == year and in_lieu_date in self:
-                        in_lieu_date += rd(days=+1)
+                        in_lieu_date += td(days=+1)
                     _add_holiday(in_lieu_date, f"{hol_name} (Observed)")
 
         # special case (observed from previuos year)
@@ -305,8 +310,12 @@ class SG(Singapore):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
 
 
 class SGP(Singapore):
@@ -320,5 +329,9 @@ class SGP(Singapore):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,
         state: Optional[str] = None,
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
-        super().__init__(years, expand, observed, subdiv, prov, state)
+        super().__init__(
+            years, expand, observed, subdiv, prov, state, strict, granularity
+        )
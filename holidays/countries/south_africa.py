@@ -10,13 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, FR
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT
-from holidays.constants import NOV, DEC, SUN
+from holidays.constants import NOV, DEC, MON, FRI, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -60,12 +60,12 @@ class SouthAfrica(HolidayBase):
         self[date(year, JAN, 1)] = "New Year's Day"
 
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-2)] = "Good Friday"
         if year >= 1980:
             name = "Family Day"
         else:
             name = "Easter Monday"
-        self[easter_date + rd(days=+1)] = name
+        self[easter_date + td(days=+1)] = name
 
         if year <= 1951:
             name = "Dingaan's Day"
@@ -100,7 +100,7 @@ class SouthAfrica(HolidayBase):
             for k, v in list(self.items()):
                 if k.weekday() != SUN or k.year != year:
                     continue
-                dt = k + rd(days=+1)
+                dt = k + td(days=+1)
                 if dt in self:
                     continue
                 self[dt] = v + " (Observed)"
@@ -113,10 +113,12 @@ class SouthAfrica(HolidayBase):
 
         if 1987 <= year <= 1989:
             # observed on first Friday in May
-            self[(date(year, MAY, 1) + rd(weekday=FR))] = "Workers' Day"
+            self[
+                (_get_nth_weekday_of_month(1, FRI, MAY, year))
+            ] = "Workers' Day"
 
         if year <= 1993:
-            self[easter_date + rd(days=+40)] = "Ascension Day"
+            self[easter_date + td(days=+40)] = "Ascension Day"
 
         if year <= 1951:
             self[date(year, MAY, 24)] = "Empire Day"
@@ -129,7 +131,7 @@ class SouthAfrica(HolidayBase):
         if 1952 <= year <= 1960:
             # observed on second Monday in July
             self[
-                (date(year, JUL, 1) + rd(weekday=MO(+2)))
+                (_get_nth_weekday_of_month(2, MON, JUL, year))
             ] = "Queen's Birthday"
 
         if 1961 <= year <= 1973:
@@ -137,11 +139,15 @@ class SouthAfrica(HolidayBase):
 
         if year <= 1951:
             # observed on first Monday in August
-            self[(date(year, AUG, 1) + rd(weekday=MO))] = "King's Birthday"
+            self[
+                (_get_nth_weekday_of_month(1, MON, AUG, year))
+            ] = "King's Birthday"
 
         if 1952 <= year <= 1979:
             # observed on first Monday in September
-            self[(date(year, SEP, 1) + rd(weekday=MO))] = "Settlers' Day"
+            self[
+                (_get_nth_weekday_of_month(1, MON, SEP, year))
+            ] = "Settlers' Day"
 
         if 1952 <= year <= 1993:
             self[date(year, OCT, 10)] = "Kruger Day"
@@ -9,17 +9,14 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-
 import warnings
 from datetime import date
+from datetime import timedelta as td
 from typing import Tuple
 
-from dateutil.relativedelta import relativedelta as rd
-
-# Installation: pip install korean_lunar_calendar
-# URL: https://github.com/usingsky/korean_lunar_calendar_py/
-from korean_lunar_calendar import KoreanLunarCalendar
-
+from holidays.calendars.korean import _END_YEAR as _LUNAR_END_YEAR
+from holidays.calendars.korean import _START_YEAR as _LUNAR_START_YEAR
+from holidays.calendars.korean import _korean_lunar_to_gre
 from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, OCT, DEC
 from holidays.constants import SAT, SUN
 from holidays.holiday_base import HolidayBase
@@ -47,10 +44,6 @@ class SouthKorea(HolidayBase):
         2020: ((AUG, 17, "Alternative public holiday"),)
     }
 
-    def __init__(self, **kwargs):
-        self.korean_cal = KoreanLunarCalendar()
-        HolidayBase.__init__(self, **kwargs)
-
     def _populate(self, year):
         super()._populate(year)
 
@@ -60,30 +53,41 @@ class SouthKorea(HolidayBase):
         name = "New Year's Day"
         self[date(year, JAN, 1)] = name
 
+        # The lunar holidays are only available within the range of the
+        # Korean lunar calendar table.
+        lunar_supported = _LUNAR_START_YEAR <= year <= _LUNAR_END_YEAR
+        if not lunar_supported:
+            warnings.warn(
+                "Korean lunar calendar holidays available from "
+                f"{_LUNAR_START_YEAR} to {_LUNAR_END_YEAR} only",
+                Warning,
+            )
+
         # Lunar New Year
-        name = "Lunar New Year's Day"
-        preceding_day_lunar = "The day preceding of " + name
-        second_day_lunar = "The second day of " + name
-
-        dt = self.get_solar_date(year, 1, 1)
-        new_year_date = date(dt.year, dt.month, dt.day)
-
-        self[new_year_date + rd(days=-1)] = preceding_day_lunar
-        self[new_year_date] = name
-        self[new_year_date + rd(days=+1)] = second_day_lunar
-
-        if self.observed and year >= 2015:
-            for cur_rd, cur_name in [
-                (-1, preceding_day_lunar),
-                (0, name),
-                (+1, second_day_lunar),
-            ]:
-                target_date = new_year_date + rd(days=cur_rd)
-                is_alt, alt_date = self.get_next_first_non_holiday(
-                    cur_name, target_date
-                )
-                if is_alt:
-                    self[alt_date] = alt_holiday + name
+        if lunar_supported:
+            name = "Lunar New Year's Day"
+            preceding_day_lunar = "The day preceding of " + name
+            second_day_lunar = "The second day of " + name
+
+            dt = self.get_solar_date(year, 1, 1)
+            new_year_date = date(dt.year, dt.month, dt.day)
+
+            self[new_year_date + td(days=-1)] = preceding_day_lunar
+            self[new_year_date] = name
+            self[new_year_date + td(days=+1)] = second_day_lunar
+
+            if self.observed and year >= 2015:
+                for cur_rd, cur_name in [
+                    (-1, preceding_day_lunar),
+                    (0, name),
+                    (+1, second_day_lunar),
+                ]:
+                    target_date = new_year_date + td(days=cur_rd)
+                    is_alt, alt_date = self.get_next_first_non_holiday(
+                        cur_name, target_date
+                    )
+                    if is_alt:
+                        self[alt_date] = alt_holiday + name
 
         # Independence Movement Day
         name = "Independence Movement Day"
@@ -106,10 +110,11 @@ class SouthKorea(HolidayBase):
             self[planting_date] = name
 
         # Birthday of the Buddha
-        name = "Birthday of the Buddha"
-        dt = self.get_solar_date(year, 4, 8)
-        buddha_date = date(dt.year, dt.month, dt.day)
-        self[buddha_date] = name
+        if lunar_supported:
+            name = "Birthday of the Buddha"
+            dt = self.get_solar_date(year, 4, 8)
+            buddha_date = date(dt.year, dt.month, dt.day)
+            self[buddha_date] = name
 
         # Children's Day
         name = "Children's Day"
@@ -161,29 +166,30 @@ class SouthKorea(HolidayBase):
             pass
 
         # Korean Mid Autumn Day
-        name = "Chuseok"
-        preceding_day_chuseok = "The day preceding of " + name
-        second_day_chuseok = "The second day of " + name
-
-        dt = self.get_solar_date(year, 8, 15)
-        chuseok_date = date(dt.year, dt.month, dt.day)
-
-        self[chuseok_date + rd(days=-1)] = preceding_day_chuseok
-        self[chuseok_date] = name
-        self[chuseok_date + rd(days=+1)] = second_day_chuseok
-
-        if self.observed and year >= 2014:
-            for cur_rd, cur_name in [
-                (-1, preceding_day_chuseok),
-                (0, name),
-                (+1, second_day_chuseok),
-            ]:
-                target_date = chuseok_date + rd(days=cur_rd)
-                is_alt, alt_date = self.get_next_first_non_holiday(
-                    cur_name, target_date
-                )
-                if is_alt:
-                    self[alt_date] = alt_holiday + name
+        if lunar_supported:
+            name = "Chuseok"
+            preceding_day_chuseok = "The day preceding of " + name
+            second_day_chuseok = "The second day of " + name
+
+            dt = self.get_solar_date(year, 8, 15)
+            chuseok_date = date(dt.year, dt.month, dt.day)
+
+            self[chuseok_date + td(days=-1)] = preceding_day_chuseok
+            self[chuseok_date] = name
+            self[chuseok_date + td(days=+1)] = second_day_chuseok
+
+            if self.observed and year >= 2014:
+                for cur_rd, cur_name in [
+                    (-1, preceding_day_chuseok),
+                    (0, name),
+                    (+1, second_day_chuseok),
+                ]:
+                    target_date = chuseok_date + td(days=cur_rd)
+                    is_alt, alt_date = self.get_next_first_non_holiday(
+                        cur_name, target_date
+                    )
+                    if is_alt:
+                        self[alt_date] = alt_holiday + name
 
         # National Foundation Day
         name = "National Foundation Day"
@@ -231,12 +237,7 @@ class SouthKorea(HolidayBase):
         :return:
            The Korean Gregorian date.
         """
-        self.korean_cal.setLunarDate(year, month, day, False)
-        return date(
-            self.korean_cal.solarYear,
-            self.korean_cal.solarMonth,
-            self.korean_cal.solarDay,
-        )
+        return _korean_lunar_to_gre(year, month, day)
 
     def get_next_first_non_holiday(
         self, name: str, cur: date, include_sat: bool = False
@@ -269,7 +270,7 @@ class SouthKorea(HolidayBase):
             cur in self and name != self[cur]
         )  # Exclude if already a holiday
         while check_1 or check_2:
-            cur += rd(days=+1)
+            cur += td(days=+1)
             check_1 = cur.weekday() in target_weekday
             check_2 = cur in self and name != self[cur]
 
@@ -10,13 +10,14 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date, datetime
+from datetime import timedelta as td
 
 from dateutil import rrule
 from dateutil.easter import easter
-from dateutil.relativedelta import FR, SA, SU
-from dateutil.relativedelta import relativedelta as rd
+from dateutil.relativedelta import SU
 
-from holidays.constants import JAN, MAR, MAY, JUN, OCT, DEC
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.constants import JAN, MAR, MAY, JUN, OCT, DEC, FRI, SAT
 from holidays.holiday_base import HolidayBase
 
 
@@ -45,6 +46,11 @@ class Sweden(HolidayBase):
         self.include_sundays = include_sundays
         HolidayBase.__init__(self, **kwargs)
 
+    def _year_cache_key(self, year, observed):
+        return super()._year_cache_key(year, observed) + (
+            self.include_sundays,
+        )
+
     def _populate(self, year):
         super()._populate(year)
 
@@ -79,28 +85,34 @@ class Sweden(HolidayBase):
 
         # ========= Moving holidays =========
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Långfredagen"
+        self[easter_date + td(days=-2)] = "Långfredagen"
         self[easter_date] = "Påskdagen"
-        self[easter_date + rd(days=+1)] = "Annandag påsk"
-        self[easter_date + rd(days=+39)] = "Kristi himmelsfärdsdag"
-        self[easter_date + rd(days=+49)] = "Pingstdagen"
+        self[easter_date + td(days=+1)] = "Annandag påsk"
+        self[easter_date + td(days=+39)] = "Kristi himmelsfärdsdag"
+        self[easter_date + td(days=+49)] = "Pingstdagen"
         if year <= 2004:
-            self[easter_date + rd(days=+50)] = "Annandag pingst"
+            self[easter_date + td(days=+50)] = "Annandag pingst"
 
         # Source:
         # https://sv.wikipedia.org/wiki/Midsommarafton
         # https://www.nordiskamuseet.se/aretsdagar/midsommarafton
         if year >= 1953:
             # Midsummer evening. Friday between June 19th and June 25th
-            self[date(year, JUN, 19) + rd(weekday=FR)] = "Midsommarafton"
+            self[
+                _get_nth_weekday_from(1, FRI, date(year, JUN, 19))
+            ] = "Midsommarafton"
             # Midsummer day. Saturday between June 20th and June 26th
-            self[date(year, JUN, 20) + rd(weekday=SA)] = "Midsommardagen"
+            self[
+                _get_nth_weekday_from(1, SAT, date(year, JUN, 20))
+            ] = "Midsommardagen"
         else:
             self[date(year, JUN, 23)] = "Midsommarafton"
             self[date(year, JUN, 24)] = "Midsommardagen"
 
         # All saints day. Saturday between October 31th and November 6th
-        self[date(year, OCT, 31) + rd(weekday=SA)] = "Alla helgons dag"
+        self[
+            _get_nth_weekday_from(1, SAT, date(year, OCT, 31))
+        ] = "Alla helgons dag"
 
         if year <= 1953:
             self[date(year, MAR, 25)] = "Jungfru Marie bebådelsedag"
@@ -10,12 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.chinese import _ChineseLuniSolar
 from holidays.constants import JAN, FEB, APR, OCT
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _ChineseLuniSolar
 
 
 class Taiwan(HolidayBase):
@@ -38,10 +37,10 @@ class Taiwan(HolidayBase):
                 date(year, JAN, 1)
             ] = "Founding of the Republic of China (New Year's Day)"
             hol_date = self.cnls.lunar_n_y_date(year)
-            self[hol_date + rd(days=-1)] = "Chinese New Year's Eve"
+            self[hol_date + td(days=-1)] = "Chinese New Year's Eve"
             self[hol_date] = "Spring Festival"
-            self[hol_date + rd(days=+1)] = "Spring Festival"
-            self[hol_date + rd(days=+2)] = "Spring Festival"
+            self[hol_date + td(days=+1)] = "Spring Festival"
+            self[hol_date + td(days=+2)] = "Spring Festival"
             self[date(year, APR, 4)] = "Children's Day"
             self[self.cnls.lunar_to_gre(year, 5, 5)] = "Dragon Boat Festival"
             self[self.cnls.lunar_to_gre(year, 8, 15)] = "Mid-Autumn Festival"
@@ -51,8 +50,8 @@ class Taiwan(HolidayBase):
             self[date(year, FEB, 28)] = "Peace Memorial Day"
         if year == 2021:
             hol_date = self.cnls.lunar_n_y_date(year)
-            self[hol_date + rd(days=+3)] = "Spring Festival"
-            self[hol_date + rd(days=+4)] = "Spring Festival"
+            self[hol_date + td(days=+3)] = "Spring Festival"
+            self[hol_date + td(days=+4)] = "Spring Festival"
 
 
 class TW(Taiwan):
@@ -10,12 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
+from holidays.calendars.islamic import _islamic_to_gre
 from holidays.constants import JAN, APR, MAY, JUL, AUG, OCT
 from holidays.holiday_base import HolidayBase
-from holidays.utils import _islamic_to_gre
 
 
 class Turkey(HolidayBase):
@@ -67,8 +66,8 @@ class Turkey(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 10, 1):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Ramadan Feast")
-                _add_holiday(hol_date + rd(days=+1), "Ramadan Feast Holiday")
-                _add_holiday(hol_date + rd(days=+2), "Ramadan Feast Holiday")
+                _add_holiday(hol_date + td(days=+1), "Ramadan Feast Holiday")
+                _add_holiday(hol_date + td(days=+2), "Ramadan Feast Holiday")
 
         # Sacrifice Feast
         # Date of observance is announced yearly, This is an estimate.
@@ -76,9 +75,9 @@ class Turkey(HolidayBase):
             for date_obs in _islamic_to_gre(yr, 12, 10):
                 hol_date = date_obs
                 _add_holiday(hol_date, "Sacrifice Feast")
-                _add_holiday(hol_date + rd(days=+1), "Sacrifice Feast Holiday")
-                _add_holiday(hol_date + rd(days=+2), "Sacrifice Feast Holiday")
-                _add_holiday(hol_date + rd(days=+3), "Sacrifice Feast Holiday")
+                _add_holiday(hol_date + td(days=+1), "Sacrifice Feast Holiday")
+                _add_holiday(hol_date + td(days=+2), "Sacrifice Feast Holiday")
+                _add_holiday(hol_date + td(days=+3), "Sacrifice Feast Holiday")
 
 
 class TR(Turkey):
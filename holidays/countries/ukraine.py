@@ -10,11 +10,11 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import EASTER_ORTHODOX, easter
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, APR, MAR, MAY, JUN, JUL, AUG, SEP, OCT
+from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT
 from holidays.constants import NOV, DEC
 from holidays.holiday_base import HolidayBase
 
@@ -54,7 +54,7 @@ class Ukraine(HolidayBase):
             self[easter_date] = "Великдень (Пасха)"
 
             # Holy trinity
-            self[easter_date + rd(days=+49)] = "Трійця"
+            self[easter_date + td(days=+49)] = "Трійця"
 
         # Labour Day
         name = "День міжнародної солідарності трудящих"
@@ -130,11 +130,11 @@ class Ukraine(HolidayBase):
                         or k >= date(1999, APR, 23)
                     )
                 ):
-                    next_workday = k + rd(days=+1)
+                    next_workday = k + td(days=+1)
                     while self._is_weekend(next_workday) or self.get(
                         next_workday
                     ):
-                        next_workday += rd(days=+1)
+                        next_workday += td(days=+1)
                     self[next_workday] = "Вихідний за " + v
 
         # USSR holidays
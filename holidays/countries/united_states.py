@@ -10,13 +10,16 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, TU, TH, FR
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC, MON, WED, FRI, SAT, SUN
+from holidays.constants import OCT, NOV, DEC, MON, TUE, WED, THU, FRI, SAT
+from holidays.constants import SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -95,9 +98,9 @@ class UnitedStates(HolidayBase):
         if not self.observed:
             return
         if dt.weekday() == SAT and before:
-            self[dt + rd(days=-1)] = f"{name} (Observed)"
+            self[dt + td(days=-1)] = f"{name} (Observed)"
         elif dt.weekday() == SUN and after:
-            self[dt + rd(days=+1)] = f"{name} (Observed)"
+            self[dt + td(days=+1)] = f"{name} (Observed)"
 
     def _populate(self, year):
         super()._populate(year)
@@ -123,10 +126,10 @@ class UnitedStates(HolidayBase):
         if self.subdiv == "VA" and year <= 2020:
             name = "Lee Jackson Day"
             if year >= 2000:
-                dt = date(year, JAN, 1) + rd(weekday=MO(+3)) + rd(days=-3)
+                dt = _get_nth_weekday_of_month(3, MON, JAN, year) + td(days=-3)
                 self[dt] = name
             elif year >= 1983:
-                self[date(year, JAN, 1) + rd(weekday=MO(+3))] = name
+                self[_get_nth_weekday_of_month(3, MON, JAN, year)] = name
             elif year >= 1889:
                 self[date(year, JAN, 19)] = name
 
@@ -160,7 +163,7 @@ class UnitedStates(HolidayBase):
                 name = "Robert E. Lee's Birthday"
             elif self.subdiv == "ID" and year >= 2006:
                 name = "Martin Luther King Jr. - Idaho Human Rights Day"
-            self[date(year, JAN, 1) + rd(weekday=MO(+3))] = name
+            self[_get_nth_weekday_of_month(3, MON, JAN, year)] = name
 
         # Lincoln's Birthday
         if (
@@ -187,7 +190,7 @@ class UnitedStates(HolidayBase):
             name = "Presidents' Day"
         if self.subdiv not in {"DE", "FL", "GA", "NM", "PR"}:
             if year >= 1971:
-                self[date(year, FEB, 1) + rd(weekday=MO(+3))] = name
+                self[_get_nth_weekday_of_month(3, MON, FEB, year)] = name
             elif year >= 1879:
                 self[date(year, FEB, 22)] = name
         elif self.subdiv == "GA":
@@ -196,20 +199,24 @@ class UnitedStates(HolidayBase):
             else:
                 self[date(year, DEC, 26)] = name
         elif self.subdiv in {"PR", "VI"}:
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = name
+            self[_get_nth_weekday_of_month(3, MON, FEB, year)] = name
 
         easter_date = easter(year)
         # Mardi Gras
         if self.subdiv == "LA" and year >= 1857:
-            self[easter_date + rd(days=-47)] = "Mardi Gras"
+            self[easter_date + td(days=-47)] = "Mardi Gras"
 
         # Guam Discovery Day
         if self.subdiv == "GU" and year >= 1970:
-            self[date(year, MAR, 1) + rd(weekday=MO)] = "Guam Discovery Day"
+            self[
+                _get_nth_weekday_of_month(1, MON, MAR, year)
+            ] = "Guam Discovery Day"
 
         # Casimir Pulaski Day
         if self.subdiv == "IL" and year >= 1978:
-            self[date(year, MAR, 1) + rd(weekday=MO)] = "Casimir Pulaski Day"
+            self[
+                _get_nth_weekday_of_month(1, MON, MAR, year)
+            ] = "Casimir Pulaski Day"
 
         # Texas Independence Day
         if self.subdiv == "TX" and year >= 1874:
@@ -217,7 +224,9 @@ class UnitedStates(HolidayBase):
 
         # Town Meeting Day
         if self.subdiv == "VT" and year >= 1800:
-            self[date(year, MAR, 1) + rd(weekday=TU)] = "Town Meeting Day"
+            self[
+                _get_nth_weekday_of_month(1, TUE, MAR, year)
+            ] = "Town Meeting Day"
 
         # Evacuation Day
         if self.subdiv == "MA" and year >= 1901:
@@ -225,7 +234,7 @@ class UnitedStates(HolidayBase):
             dt = date(year, MAR, 17)
             self[dt] = name
             if self.observed and self._is_weekend(dt):
-                self[dt + rd(weekday=MO)] = f"{name} (Observed)"
+                self[_get_nth_weekday_from(1, MON, dt)] = f"{name} (Observed)"
 
         # Emancipation Day
         if self.subdiv == "PR":
@@ -243,7 +252,7 @@ class UnitedStates(HolidayBase):
         if self.subdiv == "AK":
             name = "Seward's Day"
             if year >= 1955:
-                self[date(year, MAR, 31) + rd(weekday=MO(-1))] = name
+                self[_get_last_weekday_of_month(MON, MAR, year)] = name
             elif year >= 1918:
                 self[date(year, MAR, 30)] = name
 
@@ -267,13 +276,13 @@ class UnitedStates(HolidayBase):
         if self.subdiv in {"MA", "ME"}:
             name = "Patriots' Day"
             if year >= 1969:
-                self[date(year, APR, 1) + rd(weekday=MO(+3))] = name
+                self[_get_nth_weekday_of_month(3, MON, APR, year)] = name
             elif year >= 1894:
                 self[date(year, APR, 19)] = name
 
         # Holy Thursday
         if self.subdiv == "VI":
-            self[easter_date + rd(days=-3)] = "Holy Thursday"
+            self[easter_date + td(days=-3)] = "Holy Thursday"
 
         # Good Friday
         if self.subdiv in {
@@ -290,11 +299,11 @@ class UnitedStates(HolidayBase):
             "TX",
             "VI",
         }:
-            self[easter_date + rd(days=-2)] = "Good Friday"
+            self[easter_date + td(days=-2)] = "Good Friday"
 
         # Easter Monday
         if self.subdiv == "VI":
-            self[easter_date + rd(days=+1)] = "Easter Monday"
+            self[easter_date + td(days=+1)] = "Easter Monday"
 
         # Confederate Memorial Day
         name = "Confederate Memorial Day"
@@ -304,7 +313,7 @@ class UnitedStates(HolidayBase):
             if self.subdiv == "GA" and year == 2020:
                 self[date(year, APR, 10)] = name
             else:
-                self[date(year, APR, 1) + rd(weekday=MO(+4))] = name
+                self[_get_nth_weekday_of_month(4, MON, APR, year)] = name
         elif self.subdiv == "TX" and year >= 1931:
             self[date(year, JAN, 19)] = name
 
@@ -316,7 +325,7 @@ class UnitedStates(HolidayBase):
         if self.subdiv == "NE":
             name = "Arbor Day"
             if year >= 1989:
-                self[date(year, APR, 30) + rd(weekday=FR(-1))] = name
+                self[_get_last_weekday_of_month(FRI, APR, year)] = name
             elif year >= 1875:
                 self[date(year, APR, 22)] = name
 
@@ -325,7 +334,7 @@ class UnitedStates(HolidayBase):
             (year >= 2006 and year % 2 == 0) or year >= 2015
         ):
             self[
-                (date(year, MAY, 1) + rd(weekday=MO) + rd(days=+1))
+                (_get_nth_weekday_of_month(1, MON, MAY, year) + td(days=+1))
             ] = "Primary Election Day"
 
         # Truman Day
@@ -334,7 +343,7 @@ class UnitedStates(HolidayBase):
 
         # Memorial Day
         if year >= 1971:
-            self[date(year, MAY, 31) + rd(weekday=MO(-1))] = "Memorial Day"
+            self[_get_last_weekday_of_month(MON, MAY, year)] = "Memorial Day"
         elif year >= 1888:
             self[date(year, MAY, 30)] = "Memorial Day"
 
@@ -347,7 +356,7 @@ class UnitedStates(HolidayBase):
         # Jefferson Davis Birthday
         name = "Jefferson Davis Birthday"
         if self.subdiv == "AL" and year >= 1890:
-            self[date(year, JUN, 1) + rd(weekday=MO)] = name
+            self[_get_nth_weekday_of_month(1, MON, JUN, year)] = name
 
         # Kamehameha Day
         if self.subdiv == "HI" and year >= 1872:
@@ -390,11 +399,13 @@ class UnitedStates(HolidayBase):
 
         # Victory Day
         if self.subdiv == "RI" and year >= 1948:
-            self[date(year, AUG, 1) + rd(weekday=MO(+2))] = "Victory Day"
+            self[_get_nth_weekday_of_month(2, MON, AUG, year)] = "Victory Day"
 
         # Statehood Day (Hawaii)
         if self.subdiv == "HI" and year >= 1959:
-            self[date(year, AUG, 1) + rd(weekday=FR(+3))] = "Statehood Day"
+            self[
+                _get_nth_weekday_of_month(3, FRI, AUG, year)
+            ] = "Statehood Day"
 
         # Bennington Battle Day
         if self.subdiv == "VT" and year >= 1778:
@@ -408,7 +419,7 @@ class UnitedStates(HolidayBase):
 
         # Labor Day
         if year >= 1894:
-            self[date(year, SEP, 1) + rd(weekday=MO)] = "Labor Day"
+            self[_get_nth_weekday_of_month(1, MON, SEP, year)] = "Labor Day"
 
         # Columbus Day
         if self.subdiv not in {"AK", "AR", "DE", "FL", "HI", "NV"}:
@@ -419,7 +430,7 @@ class UnitedStates(HolidayBase):
             else:
                 name = "Columbus Day"
             if year >= 1970:
-                self[date(year, OCT, 1) + rd(weekday=MO(+2))] = name
+                self[_get_nth_weekday_of_month(2, MON, OCT, year)] = name
             elif year >= 1937:
                 self[date(year, OCT, 12)] = name
 
@@ -431,7 +442,7 @@ class UnitedStates(HolidayBase):
         if self.subdiv == "NV" and year >= 1933:
             dt = date(year, OCT, 31)
             if year >= 2000:
-                dt += rd(weekday=FR(-1))
+                dt = _get_nth_weekday_from(-1, FRI, dt)
             self._add_with_observed(dt, "Nevada Day")
 
         # Liberty Day
@@ -446,7 +457,7 @@ class UnitedStates(HolidayBase):
             and year % 2 == 0
         ) or (self.subdiv in {"IN", "NY"} and year >= 2015):
             self[
-                date(year, NOV, 1) + rd(weekday=MO) + rd(days=+1)
+                _get_nth_weekday_of_month(1, MON, NOV, year) + td(days=+1)
             ] = "Election Day"
 
         # All Souls' Day
@@ -459,7 +470,7 @@ class UnitedStates(HolidayBase):
         else:
             name = "Armistice Day"
         if 1971 <= year <= 1977:
-            self[date(year, OCT, 1) + rd(weekday=MO(+4))] = name
+            self[_get_nth_weekday_of_month(4, MON, OCT, year)] = name
         elif year >= 1938:
             self._add_with_observed(date(year, NOV, 11), name)
 
@@ -471,7 +482,7 @@ class UnitedStates(HolidayBase):
 
         # Thanksgiving
         if year >= 1871:
-            self[date(year, NOV, 1) + rd(weekday=TH(+4))] = "Thanksgiving"
+            self[_get_nth_weekday_of_month(4, THU, NOV, year)] = "Thanksgiving"
 
         # Day After Thanksgiving
         # Friday After Thanksgiving
@@ -500,7 +511,9 @@ class UnitedStates(HolidayBase):
                 name = "Family Day"
             if self.subdiv == "NM":
                 name = "Presidents' Day"
-            self[date(year, NOV, 1) + rd(weekday=TH(+4)) + rd(days=+1)] = name
+            self[
+                _get_nth_weekday_of_month(4, THU, NOV, year) + td(days=+1)
+            ] = name
 
         # Robert E. Lee's Birthday
         if self.subdiv == "GA" and year >= 1986:
@@ -508,7 +521,7 @@ class UnitedStates(HolidayBase):
                 name = "State Holiday"
             else:
                 name = "Robert E. Lee's Birthday"
-            self[date(year, NOV, 29) + rd(weekday=FR(-1))] = name
+            self[_get_nth_weekday_from(-1, FRI, date(year, NOV, 29))] = name
 
         # Lady of Camarin Day
         if self.subdiv == "GU":
@@ -526,10 +539,10 @@ class UnitedStates(HolidayBase):
             self[dt] = name
             # If on Friday, observed on Thursday
             if self.observed and dt.weekday() == FRI:
-                self[dt + rd(days=-1)] = f"{name} (Observed)"
+                self[dt + td(days=-1)] = f"{name} (Observed)"
             # If on Saturday or Sunday, observed on Friday
             elif self.observed and self._is_weekend(dt):
-                self[dt + rd(weekday=FR(-1))] = f"{name} (Observed)"
+                self[_get_nth_weekday_from(-1, FRI, dt)] = f"{name} (Observed)"
 
         # Christmas Day
         if year >= 1871:
@@ -542,10 +555,10 @@ class UnitedStates(HolidayBase):
             self[dt] = name
             # If on Saturday or Sunday, observed on Monday
             if self.observed and self._is_weekend(dt):
-                self[dt + rd(weekday=MO)] = f"{name} (Observed)"
+                self[_get_nth_weekday_from(1, MON, dt)] = f"{name} (Observed)"
             # If on Monday, observed on Tuesday
             elif self.observed and dt.weekday() == MON:
-                self[dt + rd(days=+1)] = f"{name} (Observed)"
+                self[dt + td(days=+1)] = f"{name} (Observed)"
         elif self.subdiv == "TX" and year >= 1981:
             self[dt] = "Day After Christmas"
         elif self.subdiv == "VI":
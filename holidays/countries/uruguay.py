@@ -10,13 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_nth_weekday_from
 from holidays.constants import JAN, APR, MAY, JUN, JUL, AUG, OCT, NOV, DEC
-from holidays.constants import TUE, WED, THU, FRI
+from holidays.constants import MON, TUE, WED, THU, FRI
 from holidays.holiday_base import HolidayBase
 
 
@@ -74,12 +74,12 @@ class Uruguay(HolidayBase):
         # Carnival days
         # revisar este día para futuros casos
         name = "Día de Carnaval [Carnival's Day]"
-        self[easter_date + rd(days=-48)] = name
-        self[easter_date + rd(days=-47)] = name
+        self[easter_date + td(days=-48)] = name
+        self[easter_date + td(days=-47)] = name
 
         # Holy Week.
-        self[easter_date + rd(days=-3)] = "Jueves Santo [Holy Thursday]"
-        self[easter_date + rd(days=-2)] = "Viernes Santo [Holy Friday]"
+        self[easter_date + td(days=-3)] = "Jueves Santo [Holy Thursday]"
+        self[easter_date + td(days=-2)] = "Viernes Santo [Holy Friday]"
 
         self[easter_date] = "Día de Pascuas [Easter Day]"
 
@@ -105,9 +105,9 @@ class Uruguay(HolidayBase):
 
         for dt, name in holiday_pairs:
             if dt.weekday() in {TUE, WED}:
-                self[dt + rd(weekday=MO(-1))] = name
+                self[_get_nth_weekday_from(-1, MON, dt)] = name
             elif dt.weekday() in {THU, FRI}:
-                self[dt + rd(weekday=MO(+1))] = name
+                self[_get_nth_weekday_from(1, MON, dt)] = name
             else:
                 self[dt] = name
 
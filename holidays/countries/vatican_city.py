@@ -10,9 +10,9 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, AUG, SEP, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -52,7 +52,7 @@ class VaticanCity(HolidayBase):
         self[easter_sunday] = "Easter Sunday"
 
         # Easter Monday.
-        self[easter_sunday + rd(days=+1)] = "Easter Monday"
+        self[easter_sunday + td(days=+1)] = "Easter Monday"
 
         # Saint George's Day.
         self[date(year, APR, 23)] = "Saint George's Day"
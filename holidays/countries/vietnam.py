@@ -9,14 +9,13 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import warnings
 from datetime import date
+from datetime import timedelta as td
 
-from dateutil.relativedelta import relativedelta as rd
-
-# Installation: pip install korean_lunar_calendar
-# URL: https://github.com/usingsky/korean_lunar_calendar_py/
-from korean_lunar_calendar import KoreanLunarCalendar
-
+from holidays.calendars.korean import _END_YEAR as _LUNAR_END_YEAR
+from holidays.calendars.korean import _START_YEAR as _LUNAR_START_YEAR
+from holidays.calendars.korean import _korean_lunar_to_gre
 from holidays.constants import JAN, APR, MAY, SEP
 from holidays.holiday_base import HolidayBase
 
@@ -30,15 +29,11 @@ class Vietnam(HolidayBase):
 
     country = "VN"
 
-    def __init__(self, **kwargs):
-        self.korean_cal = KoreanLunarCalendar()
-        HolidayBase.__init__(self, **kwargs)
-
     def _add_observed(self, holiday: date) -> None:
         if self._is_weekend(holiday):
-            next_workday = holiday + rd(days=+1)
+            next_workday = holiday + td(days=+1)
             while self._is_weekend(next_workday) or self.get(next_workday):
-                next_workday += rd(days=+1)
+                next_workday += td(days=+1)
             self[next_workday] = self[holiday] + " observed"
 
     def _populate(self, year):
@@ -47,9 +42,19 @@ class Vietnam(HolidayBase):
         # New Year's Day
         self[date(year, JAN, 1)] = "International New Year's Day"
 
+        # The lunar holidays are only available within the range of the
+        # Korean lunar calendar table.
+        lunar_supported = _LUNAR_START_YEAR <= year <= _LUNAR_END_YEAR
+        if not lunar_supported:
+            warnings.warn(
+                "Vietnamese lunar calendar holidays available from "
+                f"{_LUNAR_START_YEAR} to {_LUNAR_END_YEAR} only",
+                Warning,
+            )
+
         # Vietnamese Kings' Commemoration Day
         # https://en.wikipedia.org/wiki/H%C3%B9ng_Kings%27_Festival
-        if year >= 2007:
+        if lunar_supported and year >= 2007:
             hol_date = self.get_solar_date(year, 3, 10)
             self[hol_date] = "Hung Kings Commemoration Day"
 
@@ -68,26 +73,22 @@ class Vietnam(HolidayBase):
                     self._add_observed(dt)
 
         # Lunar New Year
-        names = (
-            (-1, "Vietnamese New Year's Eve"),
-            (0, "Vietnamese New Year"),
-            (1, "The second day of Tet Holiday"),
-            (2, "The third day of Tet Holiday"),
-            (3, "The forth day of Tet Holiday"),
-            (4, "The fifth day of Tet Holiday"),
-        )
-        hol_date = self.get_solar_date(year, 1, 1)
-        for d, name in names:
-            self[(hol_date + rd(days=+d))] = name
+        if lunar_supported:
+            names = (
+                (-1, "Vietnamese New Year's Eve"),
+                (0, "Vietnamese New Year"),
+                (1, "The second day of Tet Holiday"),
+                (2, "The third day of Tet Holiday"),
+                (3, "The forth day of Tet Holiday"),
+                (4, "The fifth day of Tet Holiday"),
+            )
+            hol_date = self.get_solar_date(year, 1, 1)
+            for d, name in names:
+                self[(hol_date + td(days=+d))] = name
 
     # convert lunar calendar date to solar
     def get_solar_date(self, year, month, day):
-        self.korean_cal.setLunarDate(year, month, day, False)
-        return date(
-            self.korean_cal.solarYear,
-            self.korean_cal.solarMonth,
-            self.korean_cal.solarDay,
-        )
+        return _korean_lunar_to_gre(year, month, day)
 
 
 class VN(Vietnam):
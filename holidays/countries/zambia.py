@@ -10,12 +10,13 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, MAR, APR, MAY, JUL, AUG, SEP, OCT, DEC, SUN
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, MAR, APR, MAY, JUL, AUG, SEP, OCT, DEC
+from holidays.constants import MON, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -68,9 +69,9 @@ class Zambia(HolidayBase):
         self[date(year, MAR, 12)] = "Youth Day"
 
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
-        self[easter_date + rd(days=-1)] = "Holy Saturday"
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-1)] = "Holy Saturday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         if year >= 2022:
             self[date(year, APR, 28)] = "Kenneth Kaunda Day"
@@ -79,12 +80,12 @@ class Zambia(HolidayBase):
         self[date(year, MAY, 25)] = "Africa Freedom Day"
 
         # 1st Monday of July = "Heroes' Day"
-        dt = date(year, JUL, 1) + rd(weekday=MO)
+        dt = _get_nth_weekday_of_month(1, MON, JUL, year)
         self[dt] = "Heroes' Day"
-        self[dt + rd(days=+1)] = "Unity Day"
+        self[dt + td(days=+1)] = "Unity Day"
 
         # 1st Monday of Aug = "Farmers' Day"
-        dt = date(year, AUG, 1) + rd(weekday=MO)
+        dt = _get_nth_weekday_of_month(1, MON, AUG, year)
         self[dt] = "Farmers' Day"
 
         if year >= 2015:
@@ -98,7 +99,7 @@ class Zambia(HolidayBase):
         if self.observed:
             for k, v in list(self.items()):
                 if k.year == year and k.weekday() == SUN:
-                    self[k + rd(days=+1)] = v + " (Observed)"
+                    self[k + td(days=+1)] = v + " (Observed)"
 
 
 class ZM(Zambia):
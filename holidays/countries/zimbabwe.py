@@ -10,12 +10,12 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO
-from dateutil.relativedelta import relativedelta as rd
 
-from holidays.constants import JAN, FEB, APR, MAY, AUG, DEC, SUN
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.constants import JAN, FEB, APR, MAY, AUG, DEC, MON, SUN
 from holidays.holiday_base import HolidayBase
 
 
@@ -41,9 +41,9 @@ class Zimbabwe(HolidayBase):
             ] = "Robert Gabriel Mugabe National Youth Day"
 
         easter_date = easter(year)
-        self[easter_date + rd(days=-2)] = "Good Friday"
-        self[easter_date + rd(days=-1)] = "Easter Saturday"
-        self[easter_date + rd(days=+1)] = "Easter Monday"
+        self[easter_date + td(days=-2)] = "Good Friday"
+        self[easter_date + td(days=-1)] = "Easter Saturday"
+        self[easter_date + td(days=+1)] = "Easter Monday"
 
         self[date(year, APR, 18)] = "Independence Day"
 
@@ -51,11 +51,11 @@ class Zimbabwe(HolidayBase):
         self[date(year, MAY, 25)] = "Africa Day"
 
         # 2nd Monday of August
-        zimbabwe_heroes_day = date(year, AUG, 1) + rd(weekday=MO(+2))
+        zimbabwe_heroes_day = _get_nth_weekday_of_month(2, MON, AUG, year)
         self[zimbabwe_heroes_day] = "Zimbabwe Heroes' Day"
 
         # Tuesday after 2nd Monday of August
-        defence_forces_day = zimbabwe_heroes_day + rd(days=+1)
+        defence_forces_day = zimbabwe_heroes_day + td(days=+1)
         self[defence_forces_day] = "Defense Forces Day"
 
         self[date(year, DEC, 22)] = "Unity Day"
@@ -65,9 +65,9 @@ class Zimbabwe(HolidayBase):
         if self.observed:
             for k, v in list(self.items()):
                 if k.weekday() == SUN and k.year == year:
-                    dt = k + rd(days=+1)
+                    dt = k + td(days=+1)
                     while self.get(dt):
-                        dt += rd(days=+1)
+                        dt += td(days=+1)
                     self[dt] = v + " (Observed)"
 
 
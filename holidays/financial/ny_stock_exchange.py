@@ -10,13 +10,15 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from datetime import timedelta as td
 
 from dateutil.easter import easter
-from dateutil.relativedelta import MO, TH, FR
-from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC, WED, FRI
+from holidays.constants import OCT, NOV, DEC, MON, WED, THU, FRI
 from holidays.holiday_base import HolidayBase
 
 
@@ -35,9 +37,9 @@ class NewYorkStockExchange(HolidayBase):
     def _get_observed(self, d):
         wdnum = d.isoweekday()
         if wdnum == 6:
-            return d + rd(weekday=FR(-1))
+            return _get_nth_weekday_from(-1, FRI, d)
         if wdnum == 7:
-            return d + rd(weekday=MO(+1))
+            return _get_nth_weekday_from(1, MON, d)
         return d
 
     def _set_observed_date(self, holiday_date, name):
@@ -63,12 +65,12 @@ class NewYorkStockExchange(HolidayBase):
         # needs to be observed on Friday (Dec 31 of previous year).
         dec_31 = date(year, DEC, 31)
         if dec_31.weekday() == FRI:
-            self._set_observed_date(dec_31 + rd(days=+1), "New Year's Day")
+            self._set_observed_date(dec_31 + td(days=+1), "New Year's Day")
 
         # MLK - observed 1998 - 3rd Monday of Jan
         if year >= 1998:
             self[
-                date(year, JAN, 1) + rd(weekday=MO(3))
+                _get_nth_weekday_of_month(3, MON, JAN, year)
             ] = "Martin Luther King Jr. Day"
 
         # LINCOLN BIRTHDAY: observed 1896 - 1953 and 1968, Feb 12 (observed)
@@ -82,13 +84,13 @@ class NewYorkStockExchange(HolidayBase):
             self._set_observed_date(wash, "Washington's Birthday")
         else:
             self[
-                date(year, FEB, 1) + rd(weekday=MO(3))
+                _get_nth_weekday_of_month(3, MON, FEB, year)
             ] = "Washington's Birthday"
 
         # GOOD FRIDAY - closed every year except 1898, 1906, and 1907
         e = easter(year)
         if year not in {1898, 1906, 1907}:
-            self[e + rd(days=-2)] = "Good Friday"
+            self[e + td(days=-2)] = "Good Friday"
 
         # MEM DAY (May 30) - closed every year since 1873
         # last Mon in May since 1971
@@ -96,7 +98,7 @@ class NewYorkStockExchange(HolidayBase):
             memday = date(year, MAY, 30)
             self._set_observed_date(memday, "Memorial Day")
         else:
-            self[date(year, MAY, 31) + rd(weekday=MO(-1))] = "Memorial Day"
+            self[_get_last_weekday_of_month(MON, MAY, year)] = "Memorial Day"
 
         # FLAG DAY: June 14th 1916 - 1953
         if 1916 <= year <= 1953:
@@ -116,7 +118,7 @@ class NewYorkStockExchange(HolidayBase):
 
         # LABOR DAY - first mon in Sept, since 1887
         if year >= 1887:
-            self[date(year, SEP, 1) + rd(weekday=MO(1))] = "Labor Day"
+            self[_get_nth_weekday_of_month(1, MON, SEP, year)] = "Labor Day"
 
         # COLUMBUS DAY/INDIGENOUS PPL DAY: Oct 12 - closed 1909-1953
         if 1909 <= year <= 1953:
@@ -127,7 +129,7 @@ class NewYorkStockExchange(HolidayBase):
         # closed until 1969, then closed pres years 1972-80
         if year <= 1968 or year in {1972, 1976, 1980}:
             self[
-                date(year, NOV, 1) + rd(weekday=MO) + rd(days=+1)
+                _get_nth_weekday_of_month(1, MON, NOV, year) + td(days=+1)
             ] = "Election Day"
 
         # VETERAN'S DAY: Nov 11 - closed 1918, 1921, 1934-1953
@@ -136,7 +138,7 @@ class NewYorkStockExchange(HolidayBase):
             self._set_observed_date(vetday, "Veteran's Day")
 
         # THXGIVING DAY: 4th Thurs in Nov - closed every year
-        self[date(year, NOV, 1) + rd(weekday=TH(4))] = "Thanksgiving Day"
+        self[_get_nth_weekday_of_month(4, THU, NOV, year)] = "Thanksgiving Day"
 
         # XMAS DAY: Dec 25th - every year
         xmas = date(year, DEC, 25)
@@ -178,7 +180,7 @@ class NewYorkStockExchange(HolidayBase):
             begin = date(year, JUL, 31)
             end = date(year, NOV, 27)
             for d in (
-                begin + rd(days=n) for n in range((end - begin).days + 1)
+                begin + td(days=n) for n in range((end - begin).days + 1)
             ):
                 if self._is_weekend(d):
                     continue
@@ -209,7 +211,7 @@ class NewYorkStockExchange(HolidayBase):
             begin = date(year, MAR, 6)
             end = date(year, MAR, 14)
             for d in (
-                begin + rd(days=n) for n in range((end - begin).days + 1)
+                begin + td(days=n) for n in range((end - begin).days + 1)
             ):
                 if self._is_weekend(d):
                     continue
@@ -238,7 +240,7 @@ class NewYorkStockExchange(HolidayBase):
             begin = date(year, JUN, 12)
             end = date(year, DEC, 31)
             for d in (
-                begin + rd(days=n) for n in range((end - begin).days + 1)
+                begin + td(days=n) for n in range((end - begin).days + 1)
             ):
                 if d.weekday() != WED:  # Wednesday special holiday
                     continue
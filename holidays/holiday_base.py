@@ -9,19 +9,203 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-__all__ = ("DateLike", "HolidayBase", "HolidaySum")
-
+__all__ = (
+    "CacheInfo",
+    "DateLike",
+    "DateParseCache",
+    "DerivedHolidays",
+    "FixedHoliday",
+    "FrozenHolidays",
+    "HolidayBase",
+    "HolidaySum",
+    "YearCache",
+)
+
+import calendar
+import sys
+import threading
 import warnings
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from typing import Union, cast
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta
+from heapq import merge
+from itertools import accumulate
+from typing import Any, Callable, Collection, Dict, FrozenSet, Hashable
+from typing import Iterable, Iterator, List, Mapping, MutableMapping
+from typing import NamedTuple, Optional, Sequence, Set, Tuple, Union, cast
 
 from dateutil.parser import parse
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import SAT, SUN
+from holidays.tables import find_table
 
 DateLike = Union[date, datetime, str, float, int]
+_Pair = Tuple[date, str]
+_Layer = List[_Pair]
+
+
+class FixedHoliday(NamedTuple):
+    """A holiday falling on the same day every year of a range, for all
+    subdivisions or only some of them (see
+    :attr:`HolidayBase.fixed_holidays`)."""
+
+    month: int
+    day: int
+    name: str
+    start_year: int = MINYEAR
+    """The first year of the holiday."""
+    end_year: int = MAXYEAR
+    """The last year of the holiday."""
+    subdivs: Optional[Collection[str]] = None
+    """The subdivisions the holiday is limited to, or None for all of them
+    (and for no subdivision)."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a bounded cache, similar to
+    :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """A thread-safe mapping holding at most **maxsize** entries, evicting
+    the least recently used one when full. A **maxsize** of 0 disables
+    caching altogether."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache maxsize must not be negative.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def lookup(self, key: Hashable) -> Any:
+        """Return the value cached for **key** or None if there is none."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache **value** for **key**, evicting old entries if needed."""
+        if self.maxsize == 0:
+            return None
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Locks can't be pickled: start afresh with the same size instead.
+        return self.__class__, (self.maxsize,)
+
+
+class DateParseCache(_LRUCache):
+    """
+    A bounded LRU cache of string to :class:`datetime.date` conversions.
+
+    Strings in the strict ISO 8601 ``YYYY-MM-DD`` format are converted with
+    :meth:`datetime.date.fromisoformat` and never cached. Any other string
+    is parsed by :func:`dateutil.parser.parse` once and then served from the
+    cache until evicted.
+
+    A single cache is shared by all :class:`HolidayBase` objects by default.
+    It can be replaced globally or for a specific object only:
+
+    >>> from holidays import DateParseCache, HolidayBase, country_holidays
+    >>> HolidayBase.parse_cache = DateParseCache(maxsize=100_000)
+    >>> us_holidays = country_holidays('US')
+    >>> us_holidays.parse_cache = DateParseCache(maxsize=0)  # No caching.
+    >>> assert '1/1/2014' in us_holidays
+    >>> us_holidays.parse_cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=0, currsize=0)
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        :param maxsize:
+            The maximum number of parsed strings to keep.
+        """
+        super().__init__(maxsize)
+
+    def parse(self, key: str) -> date:
+        """Convert **key** to :class:`datetime.date`.
+
+        :param key:
+            A string of any format recognized by
+            :func:`dateutil.parser.parse`.
+
+        :raise:
+            ValueError if the date cannot be parsed.
+        """
+        if len(key) == 10 and key[4] == key[7] == "-":
+            try:
+                return date.fromisoformat(key)
+            except ValueError:
+                pass
+
+        out_key = self.lookup(key)
+        if out_key is None:
+            try:
+                out_key = parse(key).date()
+            except (ValueError, OverflowError):
+                raise ValueError("Cannot parse date from string '%s'" % key)
+            self.store(key, out_key)
+        return out_key
+
+
+class YearCache(_LRUCache):
+    """
+    A bounded LRU cache of calculated years, shared by all the
+    :class:`HolidayBase` objects of a process.
+
+    The holidays of a year are calculated once for each combination of
+    class, subdivision, :attr:`HolidayBase.observed` setting (and other
+    settings the holidays depend on) and then copied into the objects
+    needing them. This pays off when many short-lived objects are created
+    for the same countries, e.g. one per web request. The cache is disabled
+    by default:
+
+    >>> from holidays import HolidayBase, YearCache, country_holidays
+    >>> HolidayBase.year_cache = YearCache(maxsize=10_000)
+    >>> us_holidays = country_holidays('US', subdiv='CA', years=2020)
+    >>> us_holidays = country_holidays('US', subdiv='CA', years=2020)
+    >>> HolidayBase.year_cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=10000, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        :param maxsize:
+            The maximum number of years to keep.
+        """
+        super().__init__(maxsize)
 
 
 class HolidayBase(Dict[date, str]):
@@ -191,16 +375,41 @@ class HolidayBase(Dict[date, str]):
     is requested."""
     observed: bool
     """Whether dates when public holiday are observed are included."""
+    strict: bool
+    """Whether only :class:`datetime.date` keys are accepted."""
     subdiv: Optional[str] = None
     """The subdiv requested."""
     special_holidays: Dict[int, Tuple[Tuple[int, int, str], ...]] = {}
     """A list of the country-wide special (as opposite to regular) holidays for
     a specific year."""
+    fixed_holidays: Tuple[FixedHoliday, ...] = ()
+    """The holidays falling on the same day every year of a range, added by
+    :meth:`_populate` before the calculated ones."""
+    month_holidays: Dict[str, Tuple[int, ...]] = {}
+    """The methods adding the holidays of a year that can only fall in some
+    of its months (observed dates included), e.g. costly astronomical ones,
+    mapped to these months. They are called with the year after
+    :meth:`_populate`, or with ``granularity="month"`` only once a date of
+    one of their months is needed."""
+    granularity: str
+    """Whether the holidays are calculated a whole ``"year"`` at a time, or
+    a ``"month"`` at a time when the country supports it (see
+    :attr:`month_holidays`)."""
     _deprecated_subdivisions: List[str] = []
     """Other subdivisions whose names are deprecated or aliases of the official
     ones."""
     weekend: Set[int] = {SAT, SUN}
     """Country weekend days."""
+    parse_cache: DateParseCache = DateParseCache()
+    """The cache of string keys conversions, shared by all objects unless
+    overridden (see :class:`DateParseCache`)."""
+    year_cache: Optional["YearCache"] = None
+    """The cache of calculated years shared by all objects, disabled unless
+    set (see :class:`YearCache`)."""
+    use_tables: bool = True
+    """Whether to copy the holidays of the years in range from the
+    precomputed tables shipped with the package, when there are any (see
+    :mod:`holidays.tables`)."""
 
     def __init__(
         self,
@@ -210,6 +419,8 @@ class HolidayBase(Dict[date, str]):
         subdiv: Optional[str] = None,
         prov: Optional[str] = None,  # deprecated
         state: Optional[str] = None,  # deprecated
+        strict: bool = False,
+        granularity: str = "year",
     ) -> None:
         """
         :param years:
@@ -234,12 +445,36 @@ class HolidayBase(Dict[date, str]):
             (e.g. a holiday falling on a Sunday being observed the
             following Monday). This doesn't work for all countries.
 
+        :param strict:
+            Whether to accept :class:`datetime.date` keys only. Lookups then
+            skip the key conversion altogether, which makes them nearly as
+            fast as plain :class:`dict` ones. Any other key, including a
+            :class:`datetime.datetime`, raises :class:`TypeError`.
+
+        :param granularity:
+            With ``"month"``, the holidays of :attr:`month_holidays` are only
+            calculated for the months of the dates requested, and for whole
+            years when needed (e.g. by :meth:`holidays_between`): iterating
+            the object only shows the holidays calculated so far. Defaults to
+            ``"year"``.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
         super().__init__()
+        self._dates_by_year: Dict[int, List[date]] = {}
+        self._workdays: Dict[int, "array[int]"] = {}
+        self._names_by_year: Dict[int, Dict[str, List[date]]] = {}
+        self._split_by_date: Dict[date, Tuple[str, Tuple[str, ...]]] = {}
+        self._observed_layers: Dict[int, Tuple[_Layer, _Layer]] = {}
+        self._pending_months: Dict[int, List[str]] = {}
+        self._frozen: Dict[FrozenSet[int], FrozenHolidays] = {}
         self.observed = observed
         self.expand = expand
+        self.strict = strict
+        if granularity not in {"month", "year"}:
+            raise ValueError(f"Unknown granularity '{granularity}'.")
+        self.granularity = granularity
         self.subdiv = subdiv or prov or state
         if prov or state:
             warnings.warn(
@@ -263,29 +498,21 @@ class HolidayBase(Dict[date, str]):
                         f"Country {self.country} does not have subdivision "
                         f"'{subdiv}'"
                     )
+        self.years = set()
         if isinstance(years, int):
-            self.years = {years}
-        else:
-            self.years = set(years) if years is not None else set()
-        for year in self.years.copy():
-            self._populate(year)
+            self._populate_years((years,))
+        elif years is not None:
+            self._populate_years(years)
 
     def __setattr__(self, key: str, value: Any) -> None:
         if key == "observed" and len(self) > 0:
+            toggled = bool(value) != bool(self.__dict__.get(key))
             dict.__setattr__(self, key, value)
-            if value is True:
-                # Add (Observed) dates
-                years = list(self.years)
-                self.years = set()
-                self.clear()
-                for year in years:
-                    self._populate(year)
-            else:
-                # Remove (Observed) dates
-                for k, v in list(self.items()):
-                    if v.find("Observed") >= 0:
-                        del self[k]
+            if toggled:
+                self._toggle_observed(bool(value))
         else:
+            if key == "weekend":
+                self.__dict__.get("_workdays", {}).clear()
             return dict.__setattr__(self, key, value)
 
     def __keytransform__(self, key: DateLike) -> date:
@@ -297,26 +524,254 @@ class HolidayBase(Dict[date, str]):
           :func:`dateutil.parser.parse`,
         * or a :class:`float` or :class:`int` representing a POSIX timestamp
 
-        to :class:`datetime.date`, which is how it's stored by the class."""
-        if isinstance(key, datetime):
-            out_key = key.date()
-        elif isinstance(key, date):
-            out_key = key
-        elif isinstance(key, int) or isinstance(key, float):
-            out_key = datetime.utcfromtimestamp(key).date()
-        elif isinstance(key, str):
-            try:
-                out_key = parse(key).date()
-            except (ValueError, OverflowError):
-                raise ValueError("Cannot parse date from string '%s'" % key)
-        else:
-            raise TypeError("Cannot convert type '%s' to date." % type(key))
+        to :class:`datetime.date`, which is how it's stored by the class.
 
+        In strict mode the key must be a :class:`datetime.date` already
+        (not even a :class:`datetime.datetime`) and is returned as is."""
+        if self.strict:
+            if type(key) is not date:
+                raise TypeError(
+                    "Cannot use type '%s' as a key in strict mode." % type(key)
+                )
+            out_key = cast(date, key)
+        else:
+            out_key = self._to_date(key)
         if self.expand and out_key.year not in self.years:
-            self.years.add(out_key.year)
-            self._populate(out_key.year)
+            self._populate_year(out_key.year)
+        if self._pending_months and out_key.year in self._pending_months:
+            self._populate_months(out_key.year, (out_key.month,))
         return out_key
 
+    def _to_date(self, key: DateLike) -> date:
+        """Convert a key to :class:`datetime.date` without calculating its
+        year (see :meth:`__keytransform__`)."""
+        return _to_date(key, self.parse_cache)
+
+    def populate_range(self, start: int, end: int) -> None:
+        """Calculate the holidays of the years from **start** to **end**, both
+        included, that are not calculated yet.
+
+        This is the entry point for calculating many years at once: the
+        constructor, :meth:`freeze` and the range queries call it once for
+        each run of consecutive years. Subclasses may override it to prepare
+        what the whole range needs in one go (e.g. a series of astronomical
+        dates) before calling the default implementation, which calculates
+        each year in turn.
+
+        :param start:
+            The first year to calculate.
+
+        :param end:
+            The last year to calculate.
+
+        >>> from holidays import country_holidays
+        >>> us_holidays = country_holidays('US')
+        >>> us_holidays.populate_range(2020, 2022)
+        >>> sorted(us_holidays.years)
+        [2020, 2021, 2022]
+        """
+        years = [
+            year for year in range(start, end + 1) if year not in self.years
+        ]
+        self.years.update(years)
+        for year in years:
+            self._calculate_year(year)
+
+    def _populate_years(self, years: Iterable[int]) -> None:
+        """Calculate the holidays of the years not calculated yet, with one
+        :meth:`populate_range` call for each run of consecutive years."""
+        missing = sorted(set(years) - self.years)
+        start = 0
+        for idx in range(1, len(missing) + 1):
+            if idx == len(missing) or missing[idx] != missing[idx - 1] + 1:
+                self.populate_range(missing[start], missing[idx - 1])
+                start = idx
+
+    def _populate_year(self, year: int) -> None:
+        """Calculate the holidays of a year and mark it as calculated."""
+        self.years.add(year)
+        self._calculate_year(year)
+
+    def _calculate_year(self, year: int) -> None:
+        """Calculate the holidays of a year, copying them from the
+        precomputed tables or from :attr:`year_cache` when possible."""
+        if self._frozen:
+            self._frozen.clear()
+        holidays = self._table_holidays(year, self.observed)
+        if holidays is None:
+            if (
+                self.year_cache is None
+                or self._year_cache_key(year, self.observed) is None
+            ):
+                self._populate(year)
+                if self.granularity == "month" and self.month_holidays:
+                    self._pending_months[year] = list(self.month_holidays)
+                else:
+                    self._populate_month_holidays(year)
+                return None
+            holidays = self._year_holidays(year, self.observed)
+        for dt, name in holidays:
+            if dict.__contains__(cast("Mapping[Any, Any]", self), dt) or (
+                self.expand and dt.year not in self.years
+            ):
+                # Merge names or calculate the adjacent year first.
+                self[dt] = name
+                continue
+            dict.__setitem__(self, dt, name)
+            insort(self._dates_by_year.setdefault(dt.year, []), dt)
+            self._workdays.pop(dt.year, None)
+            self._names_by_year.pop(dt.year, None)
+
+    def _populate_month_holidays(self, year: int) -> None:
+        """Call all the :attr:`month_holidays` methods of a year, after
+        :meth:`_populate`."""
+        for name in self.month_holidays:
+            getattr(self, name)(year)
+
+    def _populate_months(
+        self, year: int, months: Optional[Iterable[int]] = None
+    ) -> None:
+        """Call the :attr:`month_holidays` methods of a year not called yet
+        whose months include any of the months provided (by default, all of
+        them)."""
+        pending = self._pending_months.get(year)
+        if pending is None:
+            return None
+
+        months = set(range(1, 13) if months is None else months)
+        for name in pending[:]:
+            if months.isdisjoint(self.month_holidays[name]):
+                continue
+            pending.remove(name)
+            if not pending:
+                del self._pending_months[year]
+            getattr(self, name)(year)
+
+    def _table_holidays(
+        self, year: int, observed: bool
+    ) -> Optional[Tuple[Tuple[date, str], ...]]:
+        """Return the holidays of a year from the precomputed table of the
+        class, or None if it's not in the table."""
+        if not self.use_tables or "weekend" in self.__dict__:
+            return None
+        table = find_table(self.__class__)
+        if table is None:
+            return None
+        return table.year_holidays(self.subdiv, observed, year)
+
+    def _year_cache_key(self, year: int, observed: bool) -> Optional[Hashable]:
+        """Return the :attr:`year_cache` key of the holidays of a year, or
+        None if they can't be cached. Subclasses whose holidays depend on
+        other settings must add them to the key."""
+        return (
+            self.__class__,
+            self.subdiv,
+            observed,
+            frozenset(self.weekend),
+            year,
+        )
+
+    def _year_holidays(
+        self, year: int, observed: bool
+    ) -> Tuple[Tuple[date, str], ...]:
+        """Return the holidays calculated for a year with :attr:`observed`
+        set as given, without changing the object.
+
+        The holidays are calculated on a scratch copy of the object, unless
+        found in the precomputed tables or in :attr:`year_cache`."""
+        holidays = self._table_holidays(year, observed)
+        if holidays is not None:
+            return holidays
+
+        key = self._year_cache_key(year, observed)
+        cache = self.year_cache if key is not None else None
+        if cache is not None:
+            holidays = cache.lookup(key)
+            if holidays is not None:
+                return cast(Tuple[Tuple[date, str], ...], holidays)
+
+        scratch = self.__class__.__new__(self.__class__)
+        scratch.__dict__.update(self.__dict__)
+        scratch.__dict__.update(
+            {
+                "_dates_by_year": {},
+                "_workdays": {},
+                "_names_by_year": {},
+                "_split_by_date": {},
+                "_pending_months": {},
+                "_frozen": {},
+                "expand": False,
+                "granularity": "year",
+                "observed": observed,
+                "years": {year},
+            }
+        )
+        scratch._populate(year)
+        scratch._populate_month_holidays(year)
+        holidays = tuple(dict.items(scratch))
+        if cache is not None:
+            cache.store(key, holidays)
+        return holidays
+
+    def _toggle_observed(self, observed: bool) -> None:
+        """Swap the holidays that depend on the :attr:`observed` setting for
+        the calculated years, without calculating them again.
+
+        The entries that only exist with one setting or the other are kept
+        as a separate layer for each year (see :meth:`_observed_layer`), so
+        entries added by the user are left untouched.
+
+        Building the layer of a year calculates it both ways, which makes the
+        first toggle cost about twice calculating the years. Later toggles
+        only remove and add the entries of the layers."""
+        for year in list(self._pending_months):
+            self._populate_months(year)
+        for year in sorted(self.years):
+            layer = self._observed_layers.get(year)
+            if layer is None:
+                layer = self._observed_layers[year] = self._observed_layer(
+                    year
+                )
+            added, removed = layer if observed else layer[::-1]
+            for dt, name in removed:
+                self._remove_name(dt, name)
+            for dt, name in added:
+                self[dt] = name
+
+    def _observed_layer(self, year: int) -> Tuple[_Layer, _Layer]:
+        """Return the ``(date, name)`` pairs only calculated for a year with
+        :attr:`observed` set to True and those only calculated with it set
+        to False."""
+        on = self._observed_variant(year, True)
+        off = self._observed_variant(year, False)
+        return sorted(on - off), sorted(off - on)
+
+    def _observed_variant(self, year: int, observed: bool) -> Set[_Pair]:
+        """Return the ``(date, name)`` pairs of a year with :attr:`observed`
+        set as given (see :meth:`_year_holidays`)."""
+        return {
+            (dt, name)
+            for dt, names in self._year_holidays(year, observed)
+            for name in _split_names(names)
+        }
+
+    def _remove_name(self, key: date, name: str) -> None:
+        """Remove one of the holiday names of a date, and the date itself if
+        it was the only one."""
+        names = dict.get(self, key)
+        if names is None:
+            return None
+        if self._frozen:
+            self._frozen.clear()
+        self._names_by_year.pop(key.year, None)
+        split_names = _split_names(names)
+        remaining = [n for n in split_names if n != name]
+        if not remaining:
+            dict.__delitem__(self, key)
+            self._unindex(key)
+        elif len(remaining) < len(split_names):
+            dict.__setitem__(self, key, ", ".join(remaining))
+
     def __contains__(self, key: object) -> bool:
         """Return true if date is in self, false otherwise. Accepts a date in
         the following types:
@@ -326,13 +781,17 @@ class HolidayBase(Dict[date, str]):
         * a :class:`str` of any format recognized by
           :func:`dateutil.parser.parse`,
         * or a :class:`float` or :class:`int` representing a POSIX timestamp.
-        """
 
-        if not isinstance(key, (date, datetime, str, float, int)):
+        Only :class:`datetime.date` is accepted in strict mode.
+        """
+        if not self.strict and not isinstance(
+            key, (date, datetime, str, float, int)
+        ):
             raise TypeError("Cannot convert type '%s' to date." % type(key))
 
         return dict.__contains__(
-            cast("Mapping[Any, Any]", self), self.__keytransform__(key)
+            cast("Mapping[Any, Any]", self),
+            self.__keytransform__(cast(DateLike, key)),
         )
 
     def __getitem__(self, key: DateLike) -> Any:
@@ -361,27 +820,77 @@ class HolidayBase(Dict[date, str]):
             if date_diff.days < 0 <= step or date_diff.days >= 0 > step:
                 step *= -1
 
-            days_in_range = []
-            for delta_days in range(0, date_diff.days, step):
-                day = start + rd(days=delta_days)
-                try:
-                    self.__getitem__(day)
-                    days_in_range.append(day)
-                except KeyError:
-                    pass
-            return days_in_range
+            if step > 0:
+                days_in_range = self._dates_in_range(start, stop)
+            else:
+                # Walk backwards from start (included) to stop (excluded).
+                days_in_range = self._dates_in_range(
+                    stop + timedelta(days=1), start + timedelta(days=1)
+                )
+                days_in_range.reverse()
+            if step in {1, -1}:
+                return days_in_range
+            return [
+                day for day in days_in_range if (day - start).days % step == 0
+            ]
         return dict.__getitem__(self, self.__keytransform__(key))
 
     def __setitem__(self, key: DateLike, value: str) -> None:
-        if key in self:
+        key = self.__keytransform__(key)
+        if self._frozen:
+            self._frozen.clear()
+        if dict.__contains__(cast("Mapping[Any, Any]", self), key):
             # If there are multiple holidays on the same date
             # order their names alphabetically.
-            delimiter = ", "
-            holiday_names = set(self.get(key).split(delimiter))
-            holiday_names.add(value)
-            value = delimiter.join(sorted(holiday_names))
-
-        dict.__setitem__(self, self.__keytransform__(key), value)
+            value = _merge_names(dict.__getitem__(self, key), value)
+        else:
+            insort(self._dates_by_year.setdefault(key.year, []), key)
+            self._workdays.pop(key.year, None)
+        self._names_by_year.pop(key.year, None)
+
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: DateLike) -> None:
+        key = self.__keytransform__(key)
+        dict.__delitem__(self, key)
+        self._unindex(key)
+
+    def _unindex(self, key: date) -> None:
+        """Remove a deleted date from the sorted dates index."""
+        dates = self._dates_by_year[key.year]
+        del dates[bisect_left(dates, key)]
+        if not dates:
+            del self._dates_by_year[key.year]
+        self._workdays.pop(key.year, None)
+        self._names_by_year.pop(key.year, None)
+        self._split_by_date.pop(key, None)
+        self._frozen.clear()
+
+    def _dates_in_range(self, start: date, stop: date) -> List[date]:
+        """Return the sorted holiday dates from **start** (included) to
+        **stop** (excluded), populating the years in between if needed."""
+        dates_in_range: List[date] = []
+        if start >= stop:
+            return dates_in_range
+
+        if self.expand:
+            self._populate_years(range(start.year, stop.year + 1))
+        for year in range(start.year, stop.year + 1):
+            if year in self._pending_months:
+                self._populate_months(
+                    year,
+                    range(
+                        start.month if year == start.year else 1,
+                        (stop.month if year == stop.year else 12) + 1,
+                    ),
+                )
+            dates = self._dates_by_year.get(year)
+            if not dates:
+                continue
+            lo = bisect_left(dates, start) if year == start.year else 0
+            hi = bisect_left(dates, stop) if year == stop.year else None
+            dates_in_range.extend(dates[lo:hi])
+        return dates_in_range
 
     def update(  # type: ignore[override]
         self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
@@ -463,27 +972,517 @@ class HolidayBase(Dict[date, str]):
             * or a :class:`float` or :class:`int` representing a POSIX
               timestamp.
         """
-        return [h for h in self.get(key, "").split(", ") if h]
-
-    def get_named(self, name: str) -> List[date]:
-        """Return a list of all holiday dates matching the provided holiday
-        name. The match will be made case insensitively and partial matches
-        will be included.
+        key = self.__keytransform__(key)
+        value = dict.get(self, key)
+        if value is None:
+            return []
+        # The split names of each date are kept along with the value they
+        # were split from, and only reused while the date still holds it.
+        split = self._split_by_date.get(key)
+        if split is None or split[0] is not value:
+            split = self._split_by_date[key] = (value, _split_names(value))
+        return list(split[1])
+
+    def get_named(
+        self,
+        name: str,
+        lookup: str = "icontains",
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> List[date]:
+        """Return the sorted dates of the holidays matching the provided
+        holiday name. Each name of a date with several holidays is matched
+        on its own.
 
         :param name:
             The holiday's name to try to match.
 
+        :param lookup:
+            How to match the name: ``"exact"``, ``"startswith"`` or
+            ``"contains"``, and the same case insensitively with an ``i``
+            prefix (e.g. ``"iexact"``). Defaults to ``"icontains"``, which
+            includes partial matches.
+
+        :param years:
+            The year(s) to search, calculated first if needed and allowed
+            (see :attr:`expand`). Defaults to the years calculated so far.
+
         :return:
             A list of all holiday dates matching the provided holiday name.
+
+        :raise:
+            ValueError if the lookup is unknown.
         """
-        original_expand = self.expand
-        self.expand = False
-        matches = [
-            key for key in self if name.lower() in str(self[key]).lower()
-        ]
-        self.expand = original_expand
+        match = _name_matcher(name, lookup)
+        if years is None:
+            years = sorted(self._dates_by_year)
+        else:
+            years = sorted({years} if isinstance(years, int) else set(years))
+            if self.expand:
+                self._populate_years(years)
+
+        # Most names repeat every year: match each distinct one once.
+        matched: Dict[str, bool] = {}
+        matches: List[date] = []
+        for year in years:
+            if year in self._pending_months:
+                self._populate_months(year)
+            found = []
+            for holiday_name, dates in self._year_names(year).items():
+                is_match = matched.get(holiday_name)
+                if is_match is None:
+                    is_match = matched[holiday_name] = match(holiday_name)
+                if is_match:
+                    found.append(dates)
+            if len(found) == 1:
+                matches.extend(found[0])
+            elif found:
+                matches.extend(sorted(set().union(*found)))
         return matches
 
+    def _year_names(self, year: int) -> Dict[str, List[date]]:
+        """Return the sorted dates of each holiday name of a year, indexed on
+        first use until the holidays of the year change."""
+        names = self._names_by_year.get(year)
+        if names is None:
+            names = self._names_by_year[year] = {}
+            for dt in self._dates_by_year.get(year, ()):
+                for name in _split_names(dict.__getitem__(self, dt)):
+                    names.setdefault(name, []).append(dt)
+        return names
+
+    def next_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the first holiday on or after the date
+        provided.
+
+        Unless **expand** is False, the year of the date and then the
+        following one are calculated if needed. Years calculated earlier are
+        searched as well.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :return:
+            The date of the next holiday or None if there is none.
+        """
+        dt = self.__keytransform__(key)
+        for year in (dt.year, dt.year + 1):
+            dates = self._year_dates(year)
+            idx = bisect_left(dates, dt)
+            if idx < len(dates):
+                return dates[idx]
+
+        later_years = [y for y in self._dates_by_year if y > dt.year + 1]
+        return (
+            self._dates_by_year[min(later_years)][0] if later_years else None
+        )
+
+    def prev_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the last holiday before the date provided.
+
+        Unless **expand** is False, the year of the date and then the
+        preceding one are calculated if needed. Years calculated earlier are
+        searched as well.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :return:
+            The date of the previous holiday or None if there is none.
+        """
+        dt = self.__keytransform__(key)
+        for year in (dt.year, dt.year - 1):
+            dates = self._year_dates(year)
+            idx = bisect_left(dates, dt)
+            if idx > 0:
+                return dates[idx - 1]
+
+        earlier_years = [y for y in self._dates_by_year if y < dt.year - 1]
+        if earlier_years:
+            return self._dates_by_year[max(earlier_years)][-1]
+        return None
+
+    def holidays_between(self, start: DateLike, end: DateLike) -> List[date]:
+        """Return the sorted dates of all holidays from **start** to **end**,
+        both included. Unless **expand** is False, the years in between are
+        calculated if needed.
+
+        :param start:
+            The first date of the range, in any of the types accepted by
+            :meth:`next_holiday`.
+
+        :param end:
+            The last date of the range, in any of the types accepted by
+            :meth:`next_holiday`.
+
+        :return:
+            A list of dates, empty if **end** precedes **start**.
+        """
+        start = self.__keytransform__(start)
+        end = self.__keytransform__(end)
+        if end < start:
+            return []
+        dates = self._dates_in_range(start, end)
+        if dict.__contains__(cast("Mapping[Any, Any]", self), end):
+            dates.append(end)
+        return dates
+
+    def freeze(
+        self, years: Optional[Union[int, Iterable[int]]] = None
+    ) -> "FrozenHolidays":
+        """Return a compact, read-only snapshot of the holidays of some years
+        (see :class:`FrozenHolidays`).
+
+        :param years:
+            The year(s) to include, calculated first if needed. Defaults to
+            the years calculated so far.
+
+        :return:
+            A :class:`FrozenHolidays` object, the same one as long as the
+            holidays are not changed.
+        """
+        if years is None:
+            years = self.years | set(self._dates_by_year)
+        elif isinstance(years, int):
+            years = {years}
+        else:
+            years = set(years)
+        self._populate_years(years)
+        for year in years:
+            self._populate_months(year)
+
+        key = frozenset(years)
+        frozen = self._frozen.get(key)
+        if frozen is None:
+            frozen = FrozenHolidays(
+                (
+                    (dt, dict.__getitem__(self, dt))
+                    for year in sorted(years)
+                    for dt in self._dates_by_year.get(year, ())
+                ),
+                years,
+                self.parse_cache,
+            )
+            self._frozen.clear()
+            self._frozen[key] = frozen
+        return frozen
+
+    def derive(
+        self, years: Optional[Union[int, Iterable[int]]] = None
+    ) -> "DerivedHolidays":
+        """Return a copy of the holidays of some years to be changed
+        independently of this object (see :class:`DerivedHolidays`).
+
+        The copies share the snapshot returned by :meth:`freeze` and only
+        record their own changes, so that many variants of a calendar are
+        cheap to keep.
+
+        :param years:
+            The year(s) to include, calculated first if needed. Defaults to
+            the years calculated so far.
+
+        :return:
+            A :class:`DerivedHolidays` object.
+        """
+        return self.freeze(years).derive()
+
+    def is_business_day(self, key: DateLike) -> bool:
+        """Return True if the date is neither a weekend day (see
+        :attr:`weekend`) nor a holiday, False otherwise.
+
+        :param key:
+            The date expressed in any of the types accepted by :meth:`get`.
+        """
+        dt = self.__keytransform__(key)
+        counts = self._workday_counts(dt.year)
+        day = _day_of_year(dt)
+        return counts[day + 1] != counts[day]
+
+    def add_business_days(self, key: DateLike, days: int) -> date:
+        """Return the date which is the given number of business days (see
+        :meth:`is_business_day`) after the date provided, or before it if the
+        number is negative. The date provided itself is not counted, and it
+        is returned as is if the number is zero.
+
+        :param key:
+            The date expressed in any of the types accepted by :meth:`get`.
+
+        :param days:
+            The number of business days to add.
+        """
+        dt = self.__keytransform__(key)
+        if days == 0:
+            return dt
+        self._check_workweek()
+
+        # Look for the n-th business day of the year (1-based), moving to the
+        # adjacent years while it's out of the current one.
+        year = dt.year
+        counts = self._workday_counts(year)
+        day = _day_of_year(dt)
+        if days > 0:
+            nth = counts[day + 1] + days
+            while nth > counts[-1]:
+                nth -= counts[-1]
+                year += 1
+                counts = self._workday_counts(year)
+        else:
+            nth = counts[day] + days + 1
+            while nth < 1:
+                year -= 1
+                counts = self._workday_counts(year)
+                nth += counts[-1]
+        day = bisect_left(counts, nth) - 1
+        return date(year, 1, 1) + timedelta(days=day)
+
+    def business_days_between(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of business days (see :meth:`is_business_day`)
+        from **start** (included) to **end** (excluded). The number is
+        negative if **end** precedes **start**.
+
+        :param start:
+            The date expressed in any of the types accepted by :meth:`get`.
+
+        :param end:
+            The date expressed in any of the types accepted by :meth:`get`.
+        """
+        start = self.__keytransform__(start)
+        end = self.__keytransform__(end)
+        if end < start:
+            return -self.business_days_between(end, start)
+
+        count = 0
+        for year in range(start.year, end.year + 1):
+            counts = self._workday_counts(year)
+            count += (
+                counts[_day_of_year(end)] if year == end.year else counts[-1]
+            )
+            if year == start.year:
+                count -= counts[_day_of_year(start)]
+        return count
+
+    def roll(self, key: DateLike, convention: str = "following") -> date:
+        """Return the date itself if it is a business day (see
+        :meth:`is_business_day`), or else a nearby business day according to
+        the convention provided.
+
+        :param key:
+            The date expressed in any of the types accepted by :meth:`get`.
+
+        :param convention:
+            One of:
+
+            * ``"following"``: the next business day,
+            * ``"preceding"``: the previous business day,
+            * ``"modified_following"``: the next business day unless it falls
+              in the next month, the previous one otherwise.
+        """
+        if convention not in {"following", "preceding", "modified_following"}:
+            raise ValueError(f"Unknown roll convention '{convention}'.")
+
+        dt = self.__keytransform__(key)
+        if self.is_business_day(dt):
+            return dt
+        if convention == "preceding":
+            return self.add_business_days(dt, -1)
+        rolled_dt = self.add_business_days(dt, +1)
+        if convention == "modified_following" and rolled_dt.month != dt.month:
+            return self.add_business_days(dt, -1)
+        return rolled_dt
+
+    def _check_workweek(self) -> None:
+        if all(weekday in self.weekend for weekday in range(7)):
+            raise ValueError("There are no business days in the week.")
+
+    def _workday_counts(self, year: int) -> "array[int]":
+        """Return the cumulative business days counts of a year: the item at
+        index ``n`` is the number of business days among the first ``n``
+        days of the year, so that there is one more item than days."""
+        counts = self._workdays.get(year)
+        if counts is not None:
+            return counts
+
+        if self.expand:
+            # Observed holidays may be added to the adjacent years too.
+            for y in (year - 1, year, year + 1):
+                if y not in self.years and MINYEAR <= y <= MAXYEAR:
+                    self._populate_year(y)
+        if year in self._pending_months:
+            self._populate_months(year)
+
+        week = bytes(int(wd not in self.weekend) for wd in range(7))
+        first_weekday = date(year, 1, 1).weekday()
+        week = week[first_weekday:] + week[:first_weekday]
+        workdays = bytearray((week * 53)[: 365 + calendar.isleap(year)])
+        for dt in self._dates_by_year.get(year, ()):
+            workdays[_day_of_year(dt)] = 0
+        counts = array("H", (0,))
+        counts.extend(accumulate(workdays))
+        self._workdays[year] = counts
+        return counts
+
+    def contains_many(self, dates: Iterable[DateLike]) -> Any:
+        """Check many dates at once. All the years needed are calculated
+        first (unless **expand** is False), then the dates are checked in a
+        single pass.
+
+        :param dates:
+            Either an iterable of dates (expressed in any of the types
+            accepted by :meth:`get`), or a NumPy array of
+            ``datetime64`` values.
+
+        :return:
+            A list of booleans telling whether each date is a holiday, or a
+            boolean NumPy array for a NumPy input.
+        """
+        if _is_numpy_array(dates):
+            return self._numpy_lookup(dates)[0]
+
+        keys = self._batch_keys(dates)
+        holiday_dates = self.keys()
+        return [key in holiday_dates for key in keys]
+
+    def get_many(
+        self, dates: Iterable[DateLike], default: Union[str, Any] = None
+    ) -> Any:
+        """Return the holiday names of many dates at once, the same way
+        :meth:`get` does for a single date (see :meth:`contains_many`).
+
+        :param dates:
+            Either an iterable of dates (expressed in any of the types
+            accepted by :meth:`get`), or a NumPy array of
+            ``datetime64`` values.
+
+        :param default:
+            The value to use for the dates which are not holidays.
+
+        :return:
+            A list of holiday names, or an object NumPy array for a NumPy
+            input.
+        """
+        if _is_numpy_array(dates):
+            mask, names = self._numpy_lookup(dates)
+            names[~mask] = default
+            return names
+
+        keys = self._batch_keys(dates)
+        get = dict.get
+        return [get(self, key, default) for key in keys]
+
+    def names_many(self, dates: Iterable[DateLike]) -> Any:
+        """Return the lists of holiday names of many dates at once, the same
+        way :meth:`get_list` does for a single date (see
+        :meth:`contains_many`).
+
+        :param dates:
+            Either an iterable of dates (expressed in any of the types
+            accepted by :meth:`get`), or a NumPy array of
+            ``datetime64`` values.
+
+        :return:
+            A list of lists of holiday names, or an object NumPy array of
+            lists for a NumPy input.
+        """
+        names = self.get_many(dates, "")
+        if _is_numpy_array(names):
+            # Object arrays are filled item by item to keep the lists intact.
+            names_lists = names.copy()
+            for idx, name in enumerate(names.flat):
+                names_lists.flat[idx] = list(_split_names(name))
+            return names_lists
+        return [list(_split_names(name)) for name in names]
+
+    def _batch_keys(self, dates: Iterable[DateLike]) -> List[date]:
+        """Convert many keys to dates and calculate all their years."""
+        if self.strict:
+            keys = list(cast(Iterable[date], dates))
+            for key in keys:
+                if type(key) is not date:
+                    raise TypeError(
+                        "Cannot use type '%s' as a key in strict mode."
+                        % type(key)
+                    )
+        else:
+            keys = [
+                key if type(key) is date else self._to_date(key)
+                for key in dates
+            ]
+        if self.expand:
+            self._populate_years({key.year for key in keys})
+        if self._pending_months:
+            for year, month in {(key.year, key.month) for key in keys}:
+                self._populate_months(year, (month,))
+        return keys
+
+    def _numpy_lookup(self, dates: Any) -> Tuple[Any, Any]:
+        """Look up a NumPy array of dates.
+
+        :return:
+            A tuple of a boolean array of matches and an object array of
+            holiday names (None where there is no match).
+        """
+        import numpy as np
+
+        days = np.asarray(dates).astype("datetime64[D]")
+        valid_days = days[~np.isnat(days)]
+        if self.expand and valid_days.size:
+            years = np.unique(valid_days.astype("datetime64[Y]").astype(int))
+            self._populate_years(
+                year
+                for year in (years + 1970).tolist()
+                if MINYEAR <= year <= MAXYEAR
+            )
+            for year in (years + 1970).tolist():
+                self._populate_months(year)
+
+        holiday_dates = [
+            dt
+            for year in sorted(self._dates_by_year)
+            for dt in self._dates_by_year[year]
+        ]
+        holiday_days = np.array(holiday_dates, dtype="datetime64[D]")
+        names = np.full(days.shape, None, dtype=object)
+        if not holiday_days.size:
+            return np.zeros(days.shape, dtype=bool), names
+
+        # A binary search of every date in the (much shorter) sorted array
+        # of holidays, which doubles as the index of the matching names.
+        idx = np.searchsorted(holiday_days, days).clip(
+            max=holiday_days.size - 1
+        )
+        mask = holiday_days[idx] == days
+        holiday_names = np.array(
+            [dict.__getitem__(self, dt) for dt in holiday_dates], dtype=object
+        )
+        names[mask] = holiday_names[idx[mask]]
+        return mask, names
+
+    def _year_dates(self, year: int) -> List[date]:
+        """Return the sorted holiday dates of a year, calculating it first if
+        needed and allowed."""
+        if (
+            self.expand
+            and year not in self.years
+            and MINYEAR <= year <= MAXYEAR
+        ):
+            self._populate_year(year)
+        if year in self._pending_months:
+            self._populate_months(year)
+        return self._dates_by_year.get(year, [])
+
     def pop(
         self,
         key: DateLike,
@@ -511,39 +1510,85 @@ class HolidayBase(Dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        key = self.__keytransform__(key)
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
-        return dict.pop(self, self.__keytransform__(key), default)
-
-    def pop_named(self, name: str) -> List[date]:
+            value = dict.pop(self, key)
+        elif dict.__contains__(cast("Mapping[Any, Any]", self), key):
+            value = dict.pop(self, key)
+        else:
+            return default
+        self._unindex(key)
+        return value
+
+    def popitem(self) -> Tuple[date, str]:
+        key, value = super().popitem()
+        self._unindex(key)
+        return key, value
+
+    def setdefault(  # type: ignore[override]
+        self, key: DateLike, default: str
+    ) -> str:
+        key = self.__keytransform__(key)
+        if not dict.__contains__(cast("Mapping[Any, Any]", self), key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def clear(self) -> None:
+        super().clear()
+        self._dates_by_year.clear()
+        self._workdays.clear()
+        self._names_by_year.clear()
+        self._split_by_date.clear()
+        self._frozen.clear()
+
+    def pop_named(
+        self,
+        name: str,
+        lookup: str = "icontains",
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> List[date]:
         """Remove (no longer treat at as holiday) all dates matching the
-        provided holiday name. The match will be made case insensitively and
-        partial matches will be removed.
+        provided holiday name (see :meth:`get_named`). By default the match
+        will be made case insensitively and partial matches will be removed.
 
         :param name:
             The holiday's name to try to match.
 
-        :param default:
-            The default value to return if no match is found.
+        :param lookup:
+            How to match the name, see :meth:`get_named`.
+
+        :param years:
+            The year(s) to search, see :meth:`get_named`.
 
         :return:
             A list of dates removed.
 
         :raise:
-            KeyError if date is not a holiday and default is not given.
+            KeyError if no date matches.
         """
-        to_pop = self.get_named(name)
+        to_pop = self.get_named(name, lookup, years)
         if not to_pop:
             raise KeyError(name)
         for key in to_pop:
-            self.pop(key)
+            dict.__delitem__(self, key)
+            self._unindex(key)
         return to_pop
 
+    def _public_attrs(self) -> Dict[str, Any]:
+        """Return the public attributes (e.g. ``years`` or ``subdiv``) of the
+        object, leaving out internal indexes and caches."""
+        return {k: v for k, v in self.__dict__.items() if k[0] != "_"}
+
     def __eq__(self, other: object) -> bool:
-        return dict.__eq__(self, other) and self.__dict__ == other.__dict__
+        if not isinstance(other, HolidayBase):
+            return False
+        return (
+            dict.__eq__(self, other)
+            and self._public_attrs() == other._public_attrs()
+        )
 
     def __ne__(self, other: object) -> bool:
-        return dict.__ne__(self, other) or self.__dict__ != other.__dict__
+        return not self.__eq__(other)
 
     def __add__(
         self, other: Union[int, "HolidayBase", "HolidaySum"]
@@ -588,10 +1633,40 @@ class HolidayBase(Dict[date, str]):
         >>> us_holidays.update(country_holidays('US', years=2021))
         """
 
+        # Fixed-date holidays.
+        for month, day, name, start_year, end_year in self._fixed_rules():
+            if start_year <= year <= end_year:
+                self[date(year, month, day)] = name
+
         # Special holidays list.
         for month, day, name in self.special_holidays.get(year, ()):
             self[date(year, month, day)] = name
 
+    def _fixed_rules(self) -> Tuple[Tuple[int, int, str, int, int], ...]:
+        """Return the :attr:`fixed_holidays` of the subdivision as plain
+        ``(month, day, name, start_year, end_year)`` tuples, compiled once for
+        each class and subdivision."""
+        # The cached rules are only reused for the very fixed_holidays they
+        # were compiled from, so reassigning it (on a class or an instance)
+        # never leaves stale rules behind.
+        key = (self.__class__, self.subdiv)
+        fixed_holidays = self.fixed_holidays
+        source, rules = _fixed_rules.get(key, (None, None))
+        if rules is None or source is not fixed_holidays:
+            rules = tuple(
+                (
+                    holiday.month,
+                    holiday.day,
+                    sys.intern(holiday.name),
+                    holiday.start_year,
+                    holiday.end_year,
+                )
+                for holiday in fixed_holidays
+                if holiday.subdivs is None or self.subdiv in holiday.subdivs
+            )
+            _fixed_rules[key] = (fixed_holidays, rules)
+        return rules
+
     def _is_weekend(self, *args):
         """
         Returns True if date's week day is a weekend day.
@@ -604,6 +1679,38 @@ class HolidayBase(Dict[date, str]):
     def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
         return super().__reduce__()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # The dates index and the working days and names maps are derived
+        # data, so they are rebuilt on load instead of being serialized (or
+        # shared between copies).
+        state = self.__dict__.copy()
+        state.pop("_dates_by_year", None)
+        state.pop("_workdays", None)
+        state.pop("_names_by_year", None)
+        state.pop("_split_by_date", None)
+        state.pop("_observed_layers", None)
+        state.pop("_frozen", None)
+        # The pending months are consumed in place, so each copy needs its
+        # own lists.
+        state["_pending_months"] = {
+            year: list(methods)
+            for year, methods in self.__dict__.get(
+                "_pending_months", {}
+            ).items()
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._dates_by_year = {}
+        self._workdays = {}
+        self._names_by_year = {}
+        self._split_by_date = {}
+        self._observed_layers = {}
+        self._frozen = {}
+        for key in sorted(self):
+            self._dates_by_year.setdefault(key.year, []).append(key)
+
     def __repr__(self) -> str:
         _repr = ""
         if len(self) == 0:
@@ -624,10 +1731,95 @@ class HolidayBase(Dict[date, str]):
 
     def __str__(self) -> str:
         if len(self) == 0:
-            return str(self.__dict__)
+            return str(self._public_attrs())
         return super().__str__()
 
 
+def _to_date(key: DateLike, parse_cache: DateParseCache) -> date:
+    """Convert a key to :class:`datetime.date`, parsing strings with
+    **parse_cache**."""
+    if isinstance(key, datetime):
+        return key.date()
+    elif isinstance(key, date):
+        return key
+    elif isinstance(key, int) or isinstance(key, float):
+        return datetime.utcfromtimestamp(key).date()
+    elif isinstance(key, str):
+        return parse_cache.parse(key)
+    raise TypeError("Cannot convert type '%s' to date." % type(key))
+
+
+_fixed_rules: Dict[
+    Tuple[type, Any],
+    Tuple[
+        Tuple[FixedHoliday, ...], Tuple[Tuple[int, int, str, int, int], ...]
+    ],
+] = {}
+
+_NAMES_CACHE_SIZE = 4096
+_split_cache: Dict[str, Tuple[str, ...]] = {}
+_merge_cache: Dict[Tuple[str, str], str] = {}
+
+
+def _split_names(value: str) -> Tuple[str, ...]:
+    """Return the holiday names of a value (e.g. ``"A, B"``) as a tuple of
+    interned strings.
+
+    Each distinct value is only split once for all objects: the tuples are
+    kept in a module-level table, emptied when it grows too large."""
+    names = _split_cache.get(value)
+    if names is None:
+        if len(_split_cache) >= _NAMES_CACHE_SIZE:
+            _split_cache.clear()
+        names = _split_cache[value] = tuple(
+            sys.intern(name) for name in value.split(", ") if name
+        )
+    return names
+
+
+def _merge_names(current: str, value: str) -> str:
+    """Return the value of a date holding the names of both values, sorted
+    alphabetically and without duplicates (see :func:`_split_names`)."""
+    merged = _merge_cache.get((current, value))
+    if merged is None:
+        if len(_merge_cache) >= _NAMES_CACHE_SIZE:
+            _merge_cache.clear()
+        merged = _merge_cache[(current, value)] = ", ".join(
+            sorted(set(_split_names(current)) | set(_split_names(value)))
+        )
+    return merged
+
+
+_NAME_LOOKUPS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": str.__contains__,
+    "exact": str.__eq__,
+    "startswith": str.startswith,
+}
+
+
+def _name_matcher(name: str, lookup: str) -> Callable[[str], bool]:
+    """Return a function telling whether a holiday name matches **name**
+    (see :meth:`HolidayBase.get_named`)."""
+    if lookup[:1] == "i" and lookup[1:] in _NAME_LOOKUPS:
+        test = _NAME_LOOKUPS[lookup[1:]]
+        name = name.lower()
+        return lambda value: test(value.lower(), name)
+    if lookup in _NAME_LOOKUPS:
+        test = _NAME_LOOKUPS[lookup]
+        return lambda value: test(value, name)
+    raise ValueError(f"Unknown lookup '{lookup}'.")
+
+
+def _day_of_year(dt: date) -> int:
+    """Return the zero-based index of a date within its year."""
+    return dt.toordinal() - date(dt.year, 1, 1).toordinal()
+
+
+def _is_numpy_array(obj: Any) -> bool:
+    """Check whether an object is a NumPy array without importing NumPy."""
+    return type(obj).__module__ == "numpy" and hasattr(obj, "dtype")
+
+
 class HolidaySum(HolidayBase):
     """
     Returns a :class:`dict`-like object resulting from the addition of two or
@@ -635,7 +1827,8 @@ class HolidaySum(HolidayBase):
     are available as a :class:`list` in the attribute :attr:`holidays,` and
     :attr:`country` and :attr:`subdiv` attributes are added
     together and could become :class:`list` s. Holiday names, when different,
-    are merged. All years are calculated (expanded) for all operands.
+    are merged. All years are calculated (expanded) for all operands. The sum
+    is strict only if all the operands are.
     """
 
     country: Union[str, List[str]]  # type: ignore[assignment]
@@ -697,6 +1890,7 @@ country_holidays('CA') + country_holidays('MX')
         kwargs["years"] = h1.years | h2.years
         kwargs["expand"] = h1.expand or h2.expand
         kwargs["observed"] = h1.observed or h2.observed
+        kwargs["strict"] = h1.strict and h2.strict
         # join country and subdivisions data
         # TODO this way makes no sense: joining Italy Catania (IT, CA) with
         # USA Mississippi (US, MS) and USA Michigan (US, MI) yields
@@ -735,6 +1929,429 @@ country_holidays('CA') + country_holidays('MX')
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
-        for h in self.holidays[::-1]:
-            h._populate(year)
-            self.update(cast("Dict[DateLike, str]", h))
+        # Only merge what the added objects hold around the year (its rules
+        # may add observed dates to the adjacent years), joining the names
+        # of each date once.
+        names: Dict[date, Set[str]] = {}
+        for h in self.holidays:
+            if year not in h.years:
+                h._populate_year(year)
+            for y in (year - 1, year, year + 1):
+                if y in h._pending_months:
+                    h._populate_months(y)
+                for dt in h._dates_by_year.get(y, ()):
+                    names.setdefault(dt, set()).update(
+                        _split_names(dict.__getitem__(h, dt))
+                    )
+
+        if self.expand:
+            for y in sorted({dt.year for dt in names} - self.years):
+                self._populate_year(y)
+        for dt, date_names in names.items():
+            current = dict.get(self, dt)
+            if current is None:
+                insort(self._dates_by_year.setdefault(dt.year, []), dt)
+                self._workdays.pop(dt.year, None)
+            else:
+                date_names.update(_split_names(current))
+            self._names_by_year.pop(dt.year, None)
+            dict.__setitem__(self, dt, ", ".join(sorted(date_names)))
+
+    def _year_cache_key(self, year: int, observed: bool) -> Optional[Hashable]:
+        # The holidays depend on each of the added objects.
+        return None
+
+    def _observed_variant(self, year: int, observed: bool) -> Set[_Pair]:
+        pairs: Set[_Pair] = set()
+        for h in self.holidays:
+            pairs |= h._observed_variant(year, observed)
+        return pairs
+
+
+class FrozenHolidays(Mapping[date, str]):
+    """
+    A compact, read-only snapshot of the holidays of a set of years, as
+    returned by :meth:`HolidayBase.freeze`.
+
+    The holidays are stored as a sorted :class:`array.array` of date ordinals
+    and a parallel array of indexes into a table of interned names, so that
+    decades of holidays take a fraction of the memory of the
+    :class:`HolidayBase` object they were taken from. Lookups, range and
+    next/previous holiday queries are answered by binary search.
+
+    As nothing can be changed after creation, a :class:`FrozenHolidays`
+    object can be shared between threads without any locking.
+
+    Dates out of the frozen **years** are never holidays: unlike
+    :class:`HolidayBase`, nothing is calculated on the fly.
+
+    >>> from holidays import country_holidays
+    >>> us_holidays = country_holidays('US').freeze(range(1950, 2101))
+    >>> us_holidays.get('2020-07-03')
+    'Independence Day (Observed)'
+    >>> us_holidays.next_holiday('2020-07-05')
+    datetime.date(2020, 9, 7)
+    """
+
+    __slots__ = ("_name_ids", "_names", "_ordinals", "parse_cache", "years")
+
+    def __init__(
+        self,
+        holidays: Iterable[Tuple[date, str]],
+        years: Iterable[int],
+        parse_cache: Optional[DateParseCache] = None,
+    ) -> None:
+        """
+        :param holidays:
+            The ``(date, name)`` pairs of the holidays, sorted by date.
+
+        :param years:
+            The years the holidays were calculated for.
+
+        :param parse_cache:
+            The cache of string keys conversions, defaults to the one of
+            :class:`HolidayBase`.
+        """
+        name_ids: Dict[str, int] = {}
+        ordinals = array("i")
+        ids = []
+        for dt, name in holidays:
+            ordinals.append(dt.toordinal())
+            ids.append(name_ids.setdefault(sys.intern(name), len(name_ids)))
+
+        self._ordinals: Sequence[int] = ordinals
+        self._name_ids: Sequence[int] = array(
+            "H" if len(name_ids) <= 0xFFFF else "I", ids
+        )
+        self._names: Sequence[str] = tuple(name_ids)
+        self.years = frozenset(years)
+        self.parse_cache = parse_cache or HolidayBase.parse_cache
+
+    @classmethod
+    def _from_columns(
+        cls,
+        ordinals: Sequence[int],
+        name_ids: Sequence[int],
+        names: Sequence[str],
+        years: Iterable[int],
+        parse_cache: Optional[DateParseCache] = None,
+    ) -> "FrozenHolidays":
+        """Create an object directly from sorted date ordinals and name
+        indexes, e.g. views of a memory-mapped file, without copying them."""
+        obj = cls.__new__(cls)
+        obj._ordinals = ordinals
+        obj._name_ids = name_ids
+        obj._names = names
+        obj.years = frozenset(years)
+        obj.parse_cache = parse_cache or HolidayBase.parse_cache
+        return obj
+
+    def _to_date(self, key: DateLike) -> date:
+        """Convert a key to :class:`datetime.date`."""
+        return _to_date(key, self.parse_cache)
+
+    def _index(self, key: DateLike) -> int:
+        """Return the position of a date in the ordinals or -1 if it's not a
+        holiday."""
+        ordinal = self._to_date(key).toordinal()
+        idx = bisect_left(self._ordinals, ordinal)
+        if idx < len(self._ordinals) and self._ordinals[idx] == ordinal:
+            return idx
+        return -1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, str, float, int)):
+            raise TypeError("Cannot convert type '%s' to date." % type(key))
+        return self._index(key) >= 0
+
+    def __getitem__(self, key: DateLike) -> str:
+        idx = self._index(key)
+        if idx < 0:
+            raise KeyError(key)
+        return self._names[self._name_ids[idx]]
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def get(  # type: ignore[override]
+        self, key: DateLike, default: Union[str, Any] = None
+    ) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default (see :meth:`HolidayBase.get`)."""
+        idx = self._index(key)
+        return self._names[self._name_ids[idx]] if idx >= 0 else default
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date (see
+        :meth:`HolidayBase.get_list`)."""
+        return list(_split_names(self.get(key, "")))
+
+    def next_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the first holiday on or after the date
+        provided, or None if there is none."""
+        idx = bisect_left(self._ordinals, self._to_date(key).toordinal())
+        if idx < len(self._ordinals):
+            return date.fromordinal(self._ordinals[idx])
+        return None
+
+    def prev_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the last holiday before the date provided, or
+        None if there is none."""
+        idx = bisect_left(self._ordinals, self._to_date(key).toordinal())
+        return date.fromordinal(self._ordinals[idx - 1]) if idx > 0 else None
+
+    def holidays_between(self, start: DateLike, end: DateLike) -> List[date]:
+        """Return the sorted dates of all holidays from **start** to **end**,
+        both included."""
+        lo = bisect_left(self._ordinals, self._to_date(start).toordinal())
+        hi = bisect_right(self._ordinals, self._to_date(end).toordinal())
+        return [date.fromordinal(o) for o in self._ordinals[lo:hi]]
+
+    def derive(self) -> "DerivedHolidays":
+        """Return a changeable copy of the holidays sharing this object (see
+        :class:`DerivedHolidays`)."""
+        return DerivedHolidays(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (list(self.items()), self.years)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+class DerivedHolidays(MutableMapping[date, str]):
+    """
+    A changeable copy of a :class:`FrozenHolidays` object, as returned by
+    :meth:`HolidayBase.derive`.
+
+    The frozen holidays are shared, not copied: the object only records the
+    dates added (or renamed) and removed since, which are looked up first.
+    Deriving a variant of a calendar, e.g. for each client with its own
+    extra or missing holidays, thus costs memory in proportion to its
+    changes only.
+
+    As with :class:`FrozenHolidays`, nothing is calculated on the fly.
+
+    >>> from holidays import country_holidays
+    >>> gb_holidays = country_holidays('GB', years=range(1990, 2060))
+    >>> client_holidays = gb_holidays.derive()
+    >>> client_holidays.pop_named('Boxing Day')[:1]
+    [datetime.date(1990, 12, 26)]
+    >>> client_holidays.update({'2020-12-24': 'Christmas Eve'})
+    >>> '2020-12-24' in client_holidays, '2020-12-24' in gb_holidays
+    (True, False)
+    """
+
+    __slots__ = ("_added", "_frozen", "_removed")
+
+    def __init__(self, frozen: FrozenHolidays) -> None:
+        """
+        :param frozen:
+            The holidays to start from.
+        """
+        self._frozen = frozen
+        self._added: Dict[date, str] = {}
+        self._removed: Set[date] = set()
+
+    @property
+    def years(self) -> FrozenSet[int]:
+        """The years the holidays were calculated for."""
+        return self._frozen.years
+
+    def _to_date(self, key: DateLike) -> date:
+        """Convert a key to :class:`datetime.date`."""
+        return self._frozen._to_date(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, str, float, int)):
+            raise TypeError("Cannot convert type '%s' to date." % type(key))
+        return self.get(key) is not None
+
+    def __getitem__(self, key: DateLike) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: DateLike, value: str) -> None:
+        key = self._to_date(key)
+        current = self.get(key)
+        if current is not None:
+            # Merge the names, as HolidayBase does.
+            value = _merge_names(current, value)
+        self._removed.discard(key)
+        self._added[key] = value
+
+    def __delitem__(self, key: DateLike) -> None:
+        key = self._to_date(key)
+        if self.get(key) is None:
+            raise KeyError(key)
+        self._added.pop(key, None)
+        if key in self._frozen:
+            self._removed.add(key)
+
+    def __iter__(self) -> Iterator[date]:
+        if not self._added and not self._removed:
+            return iter(self._frozen)
+        return iter(
+            merge(
+                (
+                    dt
+                    for dt in self._frozen
+                    if dt not in self._removed and dt not in self._added
+                ),
+                sorted(self._added),
+            )
+        )
+
+    def __len__(self) -> int:
+        return (
+            len(self._frozen)
+            - len(self._removed)
+            + sum(dt not in self._frozen for dt in self._added)
+        )
+
+    def get(  # type: ignore[override]
+        self, key: DateLike, default: Union[str, Any] = None
+    ) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default (see :meth:`HolidayBase.get`)."""
+        key = self._to_date(key)
+        value = self._added.get(key)
+        if value is not None:
+            return value
+        if key in self._removed:
+            return default
+        return self._frozen.get(key, default)
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date (see
+        :meth:`HolidayBase.get_list`)."""
+        return list(_split_names(self.get(key, "")))
+
+    def get_named(
+        self,
+        name: str,
+        lookup: str = "icontains",
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> List[date]:
+        """Return the sorted dates of the holidays matching the provided
+        holiday name (see :meth:`HolidayBase.get_named`)."""
+        match = _name_matcher(name, lookup)
+        if isinstance(years, int):
+            years = {years}
+        elif years is not None:
+            years = set(years)
+        return [
+            dt
+            for dt, value in self.items()
+            if (years is None or dt.year in years)
+            and any(map(match, _split_names(value)))
+        ]
+
+    def pop(  # type: ignore[override]
+        self, key: DateLike, default: Union[str, Any] = None
+    ) -> Union[str, Any]:
+        """If date is a holiday, remove it and return its name, else return
+        default (see :meth:`HolidayBase.pop`).
+
+        :raise:
+            KeyError if date is not a holiday and default is not given.
+        """
+        value = self.get(key)
+        if value is None:
+            if default is None:
+                raise KeyError(key)
+            return default
+        del self[key]
+        return value
+
+    def pop_named(
+        self,
+        name: str,
+        lookup: str = "icontains",
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> List[date]:
+        """Remove all dates matching the provided holiday name (see
+        :meth:`HolidayBase.pop_named`).
+
+        :raise:
+            KeyError if no date matches.
+        """
+        to_pop = self.get_named(name, lookup, years)
+        if not to_pop:
+            raise KeyError(name)
+        for key in to_pop:
+            del self[key]
+        return to_pop
+
+    def update(  # type: ignore[override]
+        self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
+    ) -> None:
+        """Add holidays, as :meth:`HolidayBase.update` does."""
+        for arg in args:
+            if isinstance(arg, dict):
+                for key, value in arg.items():
+                    self[key] = value
+            elif isinstance(arg, list):
+                for item in arg:
+                    self[item] = "Holiday"
+            else:
+                self[arg] = "Holiday"
+
+    def append(
+        self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
+    ) -> None:
+        """Alias for :meth:`update` to mimic list type."""
+        return self.update(*args)
+
+    def next_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the first holiday on or after the date
+        provided, or None if there is none."""
+        key = self._to_date(key)
+        dt = self._frozen.next_holiday(key)
+        while dt is not None and dt in self._removed:
+            dt = self._frozen.next_holiday(dt + timedelta(days=1))
+        candidates = [added for added in self._added if added >= key]
+        if dt is not None:
+            candidates.append(dt)
+        return min(candidates, default=None)
+
+    def prev_holiday(self, key: DateLike) -> Optional[date]:
+        """Return the date of the last holiday before the date provided, or
+        None if there is none."""
+        key = self._to_date(key)
+        dt = self._frozen.prev_holiday(key)
+        while dt is not None and dt in self._removed:
+            dt = self._frozen.prev_holiday(dt)
+        candidates = [added for added in self._added if added < key]
+        if dt is not None:
+            candidates.append(dt)
+        return max(candidates, default=None)
+
+    def holidays_between(self, start: DateLike, end: DateLike) -> List[date]:
+        """Return the sorted dates of all holidays from **start** to **end**,
+        both included."""
+        start = self._to_date(start)
+        end = self._to_date(end)
+        dates = {
+            dt
+            for dt in self._frozen.holidays_between(start, end)
+            if dt not in self._removed
+        }
+        dates.update(dt for dt in self._added if start <= dt <= end)
+        return sorted(dates)
+
+    def derive(self) -> "DerivedHolidays":
+        """Return a changeable copy of the holidays, sharing the same frozen
+        ones."""
+        derived = DerivedHolidays(self._frozen)
+        derived._added.update(self._added)
+        derived._removed.update(self._removed)
+        return derived
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
@@ -0,0 +1,299 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""
+Memory-mapped holiday stores.
+
+A store is a single file holding the holidays of any number of
+:class:`holidays.holiday_base.HolidayBase` objects, written once with
+:func:`write_store` and opened with :class:`HolidayStore`. The file is
+memory-mapped and queried in place: processes opening the same store (e.g.
+the workers of a web server) share a single copy of its pages instead of each
+calculating and keeping the same holidays in their own memory.
+
+>>> from holidays import country_holidays
+>>> write_store(
+...     'holidays.store',
+...     [country_holidays('US', years=range(2000, 2051)),
+...      country_holidays('US', subdiv='CA', years=range(2000, 2051))],
+... )  # doctest: +SKIP
+>>> store = HolidayStore('holidays.store')  # doctest: +SKIP
+>>> store.calendar('US', 'CA').get('2020-03-31')  # doctest: +SKIP
+'César Chávez Day'
+
+Store layout (native byte order, recorded in the header):
+
+* the magic bytes ``HOLSTR1\\n`` and the length of the JSON header as a
+  4-byte unsigned integer,
+* the JSON header, padded with spaces to a multiple of 4 bytes, listing each
+  calendar's code, subdivision, observed setting, years and the start and end
+  positions of its holidays in the entries below,
+* the entries' date ordinals as 4-byte integers, sorted for each calendar,
+* the entries' name indexes as 4-byte unsigned integers,
+* the start position of each name in the names blob, plus its total length,
+  as 4-byte unsigned integers,
+* the names blob: the distinct names, UTF-8 encoded.
+"""
+
+__all__ = ("HolidayStore", "write_store")
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Tuple, Union, overload
+
+from holidays.holiday_base import FrozenHolidays, HolidayBase
+
+_MAGIC = b"HOLSTR1\n"
+_LENGTH = struct.Struct("I")
+
+_Key = Tuple[str, Optional[str], bool]
+
+
+def _calendar_code(obj: HolidayBase) -> str:
+    """Return the country or market code of an object; the codes of a sum
+    of holidays are joined with ``+``."""
+    code = getattr(obj, "market", None) or getattr(obj, "country", None)
+    if isinstance(code, list):
+        code = "+".join(code)
+    if not isinstance(code, str):
+        raise ValueError(f"Cannot store holidays without a code: {obj!r}.")
+    return code
+
+
+def _calendar_subdiv(obj: HolidayBase) -> Optional[str]:
+    """Return the subdivision of an object; the subdivisions of a sum of
+    holidays are joined with ``+``, like its codes."""
+    subdiv = obj.subdiv
+    if isinstance(subdiv, list):
+        subdiv = "+".join(subdiv)
+    return subdiv
+
+
+def write_store(
+    path: Union[str, Path],
+    objects: Iterable[HolidayBase],
+    years: Optional[Iterable[int]] = None,
+) -> None:
+    """Write the holidays of some objects to a store file.
+
+    Each object is stored as a calendar identified by its country or market
+    code, its subdivision and its :attr:`observed` setting. The codes and
+    subdivisions of a sum of holidays are joined with ``+`` (e.g.
+    ``US(subdiv="CA") + US(subdiv="NY")`` is stored as ``("US", "CA+NY",
+    True)``).
+
+    :param path:
+        The path of the store file.
+
+    :param objects:
+        The :class:`HolidayBase` objects to store.
+
+    :param years:
+        The years to store, calculated first if needed. Defaults to the
+        years each object has calculated so far.
+
+    :raise:
+        ValueError if an object has no country or market code, or if two
+        objects have the same code, subdivision and observed setting.
+    """
+    if years is not None:
+        years = sorted(set(years))
+
+    calendars: List[List[Any]] = []
+    keys = set()
+    names: Dict[str, int] = {}
+    ordinals = array("i")
+    name_ids = array("I")
+    for obj in objects:
+        key = (_calendar_code(obj), _calendar_subdiv(obj), obj.observed)
+        if key in keys:
+            raise ValueError(f"Duplicate holidays calendar {key!r}.")
+        keys.add(key)
+
+        frozen = obj.freeze(years)
+        start = len(ordinals)
+        ordinals.extend(frozen._ordinals)
+        name_ids.extend(
+            names.setdefault(frozen._names[idx], len(names))
+            for idx in frozen._name_ids
+        )
+        calendars.append([*key, sorted(frozen.years), start, len(ordinals)])
+
+    blob = bytearray()
+    offsets = array("I")
+    for name in names:
+        offsets.append(len(blob))
+        blob += name.encode()
+    offsets.append(len(blob))
+
+    header = json.dumps(
+        {
+            "byteorder": sys.byteorder,
+            "calendars": calendars,
+            "entries": len(ordinals),
+            "names": len(names),
+        },
+        ensure_ascii=False,
+    ).encode()
+    header += b" " * (-len(header) % 4)
+    with open(path, "wb") as f:
+        f.write(_MAGIC + _LENGTH.pack(len(header)) + header)
+        f.write(ordinals.tobytes())
+        f.write(name_ids.tobytes())
+        f.write(offsets.tobytes())
+        f.write(blob)
+
+
+class _Names(Sequence[str]):
+    """The names of a store, decoded from the memory-mapped blob on
+    access."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob: Any, offsets: Any) -> None:
+        self._blob = blob
+        self._offsets = offsets
+
+    @overload
+    def __getitem__(self, idx: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[str]:
+        ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Any:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(len(self))[idx]]
+        if idx < 0:
+            idx += len(self)
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        return str(self._blob[start:end], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class HolidayStore:
+    """
+    A read-only, memory-mapped store of holiday calendars, as written by
+    :func:`write_store`.
+
+    The calendars are :class:`holidays.holiday_base.FrozenHolidays` objects
+    answering lookups, range and next/previous holiday queries directly from
+    the mapped pages, without copying the holidays to memory.
+
+    The store can be used as a context manager, which closes it on exit. Its
+    calendars can't be used once it is closed.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        :param path:
+            The path of the store file.
+
+        :raise:
+            ValueError if the file is not a valid store or was written on a
+            platform with a different byte order.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Every view of the mapped file, which must all be released before
+        # it can be closed.
+        self._views: List[memoryview] = []
+        self._calendars: Dict[_Key, FrozenHolidays] = {}
+        try:
+            self._load(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _load(self, path: Union[str, Path]) -> None:
+        """Read the header and map the calendars of the store."""
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Invalid holidays store file '{path}'.")
+        (length,) = _LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        start = len(_MAGIC) + _LENGTH.size
+        end = start + length
+        header = json.loads(self._mmap[start:end])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Incompatible holidays store file '{path}'.")
+
+        views = self._views
+        view = memoryview(self._mmap)
+        views.append(view)
+        count = header["entries"]
+        ordinals_offset = end
+        name_ids_offset = ordinals_offset + 4 * count
+        offsets_offset = name_ids_offset + 4 * count
+        blob_offset = offsets_offset + 4 * (header["names"] + 1)
+        views.append(view[ordinals_offset:name_ids_offset])
+        ordinals: Any = views[-1].cast("i")
+        views.append(view[name_ids_offset:offsets_offset])
+        name_ids: Any = views[-1].cast("I")
+        views.append(view[offsets_offset:blob_offset])
+        offsets = views[-1].cast("I")
+        views.append(view[blob_offset:])
+        names = _Names(views[-1], offsets)
+        views.extend((ordinals, name_ids, offsets))
+
+        for code, subdiv, observed, years, start, end in header["calendars"]:
+            columns = (ordinals[start:end], name_ids[start:end])
+            views.extend(columns)
+            self._calendars[
+                (code, subdiv, observed)
+            ] = FrozenHolidays._from_columns(*columns, names, years)
+
+    def close(self) -> None:
+        """Release the views of the store file and close it. Calling it more
+        than once has no effect."""
+        while self._views:
+            self._views.pop().release()
+        self._mmap.close()
+
+    def __enter__(self) -> "HolidayStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._calendars
+
+    def __iter__(self) -> Iterator[_Key]:
+        return iter(self._calendars)
+
+    def __len__(self) -> int:
+        return len(self._calendars)
+
+    def calendar(
+        self, code: str, subdiv: Optional[str] = None, observed: bool = True
+    ) -> FrozenHolidays:
+        """Return the holidays of a stored calendar.
+
+        :param code:
+            The country or market code (e.g. ``US`` or ``NYSE``).
+
+        :param subdiv:
+            The subdivision, as set on the stored object.
+
+        :param observed:
+            The :attr:`observed` setting of the stored object.
+
+        :raise:
+            KeyError if there is no such calendar in the store.
+        """
+        return self._calendars[(code, subdiv, observed)]
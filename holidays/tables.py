@@ -0,0 +1,264 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country and subdivision
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""
+Precomputed holiday tables.
+
+The holidays of a country (or financial market) for a range of years can be
+calculated ahead of time for each subdivision and :attr:`observed` setting,
+and stored in a binary table file shipped with the package. The
+:class:`holidays.holiday_base.HolidayBase` objects then copy the holidays of
+the years in range from the memory-mapped table instead of calculating them.
+
+The tables are generated at build time with::
+
+    python -m holidays.build_tables [--first-year 1950] [--last-year 2100]
+
+A table is only used with the version and the Python sources of the
+package it was generated by: editing any rule makes the tables stale.
+
+Table layout (native byte order, recorded in the header):
+
+* the magic bytes ``HOLTBL1\\n`` and the length of the JSON header as a
+  4-byte unsigned integer,
+* the JSON header, padded with spaces to a multiple of 4 bytes,
+* for each variant (i.e. subdivision and observed setting) listed in the
+  header and each year: the start and end positions of the year's holidays
+  in the entries below, as 4-byte unsigned integers,
+* the entries' date ordinals as 4-byte integers,
+* the entries' name indexes into the header's names as 2-byte unsigned
+  integers.
+
+Years with the same holidays in different variants share their entries.
+"""
+
+__all__ = ("HolidayTable", "find_table")
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+TABLES_DIR = Path(__file__).parent / "data"
+"""The directory of the tables shipped with the package."""
+
+_MAGIC = b"HOLTBL1\n"
+_LENGTH = struct.Struct("I")
+
+_Variant = Tuple[Optional[str], bool]
+
+
+class HolidayTable:
+    """
+    A read-only, memory-mapped table of the holidays of a country or
+    financial market.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        :param path:
+            The path of the table file.
+
+        :raise:
+            ValueError if the file is not a valid table.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Invalid holidays table file '{path}'.")
+        (length,) = _LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        start = len(_MAGIC) + _LENGTH.size
+        end = start + length
+        header = json.loads(self._mmap[start:end])
+
+        self.code: str = header["code"]
+        self.version: str = header["version"]
+        self.sources: str = header["sources"]
+        self.byteorder: str = header["byteorder"]
+        self.first_year: int = header["first_year"]
+        self.last_year: int = header["last_year"]
+        self._names: Tuple[str, ...] = tuple(
+            sys.intern(name) for name in header["names"]
+        )
+
+        n_years = self.last_year - self.first_year + 1
+        self._variants: Dict[_Variant, int] = {
+            (subdiv, observed): idx * 2 * n_years
+            for idx, (subdiv, observed) in enumerate(header["variants"])
+        }
+        view = memoryview(self._mmap)
+        count = header["entries"]
+        index_offset = end
+        ordinals_offset = index_offset + 8 * n_years * len(self._variants)
+        name_ids_offset = ordinals_offset + 4 * count
+        end = name_ids_offset + 2 * count
+        self._index: Any = view[index_offset:ordinals_offset].cast("I")
+        self._ordinals: Any = view[ordinals_offset:name_ids_offset].cast("i")
+        self._name_ids: Any = view[name_ids_offset:end].cast("H")
+
+    def __contains__(self, variant: object) -> bool:
+        return variant in self._variants
+
+    def year_holidays(
+        self, subdiv: Optional[str], observed: bool, year: int
+    ) -> Optional[Tuple[Tuple[date, str], ...]]:
+        """Return the ``(date, name)`` pairs calculated for a year, or None
+        if the year or the variant is not in the table.
+
+        :param subdiv:
+            The subdivision, as set on the :class:`HolidayBase` object.
+
+        :param observed:
+            The :attr:`observed` setting.
+
+        :param year:
+            The year.
+        """
+        base = self._variants.get((subdiv, observed))
+        if base is None or not self.first_year <= year <= self.last_year:
+            return None
+        idx = base + 2 * (year - self.first_year)
+        names, name_ids, ordinals = self._names, self._name_ids, self._ordinals
+        return tuple(
+            (date.fromordinal(ordinals[i]), names[name_ids[i]])
+            for i in range(self._index[idx], self._index[idx + 1])
+        )
+
+
+# The tables found for each class, and the tables loaded for each reference
+# (category and code), which the aliases of a country share.
+_tables: Dict[Any, Optional[HolidayTable]] = {}
+
+
+@lru_cache(maxsize=None)
+def _sources_hash() -> str:
+    """Return a hash of the package's Python sources, which the tables
+    calculated from them are only valid for."""
+    package_dir = Path(__file__).parent
+    sources = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        sources.update(path.relative_to(package_dir).as_posix().encode())
+        sources.update(b"\0")
+        sources.update(path.read_bytes())
+        sources.update(b"\0")
+    return sources.hexdigest()
+
+
+def find_table(cls: type) -> Optional[HolidayTable]:
+    """Return the table shipped for a :class:`HolidayBase` subclass, or None
+    if there is none.
+
+    Tables are only returned for the classes of the :mod:`holidays.countries`
+    and :mod:`holidays.financial` packages (aliases sharing the country's
+    table), not for subclasses defined elsewhere.
+    """
+    try:
+        return _tables[cls]
+    except KeyError:
+        pass
+
+    reference = _reference_class(cls)
+    if reference is None:
+        table = None
+    elif reference in _tables:
+        table = _tables[reference]
+    else:
+        table = _tables[reference] = _load_table(*reference)
+    _tables[cls] = table
+    return table
+
+
+def _load_table(category: str, code: str) -> Optional[HolidayTable]:
+    """Load the table of a country or market, or return None if there is
+    none or it was generated by other versions or sources of the package."""
+    path = TABLES_DIR / category / f"{code}.tbl"
+    if not path.exists():
+        return None
+
+    from holidays import __version__
+
+    try:
+        table = HolidayTable(path)
+    except (KeyError, OSError, ValueError):
+        return None
+    if (
+        table.version != __version__
+        or table.sources != _sources_hash()
+        or table.byteorder != sys.byteorder
+    ):
+        return None
+    return table
+
+
+# The attributes an alias class may define without changing the rules of
+# the class it is an alias of.
+_ALIAS_ATTRS = frozenset(
+    (
+        "__doc__",
+        "__init__",
+        "__module__",
+        "__orig_bases__",
+        "__parameters__",
+        "__qualname__",
+    )
+)
+
+
+def _rules_class(cls: type) -> type:
+    """Return the class defining the rules of a class: the class itself, or
+    the first base class that is not an alias."""
+    for base in cls.__mro__:
+        if not _ALIAS_ATTRS.issuperset(vars(base)):
+            return base
+    return cls
+
+
+def _reference_class(cls: type) -> Optional[Tuple[str, str]]:
+    """Return the package and code of the built-in class a class has the
+    same rules as, or None if there is no such class.
+
+    Every class the rules are inherited from must be defined in the
+    :mod:`holidays` package: a subclass defined elsewhere may override any
+    method, so it is never tabulated. Aliases (e.g. ``US``, ``USA`` and
+    ``UnitedStates``) have the same rules.
+    """
+    from holidays import countries, financial
+    from holidays.holiday_base import HolidayBase
+
+    if not issubclass(cls, HolidayBase) or cls is HolidayBase:
+        return None
+    for base in cls.__mro__[: cls.__mro__.index(HolidayBase)]:
+        if base.__module__.split(".")[0] != "holidays":
+            return None
+    if (
+        cls._year_cache_key  # type: ignore[attr-defined]
+        is not HolidayBase._year_cache_key
+    ):
+        return None
+
+    for category, module, attr in (
+        ("financial", financial, "market"),
+        ("countries", countries, "country"),
+    ):
+        code: Optional[str] = getattr(cls, attr, None)
+        if not code:
+            continue
+        reference = getattr(module, code, None)
+        if reference is not None and _rules_class(cls) is _rules_class(
+            reference
+        ):
+            return category, code
+    return None
@@ -719,3 +719,14 @@ class TestJapan(unittest.TestCase):
         for dt in hol_list:
             self.assertIn(date(*dt), self.holidays)
             self.assertNotIn(date(*dt), no_observed)
+
+    def test_month_granularity(self):
+        jp_holidays = holidays.Japan(granularity="month")
+        self.assertIn(date(2015, 5, 6), jp_holidays)
+        self.assertIn(2015, jp_holidays._pending_months)
+        self.assertIn(date(2015, 9, 22), jp_holidays)
+        self.assertNotIn(2015, jp_holidays._pending_months)
+        self.assertEqual(
+            jp_holidays.freeze(range(2000, 2031)),
+            holidays.Japan(years=range(2000, 2031)).freeze(),
+        )
@@ -371,3 +371,12 @@ class TestSouthKorea(unittest.TestCase):
         warnings.simplefilter("error")
         with self.assertRaises(Warning):
             holidays.Korea()
+
+    def test_out_of_lunar_calendar_range(self):
+        with self.assertWarns(Warning):
+            self.assertIsNone(self.holidays.get("2051-06-01"))
+        self.assertEqual(self.holidays[date(2051, 6, 6)], "Memorial Day")
+        self.assertEqual(
+            self.holidays[date(2051, 10, 3)], "National Foundation Day"
+        )
+        self.assertFalse(self.holidays.get_named("Chuseok"))
@@ -15,7 +15,7 @@ from datetime import date
 from itertools import product
 
 import holidays
-from holidays.utils import _islamic_to_gre
+from holidays.calendars.islamic import _islamic_to_gre
 
 
 class TestSpain(unittest.TestCase):
@@ -140,3 +140,9 @@ class TestVietnam(TestCase):
             Vietnam(observed=False),
             "2023-01-02",
         )
+
+    def test_out_of_lunar_calendar_range(self):
+        with self.assertWarns(Warning):
+            self.assertIn("2055-01-01", self.holidays)
+        self.assertHolidaysName("Independence Day", "2055-09-02")
+        self.assertNoHolidayName(self.holidays, "Vietnamese New Year")
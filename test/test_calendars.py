@@ -0,0 +1,224 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import warnings
+from datetime import date
+from datetime import timedelta as td
+from unittest import TestCase
+
+from convertdate import gregorian, hebrew
+from dateutil.relativedelta import MO, TU, WE, TH, FR, SA, SU
+from dateutil.relativedelta import relativedelta as rd
+from hijri_converter import convert
+
+from holidays.calendars.astronomy import _END_YEAR, _START_YEAR
+from holidays.calendars.astronomy import _EQUINOX_SOLSTICE_TIMES, _TARGETS
+from holidays.calendars.astronomy import _get_equinox_solstice_date
+from holidays.calendars.astronomy import _pymeeus_equinox_solstice
+from holidays.calendars.chinese import _ChineseLuniSolar
+from holidays.calendars.gregorian import _get_last_weekday_of_month
+from holidays.calendars.gregorian import _get_nth_weekday_from
+from holidays.calendars.gregorian import _get_nth_weekday_of_month
+from holidays.calendars.hebrew import NISAN, SIVAN, TISHRI, KISLEV, ADAR
+from holidays.calendars.hebrew import TEVETH, VEADAR, _hebrew_to_gre
+from holidays.calendars.islamic import _islamic_to_gre
+from holidays.calendars.korean import _korean_lunar_to_gre
+from holidays.constants import FEB, MAR, MAY, JUN, SEP, NOV, DEC, MON, THU, SUN
+
+
+class TestGregorianCalendar(TestCase):
+    def test_get_nth_weekday_from(self):
+        weekdays = (MO, TU, WE, TH, FR, SA, SU)
+        start = date(2023, 1, 1)
+        for offset in range(28):
+            dt = start + td(days=offset)
+            for weekday, rd_weekday in enumerate(weekdays):
+                for n in (-5, -2, -1, 1, 2, 5):
+                    self.assertEqual(
+                        _get_nth_weekday_from(n, weekday, dt),
+                        dt + rd(weekday=rd_weekday(n)),
+                    )
+
+    def test_get_nth_weekday_of_month(self):
+        self.assertEqual(
+            _get_nth_weekday_of_month(4, THU, NOV, 2023), date(2023, 11, 23)
+        )
+        self.assertEqual(
+            _get_nth_weekday_of_month(1, MON, MAY, 2023), date(2023, 5, 1)
+        )
+        self.assertEqual(
+            _get_nth_weekday_of_month(-2, SUN, FEB, 2024), date(2024, 2, 18)
+        )
+
+    def test_get_last_weekday_of_month(self):
+        self.assertEqual(
+            _get_last_weekday_of_month(MON, MAY, 2023), date(2023, 5, 29)
+        )
+        self.assertEqual(
+            _get_last_weekday_of_month(THU, FEB, 2024), date(2024, 2, 29)
+        )
+
+
+class TestIslamicCalendar(TestCase):
+    def test_islamic_to_gre(self):
+        # Eid al-Fitr falls twice in 2000.
+        self.assertEqual(
+            _islamic_to_gre(2000, 10, 1),
+            (date(2000, 1, 8), date(2000, 12, 27)),
+        )
+        self.assertEqual(_islamic_to_gre(2023, 12, 10), (date(2023, 6, 28),))
+        self.assertIs(
+            _islamic_to_gre(2023, 12, 10), _islamic_to_gre(2023, 12, 10)
+        )
+
+        for year in range(1930, 2070, 7):
+            for month, day in ((1, 1), (3, 12), (9, 29), (10, 1), (12, 10)):
+                for dt in _islamic_to_gre(year, month, day):
+                    hijri = convert.Gregorian.fromdate(dt).to_hijri()
+                    self.assertEqual(hijri.datetuple()[1:], (month, day))
+
+        # Out of range dates and missing days have no instances.
+        self.assertEqual(_islamic_to_gre(1900, 10, 1), ())
+        self.assertEqual(_islamic_to_gre(2100, 10, 1), ())
+        self.assertEqual(_islamic_to_gre(2023, 9, 30), ())
+
+
+class TestChineseLuniSolarCalendar(TestCase):
+    def setUp(self):
+        self.cnls = _ChineseLuniSolar()
+
+    def test_lunar_n_y_date(self):
+        self.assertEqual(self.cnls.lunar_n_y_date(1901), date(1901, 2, 19))
+        self.assertEqual(self.cnls.lunar_n_y_date(2010), date(2010, 2, 14))
+        self.assertEqual(self.cnls.lunar_n_y_date(2023), date(2023, 1, 22))
+        self.assertEqual(self.cnls.lunar_n_y_date(2099), date(2099, 1, 21))
+        for year in range(1901, 2099):
+            self.assertEqual(
+                self.cnls.lunar_n_y_date(year),
+                self.cnls.lunar_to_gre(year, 1, 1),
+            )
+
+    def test_lunar_to_gre(self):
+        # 2023 has a leap 2nd month.
+        self.assertEqual(self.cnls.lunar_to_gre(2023, 3, 1), date(2023, 4, 20))
+        self.assertEqual(
+            self.cnls.lunar_to_gre(2023, 3, 1, leap=False), date(2023, 3, 22)
+        )
+        self.assertEqual(
+            self.cnls.lunar_to_gre(2023, 8, 15), date(2023, 9, 29)
+        )
+
+    def test_estimated_dates(self):
+        self.assertEqual(self.cnls.vesak_date(2023), date(2023, 6, 2))
+        self.assertEqual(self.cnls.vesak_may_date(2023), date(2023, 5, 4))
+        self.assertEqual(self.cnls.s_diwali_date(2023), date(2023, 11, 11))
+        self.assertEqual(self.cnls.thaipusam_date(2023), date(2023, 2, 5))
+
+    def test_shared_engine(self):
+        # The calendar is calculated once: instances hold no state.
+        self.assertDictEqual(vars(self.cnls), {})
+
+
+class TestKoreanLunarCalendar(TestCase):
+    def test_korean_lunar_to_gre(self):
+        self.assertEqual(_korean_lunar_to_gre(2023, 1, 1), date(2023, 1, 22))
+        self.assertEqual(_korean_lunar_to_gre(2023, 8, 15), date(2023, 9, 29))
+        # 2020 has a leap 4th month.
+        self.assertEqual(_korean_lunar_to_gre(2020, 5, 1), date(2020, 6, 21))
+        # The first and last supported dates.
+        self.assertEqual(_korean_lunar_to_gre(1000, 1, 1), date(1000, 2, 13))
+        self.assertEqual(
+            _korean_lunar_to_gre(2050, 11, 18), date(2050, 12, 31)
+        )
+
+    def test_invalid_dates(self):
+        for args in (
+            (999, 12, 1),
+            (2050, 11, 19),
+            (2051, 1, 1),
+            (2023, 0, 1),
+            (2023, 13, 1),
+            (2023, 1, 0),
+            (2023, 1, 30),
+        ):
+            self.assertRaises(ValueError, _korean_lunar_to_gre, *args)
+
+
+class TestAstronomy(TestCase):
+    def test_get_equinox_solstice_date(self):
+        for target, utc_offset, dt in (
+            ("spring", 9, date(2023, MAR, 21)),
+            ("summer", -4, date(2023, JUN, 21)),
+            ("autumn", 9, date(2023, SEP, 23)),
+            ("winter", 0, date(2023, DEC, 22)),
+            # The equinox is at 21:24 UTC.
+            ("spring", 0, date(2023, MAR, 20)),
+        ):
+            self.assertEqual(
+                _get_equinox_solstice_date(2023, target, utc_offset), dt
+            )
+
+    def test_table(self):
+        self.assertEqual(
+            len(_EQUINOX_SOLSTICE_TIMES), _END_YEAR - _START_YEAR + 1
+        )
+        for year in range(_START_YEAR, _END_YEAR + 1, 37):
+            for target, instant in zip(
+                _TARGETS, _EQUINOX_SOLSTICE_TIMES[year - _START_YEAR]
+            ):
+                self.assertEqual(
+                    _pymeeus_equinox_solstice(year, target), instant
+                )
+
+    def test_out_of_table_years(self):
+        self.assertEqual(
+            _get_equinox_solstice_date(1899, "spring", 9), date(1899, MAR, 21)
+        )
+        self.assertEqual(
+            _get_equinox_solstice_date(2201, "summer", -4),
+            date(2201, JUN, 21),
+        )
+
+
+class TestHebrewCalendar(TestCase):
+    def test_hebrew_to_gre(self):
+        self.assertEqual(_hebrew_to_gre(2023, NISAN, 15), date(2023, 4, 6))
+        self.assertEqual(_hebrew_to_gre(2023, SIVAN, 6), date(2023, 5, 26))
+        self.assertEqual(_hebrew_to_gre(2023, TISHRI, 1), date(2023, 9, 16))
+        self.assertEqual(_hebrew_to_gre(2023, KISLEV, 25), date(2023, 12, 8))
+        self.assertEqual(_hebrew_to_gre(2023, ADAR, 14), date(2023, 3, 7))
+        # 5784 is a leap year.
+        self.assertEqual(_hebrew_to_gre(2024, VEADAR, 14), date(2024, 3, 24))
+        self.assertIs(
+            _hebrew_to_gre(2023, TISHRI, 1), _hebrew_to_gre(2023, TISHRI, 1)
+        )
+
+        # Teveth 15 fell in December 1899 and January 1901.
+        self.assertRaises(ValueError, _hebrew_to_gre, 1900, TEVETH, 15)
+
+        # convertdate warns about its own deprecated month_days.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            for year in range(1900, 2200, 7):
+                for month in range(NISAN, ADAR + 1):
+                    if month == TEVETH:
+                        continue
+                    for day in (1, 15, 29):
+                        self.assertEqual(
+                            _hebrew_to_gre(year, month, day),
+                            date(
+                                *gregorian.from_jd(
+                                    hebrew.to_jd_gregorianyear(
+                                        year, month, day
+                                    )
+                                )
+                            ),
+                        )
@@ -9,6 +9,7 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import copy
 import pathlib
 import pickle
 import unittest
@@ -19,7 +20,12 @@ from dateutil.relativedelta import MO
 from dateutil.relativedelta import relativedelta as rd
 
 import holidays
-from holidays.constants import JAN, FEB, MON, TUE, SAT, SUN
+from holidays.constants import JAN, FEB, MAR, DEC, MON, TUE, THU, SAT, SUN
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class TestBasics(unittest.TestCase):
@@ -108,6 +114,476 @@ class TestBasics(unittest.TestCase):
             lambda: self.holidays[date(2014, 1, 1) : date(2014, 1, 2) : 0],
         )
 
+    def test_getitem_slice_years(self):
+        self.assertEqual(len(self.holidays["1970-01-01":"2020-01-01"]), 539)
+        self.assertEqual(self.holidays.years, set(range(1970, 2021)))
+        self.assertListEqual(
+            self.holidays["2020-01-01":"1970-01-01"],
+            self.holidays["1970-01-02":"2020-01-02"][::-1],
+        )
+
+        start, stop = date(2010, 1, 1), date(2020, 1, 1)
+        for step in (1, 2, 5, 7, 30, 365):
+            expected = [
+                start + timedelta(days=offset)
+                for offset in range(0, (stop - start).days, step)
+                if start + timedelta(days=offset) in self.holidays
+            ]
+            self.assertListEqual(self.holidays[start:stop:step], expected)
+            self.assertListEqual(
+                self.holidays[stop:start:step],
+                [
+                    stop - timedelta(days=offset)
+                    for offset in range(0, (stop - start).days, step)
+                    if stop - timedelta(days=offset) in self.holidays
+                ],
+            )
+
+    def test_next_prev_holiday(self):
+        self.assertEqual(
+            self.holidays.next_holiday("2014-01-01"), date(2014, 1, 1)
+        )
+        self.assertEqual(
+            self.holidays.next_holiday("2014-01-02"), date(2014, 1, 20)
+        )
+        self.assertEqual(self.holidays.years, {2014})
+        self.assertEqual(
+            self.holidays.next_holiday("2014-12-26"), date(2015, 1, 1)
+        )
+        self.assertEqual(self.holidays.years, {2014, 2015})
+
+        self.assertEqual(
+            self.holidays.prev_holiday("2014-01-20"), date(2014, 1, 1)
+        )
+        self.assertEqual(
+            self.holidays.prev_holiday(date(2014, 1, 1)), date(2013, 12, 25)
+        )
+        self.assertEqual(self.holidays.years, {2013, 2014, 2015})
+
+        h = holidays.US(years=(2010, 2020), expand=False)
+        self.assertEqual(h.next_holiday("2012-06-01"), date(2020, 1, 1))
+        self.assertEqual(h.prev_holiday("2012-06-01"), date(2010, 12, 31))
+        self.assertIsNone(h.next_holiday("2021-01-01"))
+        self.assertIsNone(h.prev_holiday("2010-01-01"))
+        self.assertEqual(h.years, {2010, 2020})
+
+        h = holidays.HolidayBase()
+        self.assertIsNone(h.next_holiday(date.max))
+        self.assertIsNone(h.prev_holiday(date.min))
+        self.assertIsNone(h.next_holiday("2014-01-01"))
+
+    def test_holidays_between(self):
+        self.assertListEqual(
+            self.holidays.holidays_between("2013-12-25", "2014-01-20"),
+            [date(2013, 12, 25), date(2014, 1, 1), date(2014, 1, 20)],
+        )
+        self.assertListEqual(
+            self.holidays.holidays_between("2014-01-01", "2014-01-01"),
+            [date(2014, 1, 1)],
+        )
+        self.assertListEqual(
+            self.holidays.holidays_between("2014-01-20", "2014-01-01"), []
+        )
+        self.assertEqual(
+            len(self.holidays.holidays_between("1990-01-01", "2009-12-31")),
+            len(self.holidays["1990-01-01":"2010-01-01"]),
+        )
+        self.assertListEqual(
+            holidays.HolidayBase().holidays_between(date.min, date.max), []
+        )
+
+    def test_business_days(self):
+        self.assertTrue(self.holidays.is_business_day("2022-12-29"))
+        self.assertFalse(self.holidays.is_business_day("2022-12-25"))
+        self.assertFalse(self.holidays.is_business_day("2022-12-26"))
+        self.assertFalse(self.holidays.is_business_day("2022-12-31"))
+
+        for dt, days, expected in (
+            ("2022-12-22", 0, date(2022, 12, 22)),
+            ("2022-12-25", 0, date(2022, 12, 25)),
+            ("2022-12-22", 1, date(2022, 12, 23)),
+            ("2022-12-23", 1, date(2022, 12, 27)),
+            ("2022-12-30", 1, date(2023, 1, 3)),
+            ("2022-12-30", 252, date(2024, 1, 4)),
+            ("2023-01-03", -1, date(2022, 12, 30)),
+            ("2022-12-27", -1, date(2022, 12, 23)),
+            ("2024-01-04", -252, date(2022, 12, 30)),
+        ):
+            self.assertEqual(
+                self.holidays.add_business_days(dt, days), expected
+            )
+
+        for start, end, expected in (
+            ("2022-12-23", "2022-12-23", 0),
+            ("2022-12-23", "2022-12-27", 1),
+            ("2022-12-23", "2023-01-04", 6),
+            ("2023-01-04", "2022-12-23", -6),
+            ("2022-01-01", "2023-01-01", 250),
+            ("2000-01-01", "2023-01-01", 5769),
+        ):
+            self.assertEqual(
+                self.holidays.business_days_between(start, end), expected
+            )
+
+        self.assertEqual(self.holidays.roll("2022-12-29"), date(2022, 12, 29))
+        self.assertEqual(self.holidays.roll("2022-12-31"), date(2023, 1, 3))
+        self.assertEqual(
+            self.holidays.roll("2022-12-31", "preceding"), date(2022, 12, 30)
+        )
+        self.assertEqual(
+            self.holidays.roll("2022-12-31", "modified_following"),
+            date(2022, 12, 30),
+        )
+        self.assertEqual(
+            self.holidays.roll("2022-12-24", "modified_following"),
+            date(2022, 12, 27),
+        )
+        self.assertRaises(
+            ValueError, lambda: self.holidays.roll("2022-12-24", "nearest")
+        )
+
+        # Changes of holidays and weekend days are taken into account.
+        self.holidays[date(2022, 12, 29)] = "Fake Holiday"
+        self.assertFalse(self.holidays.is_business_day("2022-12-29"))
+        self.holidays.pop(date(2022, 12, 29))
+        self.assertTrue(self.holidays.is_business_day("2022-12-29"))
+        self.holidays.weekend = {THU}
+        self.assertFalse(self.holidays.is_business_day("2022-12-29"))
+        self.assertTrue(self.holidays.is_business_day("2022-12-31"))
+        self.holidays.weekend = set(range(7))
+        self.assertRaises(
+            ValueError, self.holidays.add_business_days, "2022-12-29", 1
+        )
+
+    def test_many(self):
+        dates = [date(2014, 1, 1), "2014-01-02", "07/04/2015", 1388552400]
+        self.assertListEqual(
+            self.holidays.contains_many(dates), [True, False, True, True]
+        )
+        self.assertEqual(self.holidays.years, {2014, 2015})
+        self.assertListEqual(
+            self.holidays.get_many(dates),
+            ["New Year's Day", None, "Independence Day", "New Year's Day"],
+        )
+        self.assertListEqual(
+            self.holidays.get_many(dates[:2], default=""),
+            ["New Year's Day", ""],
+        )
+        self.assertListEqual(
+            self.holidays.names_many(dates[:2]), [["New Year's Day"], []]
+        )
+        self.assertListEqual(self.holidays.contains_many([]), [])
+        self.assertRaises(
+            ValueError, lambda: self.holidays.contains_many(["abc"])
+        )
+
+        h = holidays.US(years=2014, expand=False, strict=True)
+        self.assertListEqual(
+            h.contains_many((date(2014, 1, 1), date(2015, 1, 1))),
+            [True, False],
+        )
+        self.assertEqual(h.years, {2014})
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_many_numpy(self):
+        dates = numpy.array(
+            ["2014-01-01", "2014-01-02", "NaT", "2015-07-04"],
+            dtype="datetime64[D]",
+        )
+        mask = self.holidays.contains_many(dates)
+        self.assertEqual(mask.dtype, bool)
+        self.assertListEqual(mask.tolist(), [True, False, False, True])
+        self.assertEqual(self.holidays.years, {2014, 2015})
+        self.assertListEqual(
+            self.holidays.get_many(dates, default="").tolist(),
+            ["New Year's Day", "", "", "Independence Day"],
+        )
+        self.assertListEqual(
+            self.holidays.names_many(dates).tolist(),
+            [["New Year's Day"], [], [], ["Independence Day"]],
+        )
+        self.assertListEqual(
+            self.holidays.contains_many(dates.reshape(2, 2)).tolist(),
+            [[True, False], [False, True]],
+        )
+        self.assertListEqual(
+            holidays.HolidayBase().contains_many(dates).tolist(),
+            [False] * 4,
+        )
+
+    def test_year_cache(self):
+        self.assertIsNone(holidays.HolidayBase.year_cache)
+        holidays.HolidayBase.year_cache = holidays.YearCache(maxsize=3)
+        self.addCleanup(setattr, holidays.HolidayBase, "year_cache", None)
+        holidays.HolidayBase.use_tables = False
+        self.addCleanup(setattr, holidays.HolidayBase, "use_tables", True)
+
+        cached = holidays.US(subdiv="CA", years=range(2020, 2022))
+        self.assertEqual(
+            holidays.HolidayBase.year_cache.info(),
+            holidays.CacheInfo(0, 2, 3, 2),
+        )
+        self.assertEqual(
+            holidays.US(subdiv="CA", years=range(2020, 2022)), cached
+        )
+        self.assertIn("2020-01-01", holidays.US(subdiv="CA"))
+        self.assertEqual(
+            holidays.HolidayBase.year_cache.info(),
+            holidays.CacheInfo(3, 2, 3, 2),
+        )
+        holidays.HolidayBase.year_cache = None
+        self.assertEqual(
+            holidays.US(subdiv="CA", years=range(2020, 2022)), cached
+        )
+
+        holidays.HolidayBase.year_cache = holidays.YearCache()
+        self.assertNotEqual(
+            holidays.US(years=2020, observed=False), holidays.US(years=2020)
+        )
+        self.assertNotEqual(
+            holidays.US(subdiv="CA", years=2020), holidays.US(years=2020)
+        )
+        self.assertNotEqual(
+            len(holidays.NO(years=2020)),
+            len(holidays.NO(years=2020, include_sundays=True)),
+        )
+        self.assertEqual(holidays.HolidayBase.year_cache.hits, 1)
+        holidays.US(years=2020, observed=False).observed = True
+        self.assertEqual(holidays.HolidayBase.year_cache.hits, 4)
+
+        # Sums depend on their operands and aren't cached.
+        h = holidays.US(years=2020) + holidays.CA(years=2020)
+        holidays.HolidayBase.year_cache = None
+        self.assertEqual(h, holidays.US(years=2020) + holidays.CA(years=2020))
+
+    def test_freeze(self):
+        frozen = self.holidays.freeze(range(1950, 2101))
+        self.assertIsInstance(frozen, holidays.FrozenHolidays)
+        self.assertEqual(frozen.years, frozenset(range(1950, 2101)))
+        self.assertEqual(self.holidays.years, set(range(1950, 2101)))
+        self.assertEqual(len(frozen), len(self.holidays))
+        self.assertDictEqual(dict(frozen.items()), dict(self.holidays))
+        self.assertListEqual(list(frozen), sorted(self.holidays))
+        self.assertFalse(hasattr(frozen, "__dict__"))
+
+        self.assertIn(date(2014, 1, 1), frozen)
+        self.assertIn("07/04/2015", frozen)
+        self.assertNotIn("2014-01-02", frozen)
+        self.assertNotIn("2101-01-01", frozen)
+        self.assertRaises(TypeError, lambda: [] in frozen)
+        self.assertEqual(frozen["2014-01-01"], "New Year's Day")
+        self.assertRaises(KeyError, lambda: frozen["2014-01-02"])
+        self.assertEqual(frozen.get(1388552400), "New Year's Day")
+        self.assertIsNone(frozen.get("2014-01-02"))
+        self.assertListEqual(frozen.get_list("2014-01-02"), [])
+        self.assertListEqual(
+            frozen.holidays_between("2013-12-25", "2014-01-20"),
+            [date(2013, 12, 25), date(2014, 1, 1), date(2014, 1, 20)],
+        )
+        self.assertEqual(frozen.next_holiday("2014-01-02"), date(2014, 1, 20))
+        self.assertEqual(frozen.prev_holiday("2014-01-01"), date(2013, 12, 25))
+        self.assertIsNone(frozen.next_holiday("2101-01-01"))
+        self.assertIsNone(frozen.prev_holiday("1950-01-01"))
+
+        # Later changes don't affect the snapshot.
+        self.holidays[date(2014, 1, 2)] = "Fake Holiday"
+        self.assertNotIn(date(2014, 1, 2), frozen)
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+        h = holidays.US(years=2014)
+        h[date(2014, 1, 1)] = "Fake Holiday"
+        self.assertListEqual(
+            h.freeze().get_list("2014-01-01"),
+            ["Fake Holiday", "New Year's Day"],
+        )
+        self.assertEqual(len(holidays.HolidayBase().freeze(2014)), 0)
+
+        # Snapshots are reused until the holidays change.
+        self.assertIs(h.freeze(), h.freeze(2014))
+        self.assertIsNot(h.freeze(), h.freeze(range(2014, 2016)))
+        frozen = h.freeze()
+        h.pop("2014-01-01")
+        self.assertNotIn("2014-01-01", h.freeze())
+        self.assertIn("2014-01-01", frozen)
+
+    def test_derive(self):
+        h = holidays.US(years=range(2014, 2016))
+        derived = h.derive()
+        self.assertIsInstance(derived, holidays.DerivedHolidays)
+        self.assertIs(derived._frozen, h.derive()._frozen)
+        self.assertEqual(derived.years, frozenset((2014, 2015)))
+        self.assertDictEqual(dict(derived), dict(h))
+        self.assertFalse(hasattr(derived, "__dict__"))
+
+        derived.update({"2014-01-02": "Fake Holiday"})
+        derived.append("2014-01-01")
+        self.assertListEqual(
+            derived.pop_named("Independence"),
+            [date(2014, 7, 4), date(2015, 7, 3), date(2015, 7, 4)],
+        )
+        self.assertRaises(KeyError, lambda: derived.pop_named("Independence"))
+        del derived["2014-12-25"]
+        self.assertRaises(KeyError, lambda: derived.pop("2014-12-25"))
+        self.assertEqual(derived.pop("2014-12-25", "No Holiday"), "No Holiday")
+        derived["2015-12-25"] = "Fake Holiday"
+
+        self.assertEqual(len(derived), len(h) - 3)
+        self.assertListEqual(list(derived), sorted(derived))
+        self.assertRaises(TypeError, lambda: [] in derived)
+        self.assertEqual(derived["2014-01-02"], "Fake Holiday")
+        self.assertRaises(KeyError, lambda: derived["2014-07-04"])
+        self.assertIsNone(derived.get("2014-07-04"))
+        self.assertListEqual(
+            derived.get_list("2014-01-01"), ["Holiday", "New Year's Day"]
+        )
+        self.assertListEqual(
+            derived.get_list("2015-12-25"), ["Christmas Day", "Fake Holiday"]
+        )
+        self.assertListEqual(
+            derived.get_named("fake"), [date(2014, 1, 2), date(2015, 12, 25)]
+        )
+        self.assertListEqual(
+            derived.holidays_between("2014-12-24", "2015-01-02"),
+            [date(2015, 1, 1)],
+        )
+        self.assertEqual(derived.next_holiday("2014-12-24"), date(2015, 1, 1))
+        self.assertEqual(derived.next_holiday("2014-01-02"), date(2014, 1, 2))
+        self.assertEqual(
+            derived.prev_holiday("2015-01-01"), date(2014, 11, 27)
+        )
+        self.assertEqual(derived.prev_holiday("2014-01-03"), date(2014, 1, 2))
+        self.assertIsNone(derived.next_holiday("2016-01-01"))
+
+        # The holidays derived from are left untouched, and the other way
+        # round.
+        self.assertEqual(h, holidays.US(years=range(2014, 2016)))
+        h[date(2014, 1, 3)] = "Other Holiday"
+        self.assertNotIn("2014-01-03", derived)
+
+        self.assertEqual(derived.derive(), derived)
+        self.assertEqual(pickle.loads(pickle.dumps(derived)), derived)
+        other = derived.derive()
+        other.pop("2014-01-02")
+        self.assertIn("2014-01-02", derived)
+
+    def test_populate_range(self):
+        h = holidays.US()
+        h.populate_range(2019, 2021)
+        self.assertEqual(h.years, {2019, 2020, 2021})
+        self.assertEqual(h, holidays.US(years=range(2019, 2022)))
+
+        ranges = []
+
+        class RangeUS(holidays.US):
+            def populate_range(self, start, end):
+                ranges.append((start, end))
+                super().populate_range(start, end)
+
+        h = RangeUS(years=(2010, 2012, 2011, 2020, 2015, 2014))
+        self.assertListEqual(
+            ranges, [(2010, 2012), (2014, 2015), (2020, 2020)]
+        )
+        self.assertEqual(
+            h, holidays.US(years=(2010, 2011, 2012, 2014, 2015, 2020))
+        )
+
+        del ranges[:]
+        h.freeze(range(2010, 2018))
+        h.holidays_between("2021-06-01", "2024-06-01")
+        self.assertListEqual(
+            ranges, [(2013, 2013), (2016, 2017), (2022, 2023)]
+        )
+
+        # Years already calculated are left untouched.
+        h[date(2021, 1, 2)] = "Fake Holiday"
+        h.populate_range(2020, 2025)
+        self.assertEqual(h[date(2021, 1, 2)], "Fake Holiday")
+        self.assertIn(2025, h.years)
+
+    def test_granularity(self):
+        calls = []
+
+        class MonthUS(holidays.US):
+            month_holidays = {"_populate_fake": (MAR, DEC)}
+
+            def _populate_fake(self, year):
+                calls.append(year)
+                self[date(year, MAR, 3)] = "Fake Holiday"
+                self[date(year, DEC, 3)] = "Fake Holiday"
+
+        self.assertRaises(ValueError, lambda: MonthUS(granularity="day"))
+
+        h = MonthUS(years=2020)
+        self.assertListEqual(calls, [2020])
+        self.assertIn(date(2020, 3, 3), h)
+
+        del calls[:]
+        h = MonthUS(granularity="month")
+        self.assertIn(date(2020, 1, 1), h)
+        self.assertNotIn(date(2020, 3, 3), dict(h))
+        self.assertListEqual(calls, [])
+        self.assertIn(date(2020, 3, 3), h)
+        self.assertIn(date(2020, 12, 3), dict(h))
+        self.assertIn("2021-12-03", h)
+        self.assertListEqual(calls, [2020, 2021])
+
+        h = MonthUS(granularity="month", years=range(2020, 2023))
+        self.assertListEqual(
+            h.holidays_between("2020-11-25", "2020-12-05"),
+            [date(2020, 11, 26), date(2020, 12, 3)],
+        )
+        self.assertEqual(h.next_holiday("2021-02-20"), date(2021, 3, 3))
+        self.assertEqual(h.freeze(), MonthUS(years=range(2020, 2023)).freeze())
+        self.assertListEqual(
+            calls, [2020, 2021, 2020, 2021, 2022, 2020, 2021, 2022]
+        )
+
+        h = MonthUS(granularity="month", years=2020)
+        h.observed = False
+        self.assertIn(date(2020, 3, 3), dict(h))
+        h = copy.deepcopy(MonthUS(granularity="month", years=2020))
+        self.assertIn("2020-03-03", h)
+
+        h = MonthUS(granularity="month", strict=True)
+        self.assertIn(date(2020, 3, 3), h)
+        self.assertIn(date(2020, 12, 3), dict(h))
+
+        h = MonthUS(granularity="month", years=2020)
+        h_copy = copy.copy(h)
+        self.assertIn(date(2020, 3, 3), h_copy)
+        self.assertIn(date(2020, 3, 3), h)
+
+        self.assertIn(
+            date(2020, 3, 20), holidays.JP(strict=True, granularity="month")
+        )
+
+    def test_dates_index(self):
+        h = holidays.US(years=2014)
+        h[date(2014, 1, 3)] = "Fake Holiday"
+        h[date(2014, 1, 3)] = "Another Fake Holiday"
+        self.assertListEqual(
+            h["2014-01-01":"2014-01-05"], [date(2014, 1, 1), date(2014, 1, 3)]
+        )
+        del h[date(2014, 1, 3)]
+        self.assertEqual(h.pop(date(2014, 1, 1)), "New Year's Day")
+        self.assertListEqual(h["2014-01-01":"2014-01-05"], [])
+
+        h.setdefault(date(2014, 1, 2), "Fake Holiday")
+        self.assertListEqual(h["2014-01-01":"2014-01-05"], [date(2014, 1, 2)])
+
+        h = holidays.HolidayBase()
+        h[date(2014, 1, 1)] = "Fake Holiday"
+        h.popitem()
+        self.assertListEqual(h["2014-01-01":"2014-01-05"], [])
+
+        h = holidays.US(years=2014)
+        for h_copy in (pickle.loads(pickle.dumps(h)), copy.copy(h)):
+            h_copy.pop(date(2014, 1, 1))
+            self.assertEqual(len(h_copy["2014-01-01":"2014-12-31"]), 9)
+            self.assertEqual(len(h["2014-01-01":"2014-12-31"]), 10)
+        h.clear()
+        self.assertListEqual(h["2014-01-01":"2014-12-31"], [])
+
     def test_get(self):
         self.assertEqual(self.holidays.get("2014-01-01"), "New Year's Day")
         self.assertIsNone(self.holidays.get("2014-01-02"))
@@ -131,6 +607,13 @@ class TestBasics(unittest.TestCase):
             KeyError, lambda: self.holidays.pop_named("New Year's Dayz")
         )
 
+        self.assertListEqual(
+            self.holidays.pop_named("Christmas Day", "exact", years=2014),
+            [date(2014, 12, 25)],
+        )
+        self.assertNotIn(date(2014, 12, 25), self.holidays)
+        self.assertIn(date(2015, 12, 25), self.holidays)
+
     def test_setitem(self):
         self.holidays = holidays.US(years=[2014])
         self.assertEqual(len(self.holidays), 10)
@@ -143,8 +626,8 @@ class TestBasics(unittest.TestCase):
         self.holidays = holidays.US()
         self.assertEqual(
             str(self.holidays),
-            "{'observed': True, 'expand': True, 'subdiv': None, "
-            "'years': set()}",
+            "{'observed': True, 'expand': True, 'strict': False, "
+            "'granularity': 'year', 'subdiv': None, 'years': set()}",
         )
 
         self.holidays = holidays.US(years=1900)
@@ -310,6 +793,33 @@ class TestBasics(unittest.TestCase):
         self.assertEqual(len(ecb) + len(nyse), len(ecb_nyse))
         self.assertEqual(ecb_nyse.market, ["ECB", "NYSE"])
 
+    def test_add_merges_new_years_only(self):
+        us = holidays.US(years=2020)
+        us[date(2021, 1, 2)] = "Fake Holiday"
+        mx = holidays.MX()
+        na = us + mx
+        self.assertIn("2021-01-02", na)
+        self.assertEqual(mx.years, na.years)
+
+        # Each year is calculated once per operand, and names shared by
+        # several operands are not repeated.
+        na = holidays.MX() + holidays.MX(subdiv=None)
+        self.assertEqual(
+            na.get("2007-02-05"),
+            "Día de la Constitución [Constitution Day], "
+            "Día de la Constitución [Constitution Day] (Observed)",
+        )
+        jp_cn = holidays.JP() + holidays.CN()
+        jp_cn.populate_range(1990, 1992)
+        self.assertNotIn(date(1990, 2, 13), jp_cn)
+        self.assertEqual(
+            dict(jp_cn),
+            dict(
+                holidays.JP(years=range(1990, 1993))
+                + holidays.CN(years=range(1990, 1993))
+            ),
+        )
+
     def test_get_list(self):
         westland = holidays.NZ(subdiv="WTL")
         chathams = holidays.NZ(subdiv="CIT")
@@ -338,6 +848,25 @@ class TestBasics(unittest.TestCase):
         self.assertEqual(
             chathams.get_list(date(1969, 1, 1)), ["New Year's Day"]
         )
+
+        h = holidays.HolidayBase()
+        h[date(2020, 1, 1)] = "B, C"
+        h[date(2020, 1, 1)] = "C, A"
+        h[date(2020, 1, 1)] = "B"
+        self.assertEqual(h[date(2020, 1, 1)], "A, B, C")
+        self.assertListEqual(h.get_list(date(2020, 1, 1)), ["A", "B", "C"])
+        h[date(2020, 1, 1)] = "D"
+        self.assertListEqual(
+            h.get_list(date(2020, 1, 1)), ["A", "B", "C", "D"]
+        )
+        del h[date(2020, 1, 1)]
+        self.assertListEqual(h.get_list(date(2020, 1, 1)), [])
+        self.assertDictEqual(h._split_by_date, {})
+        # The names are interned and shared between objects.
+        self.assertIs(
+            westland.get_list(date(1969, 1, 1))[0],
+            chathams.get_list(date(1969, 1, 1))[0],
+        )
         ca = holidays.CA()
         us = holidays.US()
         mx = holidays.MX()
@@ -439,6 +968,47 @@ class TestBasics(unittest.TestCase):
         us.get_named("Thanksgiving")
         self.assertEqual([2022], list(us.years))
 
+        us = holidays.US(years=range(2019, 2021))
+        self.assertListEqual(
+            us.get_named("independence"),
+            [date(2019, 7, 4), date(2020, 7, 3), date(2020, 7, 4)],
+        )
+        self.assertListEqual(
+            us.get_named("Independence Day", "exact"),
+            [date(2019, 7, 4), date(2020, 7, 4)],
+        )
+        self.assertListEqual(us.get_named("independence day", "exact"), [])
+        self.assertListEqual(
+            us.get_named("independence day", "iexact", years=2020),
+            [date(2020, 7, 4)],
+        )
+        self.assertListEqual(
+            us.get_named("Christmas", "startswith", years=[2020, 2019]),
+            [date(2019, 12, 25), date(2020, 12, 25)],
+        )
+        self.assertListEqual(us.get_named("day", "startswith"), [])
+        self.assertRaises(ValueError, lambda: us.get_named("day", "regex"))
+
+        # Years are calculated when asked for.
+        self.assertListEqual(
+            us.get_named("Thanksgiving", years=range(2021, 2023)),
+            [date(2021, 11, 25), date(2022, 11, 24)],
+        )
+        self.assertEqual(us.years, set(range(2019, 2023)))
+
+        # Each name of a date is matched on its own, and the index follows
+        # changes.
+        us[date(2020, 7, 4)] = "Fake Holiday"
+        self.assertListEqual(
+            us.get_named("Fake Holiday", "exact"), [date(2020, 7, 4)]
+        )
+        self.assertListEqual(
+            us.get_named("Independence Day", "exact", years=2020),
+            [date(2020, 7, 4)],
+        )
+        us.pop("2020-07-04")
+        self.assertListEqual(us.get_named("Fake Holiday", "exact"), [])
+
 
 class TestArgs(unittest.TestCase):
     def setUp(self):
@@ -525,6 +1095,62 @@ class TestArgs(unittest.TestCase):
         self.holidays.observed = True
         self.assertIn(date(2018, 7, 2), self.holidays)
 
+        # Entries added by the user survive toggling, whatever their names.
+        self.holidays = holidays.US(years=range(2010, 2013))
+        self.holidays[date(2011, 12, 30)] = "Observed Fake Holiday"
+        self.holidays[date(2012, 1, 2)] = "Fake Holiday"
+        expected = dict(self.holidays)
+        self.holidays.observed = False
+        self.assertEqual(
+            self.holidays[date(2011, 12, 30)], "Observed Fake Holiday"
+        )
+        self.assertEqual(self.holidays[date(2012, 1, 2)], "Fake Holiday")
+        self.assertNotIn(date(2010, 12, 31), self.holidays)
+        self.assertListEqual(
+            self.holidays["2010-12-01":"2011-01-01"], [date(2010, 12, 25)]
+        )
+        self.holidays.observed = True
+        self.assertDictEqual(dict(self.holidays), expected)
+        self.holidays.observed = True
+        self.assertDictEqual(dict(self.holidays), expected)
+
+    def test_strict(self):
+        self.holidays = holidays.US(strict=True)
+        self.assertTrue(self.holidays.strict)
+        self.assertIn(date(2014, 1, 1), self.holidays)
+        self.assertNotIn(date(2014, 1, 2), self.holidays)
+        self.assertEqual(self.holidays.years, {2014})
+        self.assertEqual(self.holidays[date(2014, 1, 1)], "New Year's Day")
+        self.assertEqual(
+            self.holidays.get(date(2015, 7, 4)), "Independence Day"
+        )
+        self.assertEqual(self.holidays.years, {2014, 2015})
+        for key in (
+            datetime(2014, 1, 1),
+            "2014-01-01",
+            1388552400,
+            1388552400.01,
+            None,
+        ):
+            self.assertRaises(TypeError, lambda: key in self.holidays)
+            self.assertRaises(TypeError, lambda: self.holidays[key])
+            self.assertRaises(TypeError, self.holidays.get, key)
+            self.assertRaises(
+                TypeError, self.holidays.__setitem__, key, "Holiday"
+            )
+            self.assertRaises(
+                TypeError, self.holidays.contains_many, [date(2014, 1, 1), key]
+            )
+
+        self.holidays = holidays.US(years=2014, expand=False, strict=True)
+        self.assertNotIn(date(2015, 1, 1), self.holidays)
+        self.assertEqual(self.holidays.years, {2014})
+
+        self.assertTrue(
+            (holidays.US(strict=True) + holidays.CA(strict=True)).strict
+        )
+        self.assertFalse((holidays.US(strict=True) + holidays.CA()).strict)
+
     def test_serialization(self):
         dt = datetime(2020, 1, 1)
         self.assertIn(dt, self.holidays)
@@ -598,6 +1224,43 @@ class TestKeyTransforms(unittest.TestCase):
         )
         self.assertRaises((TypeError, ValueError), lambda: {} in self.holidays)
 
+    def test_parse_cache(self):
+        self.holidays.parse_cache = holidays.DateParseCache(maxsize=2)
+
+        # ISO 8601 strings bypass the cache.
+        self.assertIn("2014-01-01", self.holidays)
+        self.assertEqual(
+            self.holidays.parse_cache.info(), holidays.CacheInfo(0, 0, 2, 0)
+        )
+
+        self.assertIn("01/01/2014", self.holidays)
+        self.assertIn("01/01/2014", self.holidays)
+        self.assertNotIn("01/02/2014", self.holidays)
+        self.assertNotIn("01/03/2014", self.holidays)
+        self.assertIn("01/01/2014", self.holidays)
+        self.assertEqual(
+            self.holidays.parse_cache.info(), holidays.CacheInfo(1, 4, 2, 2)
+        )
+
+        # Invalid dates are not cached.
+        self.assertRaises(ValueError, lambda: "2014-13-01" in self.holidays)
+        self.assertRaises(ValueError, lambda: "abc" in self.holidays)
+        self.assertEqual(len(self.holidays.parse_cache), 2)
+
+        self.holidays.parse_cache.clear()
+        self.assertEqual(
+            self.holidays.parse_cache.info(), holidays.CacheInfo(0, 0, 2, 0)
+        )
+
+        self.holidays.parse_cache = holidays.DateParseCache(maxsize=0)
+        self.assertIn("01/01/2014", self.holidays)
+        self.assertEqual(len(self.holidays.parse_cache), 0)
+
+        self.assertRaises(ValueError, holidays.DateParseCache, -1)
+        self.assertIsInstance(
+            holidays.HolidayBase.parse_cache, holidays.DateParseCache
+        )
+
 
 class TestCountryHolidayDeprecation(unittest.TestCase):
     def test_deprecation(self):
@@ -624,6 +1287,11 @@ class TestCountryHolidays(unittest.TestCase):
         h = holidays.country_holidays("US", years=[2015, 2016])
         self.assertEqual(h.years, {2015, 2016})
 
+    def test_country_strict(self):
+        h = holidays.country_holidays("US", strict=True)
+        self.assertTrue(h.strict)
+        self.assertRaises(TypeError, lambda: "2014-01-01" in h)
+
     def test_country_state(self):
         h = holidays.country_holidays("US", subdiv="NY")
         self.assertEqual(h.subdiv, "NY")
@@ -656,6 +1324,11 @@ class TestFinancialHolidays(unittest.TestCase):
         h = holidays.financial_holidays("NYSE", years=2021)
         self.assertEqual(h.years, {2021})
 
+    def test_market_strict(self):
+        h = holidays.financial_holidays("NYSE", strict=True)
+        self.assertTrue(h.strict)
+        self.assertRaises(TypeError, lambda: "2014-01-01" in h)
+
     def test_market_years(self):
         h = holidays.financial_holidays("NYSE", years=[2015, 2016])
         self.assertEqual(h.years, {2015, 2016})
@@ -749,3 +1422,44 @@ class TestCountrySpecialHolidays(unittest.TestCase):
         self.assertIn("1111-01-01", self.holidays)
         self.assertIn("2222-02-02", self.holidays)
         self.assertEqual(13, len(self.holidays))
+
+
+class TestFixedHolidays(unittest.TestCase):
+    def test_fixed_holidays(self):
+        class Custom(holidays.HolidayBase):
+            subdivisions = ["A", "B"]
+            fixed_holidays = (
+                holidays.FixedHoliday(JAN, 1, "New Year"),
+                holidays.FixedHoliday(FEB, 2, "Old Holiday", end_year=2000),
+                holidays.FixedHoliday(MAR, 3, "New Holiday", 2010, 2020),
+                holidays.FixedHoliday(DEC, 4, "Local Holiday", subdivs={"A"}),
+            )
+
+        hol = Custom(years=(2000, 2015, 2021))
+        self.assertEqual(
+            sorted(hol),
+            [
+                date(2000, 1, 1),
+                date(2000, 2, 2),
+                date(2015, 1, 1),
+                date(2015, 3, 3),
+                date(2021, 1, 1),
+            ],
+        )
+        self.assertEqual(hol["2015-03-03"], "New Holiday")
+        self.assertIn("2021-12-04", Custom(subdiv="A"))
+        self.assertNotIn("2021-12-04", Custom(subdiv="B"))
+        self.assertIs(
+            Custom(subdiv="A")._fixed_rules(),
+            Custom(subdiv="A")._fixed_rules(),
+        )
+
+        self.assertIn("2021-01-01", Custom())
+        Custom.fixed_holidays = (holidays.FixedHoliday(JAN, 2, "Day After"),)
+        self.assertNotIn("2021-01-01", Custom())
+        self.assertIn("2021-01-02", Custom())
+
+        hol = Custom()
+        hol.fixed_holidays = ()
+        self.assertNotIn("2021-01-02", hol)
+        self.assertIn("2021-01-02", Custom())
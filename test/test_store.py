@@ -0,0 +1,114 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import pickle
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import holidays
+from holidays.store import HolidayStore, write_store
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "holidays.store"
+
+    def test_store(self):
+        years = range(2000, 2031)
+        objects = (
+            holidays.US(years=years),
+            holidays.US(subdiv="CA", years=years),
+            holidays.US(observed=False, years=years),
+            holidays.NYSE(years=years),
+            holidays.CA(years=2020) + holidays.MX(years=2020),
+        )
+        write_store(self.path, objects)
+        store = HolidayStore(self.path)
+        self.assertEqual(len(store), 5)
+        self.assertListEqual(
+            list(store),
+            [
+                ("US", None, True),
+                ("US", "CA", True),
+                ("US", None, False),
+                ("NYSE", None, True),
+                ("CA+MX", "ON", True),
+            ],
+        )
+        self.assertIn(("US", "CA", True), store)
+        self.assertNotIn(("US", "NY", True), store)
+        self.assertRaises(KeyError, store.calendar, "US", "NY")
+
+        for obj, key in zip(objects, store):
+            calendar = store.calendar(*key)
+            self.assertDictEqual(dict(calendar), dict(obj))
+            self.assertEqual(calendar.years, obj.years)
+
+        us_ca = store.calendar("US", "CA")
+        self.assertIsInstance(us_ca._ordinals, memoryview)
+        self.assertEqual(us_ca.get("2020-03-31"), "César Chávez Day")
+        self.assertIsNone(us_ca.get("2020-04-01"))
+        self.assertEqual(us_ca.next_holiday("2020-07-05"), date(2020, 9, 7))
+        self.assertEqual(us_ca.prev_holiday("2020-07-04"), date(2020, 7, 3))
+        self.assertListEqual(
+            us_ca.holidays_between("2020-11-01", "2020-11-30"),
+            [date(2020, 11, 11), date(2020, 11, 26), date(2020, 11, 27)],
+        )
+        self.assertEqual(
+            store.calendar("US", observed=False).get("2020-07-04"),
+            "Independence Day",
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(us_ca)), us_ca)
+
+    def test_write_store_years(self):
+        write_store(self.path, [holidays.US()], years=range(2020, 2022))
+        calendar = HolidayStore(self.path).calendar("US")
+        self.assertEqual(calendar.years, {2020, 2021})
+        self.assertIn("2021-12-24", calendar)
+        self.assertNotIn("2022-01-01", calendar)
+
+    def test_holiday_sum_subdivs(self):
+        obj = holidays.US(subdiv="CA", years=2020) + holidays.US(
+            subdiv="NY", years=2020
+        )
+        write_store(self.path, [obj])
+        with HolidayStore(self.path) as store:
+            self.assertListEqual(list(store), [("US", "CA+NY", True)])
+            calendar = store.calendar("US", "CA+NY")
+            self.assertDictEqual(dict(calendar), dict(obj))
+            self.assertEqual(calendar.get("2020-02-12"), "Lincoln's Birthday")
+
+    def test_close(self):
+        write_store(self.path, [holidays.US(years=2020)])
+        with HolidayStore(self.path) as store:
+            calendar = store.calendar("US")
+            self.assertIn("2020-01-01", calendar)
+        self.assertTrue(store._mmap.closed)
+        self.assertRaises(ValueError, lambda: "2020-01-01" in calendar)
+        store.close()
+
+    def test_invalid_store(self):
+        self.assertRaises(
+            ValueError,
+            write_store,
+            self.path,
+            [holidays.US(), holidays.US(years=2020)],
+        )
+        self.assertRaises(
+            ValueError, write_store, self.path, [holidays.HolidayBase()]
+        )
+
+        self.path.write_bytes(b"Not a store")
+        self.assertRaises(ValueError, HolidayStore, self.path)
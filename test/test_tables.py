@@ -0,0 +1,151 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import holidays
+from holidays import tables
+from holidays.build_tables import build_table, write_tables
+
+
+class TestTables(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        tables_dir = tables.TABLES_DIR
+        tables.TABLES_DIR = self.directory
+        tables._tables.clear()
+        self.addCleanup(setattr, tables, "TABLES_DIR", tables_dir)
+        self.addCleanup(tables._tables.clear)
+
+    def test_write_tables(self):
+        written = write_tables(("US", "CA", "IN", "NYSE"), 2000, 2040)
+        self.assertListEqual(
+            written,
+            [
+                (self.directory / "countries" / "US.tbl", 2000, 2040),
+                (self.directory / "countries" / "CA.tbl", 2000, 2040),
+                # Estimated holidays warn out of 2001-2030.
+                (self.directory / "countries" / "IN.tbl", 2001, 2030),
+                (self.directory / "financial" / "NYSE.tbl", 2000, 2040),
+            ],
+        )
+        self.assertIsNotNone(tables.find_table(holidays.US))
+        # Aliases share the country's table.
+        self.assertIsNotNone(tables.find_table(holidays.UnitedStates))
+        self.assertIs(
+            tables.find_table(holidays.UnitedStates),
+            tables.find_table(holidays.US),
+        )
+        self.assertIs(
+            tables.find_table(holidays.USA), tables.find_table(holidays.US)
+        )
+        self.assertIsNone(tables.find_table(holidays.GB))
+
+        for cls, kwargs in (
+            (holidays.US, {}),
+            (holidays.US, {"observed": False}),
+            (holidays.US, {"subdiv": "PR"}),
+            (holidays.CA, {}),
+            (holidays.CA, {"subdiv": "QC", "observed": False}),
+            (holidays.NYSE, {}),
+        ):
+            tabulated = cls(years=range(1990, 2051), **kwargs)
+            holidays.HolidayBase.use_tables = False
+            try:
+                calculated = cls(years=range(1990, 2051), **kwargs)
+            finally:
+                holidays.HolidayBase.use_tables = True
+            self.assertEqual(tabulated, calculated)
+
+        with self.assertWarns(Warning):
+            holidays.IN(years=2031)
+
+    def test_table_lookup(self):
+        write_tables(("US",), 2000, 2040)
+        table = tables.find_table(holidays.US)
+        self.assertEqual(table.code, "US")
+        self.assertEqual((table.first_year, table.last_year), (2000, 2040))
+        self.assertIn(("PR", True), table)
+        self.assertNotIn(("XX", True), table)
+        self.assertEqual(
+            table.year_holidays("PR", True, 2020)[:2],
+            (
+                (date(2020, 1, 1), "New Year's Day"),
+                (date(2020, 1, 6), "Epiphany"),
+            ),
+        )
+        self.assertIsNone(table.year_holidays(None, True, 1999))
+        self.assertIsNone(table.year_holidays("XX", True, 2020))
+
+        # Rules changed in a subclass, or weekend days changed for an
+        # object, are not tabulated.
+        class CustomUS(holidays.US):
+            def _populate(self, year):
+                super()._populate(year)
+                self[date(year, 1, 2)] = "Custom Holiday"
+
+        self.assertIsNone(tables.find_table(CustomUS))
+        self.assertIn("2020-01-02", CustomUS())
+
+        class FixedUS(holidays.US):
+            fixed_holidays = (holidays.FixedHoliday(1, 2, "Custom Holiday"),)
+
+        self.assertIsNone(tables.find_table(FixedUS))
+        self.assertIn("2020-01-02", FixedUS())
+
+        # Helpers of subclasses defined out of the package may be
+        # overridden too.
+        class NoObservedUS(holidays.US):
+            def _add_with_observed(self, dt, name, before=True, after=True):
+                self[dt] = name
+
+        self.assertIsNone(tables.find_table(NoObservedUS))
+        # Christmas Day 2021 is a Saturday.
+        self.assertIn("2021-12-24", holidays.US())
+        self.assertNotIn("2021-12-24", NoObservedUS())
+
+        class PlainUS(holidays.US):
+            pass
+
+        self.assertIsNone(tables.find_table(PlainUS))
+
+        us_holidays = holidays.US()
+        us_holidays.weekend = set()
+        self.assertIsNone(us_holidays._table_holidays(2020, True))
+
+    def test_invalid_tables(self):
+        path = self.directory / "countries" / "US.tbl"
+        path.parent.mkdir()
+        path.write_bytes(b"Not a table")
+        self.assertIsNone(tables.find_table(holidays.US))
+        self.assertIn("2020-01-01", holidays.US())
+
+        table, _, _ = build_table(holidays.US, 2000, 2040)
+        path.write_bytes(table.replace(b'"version": "', b'"version": "0'))
+        tables._tables.clear()
+        self.assertIsNone(tables.find_table(holidays.US))
+
+        # Tables built from other sources (e.g. before a rule was edited)
+        # are stale.
+        path.write_bytes(table.replace(b'"sources": "', b'"sources": "0'))
+        tables._tables.clear()
+        self.assertIsNone(tables.find_table(holidays.US))
+        path.write_bytes(table)
+        tables._tables.clear()
+        self.assertIsNotNone(tables.find_table(holidays.US))
+
+        self.assertRaises(ValueError, build_table, holidays.NO, 2000, 2040)